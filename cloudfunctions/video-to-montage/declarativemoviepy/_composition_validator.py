@@ -0,0 +1,1044 @@
+SCHEMA_HASH = "523c5191744526d7f83bbb47059adf8440a8dc7fc43c42c15f607e4012936056"
+# Generated by schema_generator.py with fastjsonschema; do not edit.
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate_https___declarativemoviepy_com_schema_composition_json(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$defs': {'clip': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'clipBase': {'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}}, '$id': 'https://declarativemoviepy.com/schema/composition.json', '$schema': 'https://json-schema.org/draft/2020-12/schema', 'additionalProperties': False, 'properties': {'audio': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'clip': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'fps': {'minimum': 1, 'type': 'number'}, 'output_path': {'type': 'string'}, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}}, 'required': ['output_path', 'clip'], 'title': 'Declarative MoviePy Composition', 'type': 'object'}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['output_path', 'clip']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$defs': {'clip': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'clipBase': {'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}}, '$id': 'https://declarativemoviepy.com/schema/composition.json', '$schema': 'https://json-schema.org/draft/2020-12/schema', 'additionalProperties': False, 'properties': {'audio': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'clip': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'fps': {'minimum': 1, 'type': 'number'}, 'output_path': {'type': 'string'}, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}}, 'required': ['output_path', 'clip'], 'title': 'Declarative MoviePy Composition', 'type': 'object'}, rule='required')
+        data_keys = set(data.keys())
+        if "audio" in data_keys:
+            data_keys.remove("audio")
+            data__audio = data["audio"]
+            validate_https___declarativemoviepy_com_schema_composition_json___defs_clip(data__audio, custom_formats, (name_prefix or "data") + ".audio")
+        if "clip" in data_keys:
+            data_keys.remove("clip")
+            data__clip = data["clip"]
+            validate_https___declarativemoviepy_com_schema_composition_json___defs_clip(data__clip, custom_formats, (name_prefix or "data") + ".clip")
+        if "fps" in data_keys:
+            data_keys.remove("fps")
+            data__fps = data["fps"]
+            if not isinstance(data__fps, (int, float, Decimal)) or isinstance(data__fps, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fps must be number", value=data__fps, name="" + (name_prefix or "data") + ".fps", definition={'minimum': 1, 'type': 'number'}, rule='type')
+            if isinstance(data__fps, (int, float, Decimal)):
+                if data__fps < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".fps must be bigger than or equal to 1", value=data__fps, name="" + (name_prefix or "data") + ".fps", definition={'minimum': 1, 'type': 'number'}, rule='minimum')
+        if "output_path" in data_keys:
+            data_keys.remove("output_path")
+            data__outputpath = data["output_path"]
+            if not isinstance(data__outputpath, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".output_path must be string", value=data__outputpath, name="" + (name_prefix or "data") + ".output_path", definition={'type': 'string'}, rule='type')
+        if "size" in data_keys:
+            data_keys.remove("size")
+            data__size = data["size"]
+            if not isinstance(data__size, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must be array", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='type')
+            data__size_is_list = isinstance(data__size, (list, tuple))
+            if data__size_is_list:
+                data__size_len = len(data__size)
+                if data__size_len < 2:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must contain at least 2 items", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='minItems')
+                if data__size_len > 2:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must contain less than or equal to 2 items", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='maxItems')
+                for data__size_x, data__size_item in enumerate(data__size):
+                    if not isinstance(data__size_item, (int)) and not (isinstance(data__size_item, float) and data__size_item.is_integer()) or isinstance(data__size_item, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + " must be integer", value=data__size_item, name="" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + "", definition={'minimum': 1, 'type': 'integer'}, rule='type')
+                    if isinstance(data__size_item, (int, float, Decimal)):
+                        if data__size_item < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + " must be bigger than or equal to 1", value=data__size_item, name="" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + "", definition={'minimum': 1, 'type': 'integer'}, rule='minimum')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$defs': {'clip': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'clipBase': {'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}}, '$id': 'https://declarativemoviepy.com/schema/composition.json', '$schema': 'https://json-schema.org/draft/2020-12/schema', 'additionalProperties': False, 'properties': {'audio': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'clip': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'fps': {'minimum': 1, 'type': 'number'}, 'output_path': {'type': 'string'}, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}}, 'required': ['output_path', 'clip'], 'title': 'Declarative MoviePy Composition', 'type': 'object'}, rule='additionalProperties')
+    return data
+
+def validate_https___declarativemoviepy_com_schema_composition_json___defs_clip(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, rule='type')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'video'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: video", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'video'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}, rule='type')
+        validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats, (name_prefix or "data") + "")
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['type', 'source']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}, rule='required')
+            data_keys = set(data.keys())
+            if "duration" in data_keys:
+                data_keys.remove("duration")
+                data__duration = data["duration"]
+                pass
+            if "effects" in data_keys:
+                data_keys.remove("effects")
+                data__effects = data["effects"]
+                pass
+            if "position" in data_keys:
+                data_keys.remove("position")
+                data__position = data["position"]
+                pass
+            if "source" in data_keys:
+                data_keys.remove("source")
+                data__source = data["source"]
+                if not isinstance(data__source, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must be string", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'string'}, rule='type')
+            if "start" in data_keys:
+                data_keys.remove("start")
+                data__start = data["start"]
+                pass
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'video'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: video", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'video'}, rule='const')
+            if data_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}, rule='additionalProperties')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'image'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: image", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'image'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}, rule='type')
+        validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats, (name_prefix or "data") + "")
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['type', 'source', 'duration']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}, rule='required')
+            data_keys = set(data.keys())
+            if "duration" in data_keys:
+                data_keys.remove("duration")
+                data__duration = data["duration"]
+                if not isinstance(data__duration, (int, float, Decimal)) or isinstance(data__duration, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be number", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                if isinstance(data__duration, (int, float, Decimal)):
+                    if data__duration < 0:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be bigger than or equal to 0", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+            if "effects" in data_keys:
+                data_keys.remove("effects")
+                data__effects = data["effects"]
+                pass
+            if "position" in data_keys:
+                data_keys.remove("position")
+                data__position = data["position"]
+                pass
+            if "source" in data_keys:
+                data_keys.remove("source")
+                data__source = data["source"]
+                if not isinstance(data__source, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must be string", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'string'}, rule='type')
+            if "start" in data_keys:
+                data_keys.remove("start")
+                data__start = data["start"]
+                pass
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'image'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: image", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'image'}, rule='const')
+            if data_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}, rule='additionalProperties')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'enhanced_image'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: enhanced_image", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'enhanced_image'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}, rule='type')
+        validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats, (name_prefix or "data") + "")
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['type', 'source', 'duration']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}, rule='required')
+            data_keys = set(data.keys())
+            if "duration" in data_keys:
+                data_keys.remove("duration")
+                data__duration = data["duration"]
+                if not isinstance(data__duration, (int, float, Decimal)) or isinstance(data__duration, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be number", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                if isinstance(data__duration, (int, float, Decimal)):
+                    if data__duration < 0:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be bigger than or equal to 0", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+            if "effects" in data_keys:
+                data_keys.remove("effects")
+                data__effects = data["effects"]
+                pass
+            if "position" in data_keys:
+                data_keys.remove("position")
+                data__position = data["position"]
+                pass
+            if "prompt" in data_keys:
+                data_keys.remove("prompt")
+                data__prompt = data["prompt"]
+                if not isinstance(data__prompt, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".prompt must be string", value=data__prompt, name="" + (name_prefix or "data") + ".prompt", definition={'type': 'string'}, rule='type')
+            if "snap_to_keyframe" in data_keys:
+                data_keys.remove("snap_to_keyframe")
+                data__snaptokeyframe = data["snap_to_keyframe"]
+                if not isinstance(data__snaptokeyframe, (bool)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".snap_to_keyframe must be boolean", value=data__snaptokeyframe, name="" + (name_prefix or "data") + ".snap_to_keyframe", definition={'type': 'boolean'}, rule='type')
+            if "source" in data_keys:
+                data_keys.remove("source")
+                data__source = data["source"]
+                if not isinstance(data__source, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must be string", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'string'}, rule='type')
+            if "start" in data_keys:
+                data_keys.remove("start")
+                data__start = data["start"]
+                pass
+            if "target_size" in data_keys:
+                data_keys.remove("target_size")
+                data__targetsize = data["target_size"]
+                if not isinstance(data__targetsize, (list, tuple)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_size must be array", value=data__targetsize, name="" + (name_prefix or "data") + ".target_size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='type')
+                data__targetsize_is_list = isinstance(data__targetsize, (list, tuple))
+                if data__targetsize_is_list:
+                    data__targetsize_len = len(data__targetsize)
+                    if data__targetsize_len < 2:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_size must contain at least 2 items", value=data__targetsize, name="" + (name_prefix or "data") + ".target_size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='minItems')
+                    if data__targetsize_len > 2:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_size must contain less than or equal to 2 items", value=data__targetsize, name="" + (name_prefix or "data") + ".target_size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='maxItems')
+                    for data__targetsize_x, data__targetsize_item in enumerate(data__targetsize):
+                        if not isinstance(data__targetsize_item, (int)) and not (isinstance(data__targetsize_item, float) and data__targetsize_item.is_integer()) or isinstance(data__targetsize_item, bool):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_size[{data__targetsize_x}]".format(**locals()) + " must be integer", value=data__targetsize_item, name="" + (name_prefix or "data") + ".target_size[{data__targetsize_x}]".format(**locals()) + "", definition={'minimum': 1, 'type': 'integer'}, rule='type')
+                        if isinstance(data__targetsize_item, (int, float, Decimal)):
+                            if data__targetsize_item < 1:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_size[{data__targetsize_x}]".format(**locals()) + " must be bigger than or equal to 1", value=data__targetsize_item, name="" + (name_prefix or "data") + ".target_size[{data__targetsize_x}]".format(**locals()) + "", definition={'minimum': 1, 'type': 'integer'}, rule='minimum')
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'enhanced_image'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: enhanced_image", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'enhanced_image'}, rule='const')
+            if data_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}, rule='additionalProperties')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'text'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: text", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'text'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}, rule='type')
+        validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats, (name_prefix or "data") + "")
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['type', 'text', 'duration']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}, rule='required')
+            data_keys = set(data.keys())
+            if "align" in data_keys:
+                data_keys.remove("align")
+                data__align = data["align"]
+                if not isinstance(data__align, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".align must be string", value=data__align, name="" + (name_prefix or "data") + ".align", definition={'enum': ['left', 'center', 'right'], 'type': 'string'}, rule='type')
+                if not (isinstance(data__align, str) and data__align == 'left' or isinstance(data__align, str) and data__align == 'center' or isinstance(data__align, str) and data__align == 'right'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".align must be one of ['left', 'center', 'right']", value=data__align, name="" + (name_prefix or "data") + ".align", definition={'enum': ['left', 'center', 'right'], 'type': 'string'}, rule='enum')
+            if "color" in data_keys:
+                data_keys.remove("color")
+                data__color = data["color"]
+                if not isinstance(data__color, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".color must be string", value=data__color, name="" + (name_prefix or "data") + ".color", definition={'type': 'string'}, rule='type')
+            if "duration" in data_keys:
+                data_keys.remove("duration")
+                data__duration = data["duration"]
+                if not isinstance(data__duration, (int, float, Decimal)) or isinstance(data__duration, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be number", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                if isinstance(data__duration, (int, float, Decimal)):
+                    if data__duration < 0:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be bigger than or equal to 0", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+            if "effects" in data_keys:
+                data_keys.remove("effects")
+                data__effects = data["effects"]
+                pass
+            if "font" in data_keys:
+                data_keys.remove("font")
+                data__font = data["font"]
+                if not isinstance(data__font, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".font must be string", value=data__font, name="" + (name_prefix or "data") + ".font", definition={'type': 'string'}, rule='type')
+            if "font_size" in data_keys:
+                data_keys.remove("font_size")
+                data__fontsize = data["font_size"]
+                if not isinstance(data__fontsize, (int, float, Decimal)) or isinstance(data__fontsize, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".font_size must be number", value=data__fontsize, name="" + (name_prefix or "data") + ".font_size", definition={'minimum': 1, 'type': 'number'}, rule='type')
+                if isinstance(data__fontsize, (int, float, Decimal)):
+                    if data__fontsize < 1:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".font_size must be bigger than or equal to 1", value=data__fontsize, name="" + (name_prefix or "data") + ".font_size", definition={'minimum': 1, 'type': 'number'}, rule='minimum')
+            if "position" in data_keys:
+                data_keys.remove("position")
+                data__position = data["position"]
+                pass
+            if "start" in data_keys:
+                data_keys.remove("start")
+                data__start = data["start"]
+                pass
+            if "text" in data_keys:
+                data_keys.remove("text")
+                data__text = data["text"]
+                if not isinstance(data__text, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".text must be string", value=data__text, name="" + (name_prefix or "data") + ".text", definition={'type': 'string'}, rule='type')
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'text'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: text", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'text'}, rule='const')
+            if "width" in data_keys:
+                data_keys.remove("width")
+                data__width = data["width"]
+                if not isinstance(data__width, (int, float, Decimal)) or isinstance(data__width, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".width must be number", value=data__width, name="" + (name_prefix or "data") + ".width", definition={'minimum': 1, 'type': 'number'}, rule='type')
+                if isinstance(data__width, (int, float, Decimal)):
+                    if data__width < 1:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".width must be bigger than or equal to 1", value=data__width, name="" + (name_prefix or "data") + ".width", definition={'minimum': 1, 'type': 'number'}, rule='minimum')
+            if data_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}, rule='additionalProperties')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'color'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: color", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'color'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}, rule='type')
+        validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats, (name_prefix or "data") + "")
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['type', 'size', 'color', 'duration']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}, rule='required')
+            data_keys = set(data.keys())
+            if "color" in data_keys:
+                data_keys.remove("color")
+                data__color = data["color"]
+                if not isinstance(data__color, (list, tuple)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".color must be array", value=data__color, name="" + (name_prefix or "data") + ".color", definition={'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, rule='type')
+                data__color_is_list = isinstance(data__color, (list, tuple))
+                if data__color_is_list:
+                    data__color_len = len(data__color)
+                    if data__color_len < 3:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".color must contain at least 3 items", value=data__color, name="" + (name_prefix or "data") + ".color", definition={'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, rule='minItems')
+                    if data__color_len > 3:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".color must contain less than or equal to 3 items", value=data__color, name="" + (name_prefix or "data") + ".color", definition={'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, rule='maxItems')
+                    for data__color_x, data__color_item in enumerate(data__color):
+                        if not isinstance(data__color_item, (int)) and not (isinstance(data__color_item, float) and data__color_item.is_integer()) or isinstance(data__color_item, bool):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".color[{data__color_x}]".format(**locals()) + " must be integer", value=data__color_item, name="" + (name_prefix or "data") + ".color[{data__color_x}]".format(**locals()) + "", definition={'maximum': 255, 'minimum': 0, 'type': 'integer'}, rule='type')
+                        if isinstance(data__color_item, (int, float, Decimal)):
+                            if data__color_item < 0:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".color[{data__color_x}]".format(**locals()) + " must be bigger than or equal to 0", value=data__color_item, name="" + (name_prefix or "data") + ".color[{data__color_x}]".format(**locals()) + "", definition={'maximum': 255, 'minimum': 0, 'type': 'integer'}, rule='minimum')
+                            if data__color_item > 255:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".color[{data__color_x}]".format(**locals()) + " must be smaller than or equal to 255", value=data__color_item, name="" + (name_prefix or "data") + ".color[{data__color_x}]".format(**locals()) + "", definition={'maximum': 255, 'minimum': 0, 'type': 'integer'}, rule='maximum')
+            if "duration" in data_keys:
+                data_keys.remove("duration")
+                data__duration = data["duration"]
+                if not isinstance(data__duration, (int, float, Decimal)) or isinstance(data__duration, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be number", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                if isinstance(data__duration, (int, float, Decimal)):
+                    if data__duration < 0:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be bigger than or equal to 0", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+            if "effects" in data_keys:
+                data_keys.remove("effects")
+                data__effects = data["effects"]
+                pass
+            if "position" in data_keys:
+                data_keys.remove("position")
+                data__position = data["position"]
+                pass
+            if "size" in data_keys:
+                data_keys.remove("size")
+                data__size = data["size"]
+                if not isinstance(data__size, (list, tuple)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must be array", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='type')
+                data__size_is_list = isinstance(data__size, (list, tuple))
+                if data__size_is_list:
+                    data__size_len = len(data__size)
+                    if data__size_len < 2:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must contain at least 2 items", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='minItems')
+                    if data__size_len > 2:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must contain less than or equal to 2 items", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='maxItems')
+                    for data__size_x, data__size_item in enumerate(data__size):
+                        if not isinstance(data__size_item, (int)) and not (isinstance(data__size_item, float) and data__size_item.is_integer()) or isinstance(data__size_item, bool):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + " must be integer", value=data__size_item, name="" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + "", definition={'minimum': 1, 'type': 'integer'}, rule='type')
+                        if isinstance(data__size_item, (int, float, Decimal)):
+                            if data__size_item < 1:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + " must be bigger than or equal to 1", value=data__size_item, name="" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + "", definition={'minimum': 1, 'type': 'integer'}, rule='minimum')
+            if "start" in data_keys:
+                data_keys.remove("start")
+                data__start = data["start"]
+                pass
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'color'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: color", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'color'}, rule='const')
+            if data_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}, rule='additionalProperties')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'composite'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: composite", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'composite'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}, rule='type')
+        validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats, (name_prefix or "data") + "")
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['type', 'clips']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}, rule='required')
+            data_keys = set(data.keys())
+            if "clips" in data_keys:
+                data_keys.remove("clips")
+                data__clips = data["clips"]
+                if not isinstance(data__clips, (list, tuple)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".clips must be array", value=data__clips, name="" + (name_prefix or "data") + ".clips", definition={'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, rule='type')
+                data__clips_is_list = isinstance(data__clips, (list, tuple))
+                if data__clips_is_list:
+                    data__clips_len = len(data__clips)
+                    if data__clips_len < 1:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".clips must contain at least 1 items", value=data__clips, name="" + (name_prefix or "data") + ".clips", definition={'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, rule='minItems')
+                    for data__clips_x, data__clips_item in enumerate(data__clips):
+                        validate_https___declarativemoviepy_com_schema_composition_json___defs_clip(data__clips_item, custom_formats, (name_prefix or "data") + ".clips[{data__clips_x}]".format(**locals()))
+            if "concurrent_children" in data_keys:
+                data_keys.remove("concurrent_children")
+                data__concurrentchildren = data["concurrent_children"]
+                if not isinstance(data__concurrentchildren, (bool)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".concurrent_children must be boolean", value=data__concurrentchildren, name="" + (name_prefix or "data") + ".concurrent_children", definition={'type': 'boolean'}, rule='type')
+            if "duration" in data_keys:
+                data_keys.remove("duration")
+                data__duration = data["duration"]
+                pass
+            if "effects" in data_keys:
+                data_keys.remove("effects")
+                data__effects = data["effects"]
+                pass
+            if "position" in data_keys:
+                data_keys.remove("position")
+                data__position = data["position"]
+                pass
+            if "size" in data_keys:
+                data_keys.remove("size")
+                data__size = data["size"]
+                if not isinstance(data__size, (list, tuple)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must be array", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='type')
+                data__size_is_list = isinstance(data__size, (list, tuple))
+                if data__size_is_list:
+                    data__size_len = len(data__size)
+                    if data__size_len < 2:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must contain at least 2 items", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='minItems')
+                    if data__size_len > 2:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".size must contain less than or equal to 2 items", value=data__size, name="" + (name_prefix or "data") + ".size", definition={'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, rule='maxItems')
+                    for data__size_x, data__size_item in enumerate(data__size):
+                        if not isinstance(data__size_item, (int)) and not (isinstance(data__size_item, float) and data__size_item.is_integer()) or isinstance(data__size_item, bool):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + " must be integer", value=data__size_item, name="" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + "", definition={'minimum': 1, 'type': 'integer'}, rule='type')
+                        if isinstance(data__size_item, (int, float, Decimal)):
+                            if data__size_item < 1:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + " must be bigger than or equal to 1", value=data__size_item, name="" + (name_prefix or "data") + ".size[{data__size_x}]".format(**locals()) + "", definition={'minimum': 1, 'type': 'integer'}, rule='minimum')
+            if "start" in data_keys:
+                data_keys.remove("start")
+                data__start = data["start"]
+                pass
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'composite'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: composite", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'composite'}, rule='const')
+            if data_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}, rule='additionalProperties')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'concatenate'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: concatenate", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'concatenate'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}, rule='type')
+        validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats, (name_prefix or "data") + "")
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['type', 'clips']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}, rule='required')
+            data_keys = set(data.keys())
+            if "clips" in data_keys:
+                data_keys.remove("clips")
+                data__clips = data["clips"]
+                if not isinstance(data__clips, (list, tuple)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".clips must be array", value=data__clips, name="" + (name_prefix or "data") + ".clips", definition={'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, rule='type')
+                data__clips_is_list = isinstance(data__clips, (list, tuple))
+                if data__clips_is_list:
+                    data__clips_len = len(data__clips)
+                    if data__clips_len < 1:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".clips must contain at least 1 items", value=data__clips, name="" + (name_prefix or "data") + ".clips", definition={'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, rule='minItems')
+                    for data__clips_x, data__clips_item in enumerate(data__clips):
+                        validate_https___declarativemoviepy_com_schema_composition_json___defs_clip(data__clips_item, custom_formats, (name_prefix or "data") + ".clips[{data__clips_x}]".format(**locals()))
+            if "concurrent_children" in data_keys:
+                data_keys.remove("concurrent_children")
+                data__concurrentchildren = data["concurrent_children"]
+                if not isinstance(data__concurrentchildren, (bool)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".concurrent_children must be boolean", value=data__concurrentchildren, name="" + (name_prefix or "data") + ".concurrent_children", definition={'type': 'boolean'}, rule='type')
+            if "duration" in data_keys:
+                data_keys.remove("duration")
+                data__duration = data["duration"]
+                pass
+            if "effects" in data_keys:
+                data_keys.remove("effects")
+                data__effects = data["effects"]
+                pass
+            if "position" in data_keys:
+                data_keys.remove("position")
+                data__position = data["position"]
+                pass
+            if "start" in data_keys:
+                data_keys.remove("start")
+                data__start = data["start"]
+                pass
+            if "transition" in data_keys:
+                data_keys.remove("transition")
+                data__transition = data["transition"]
+                if not isinstance(data__transition, (dict)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".transition must be object", value=data__transition, name="" + (name_prefix or "data") + ".transition", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='type')
+                data__transition_is_dict = isinstance(data__transition, dict)
+                if data__transition_is_dict:
+                    data__transition__missing_keys = set(['type', 'duration']) - data__transition.keys()
+                    if data__transition__missing_keys:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".transition must contain " + (str(sorted(data__transition__missing_keys)) + " properties"), value=data__transition, name="" + (name_prefix or "data") + ".transition", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='required')
+                    data__transition_keys = set(data__transition.keys())
+                    if "duration" in data__transition_keys:
+                        data__transition_keys.remove("duration")
+                        data__transition__duration = data__transition["duration"]
+                        if not isinstance(data__transition__duration, (int, float, Decimal)) or isinstance(data__transition__duration, bool):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".transition.duration must be number", value=data__transition__duration, name="" + (name_prefix or "data") + ".transition.duration", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                        if isinstance(data__transition__duration, (int, float, Decimal)):
+                            if data__transition__duration < 0:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".transition.duration must be bigger than or equal to 0", value=data__transition__duration, name="" + (name_prefix or "data") + ".transition.duration", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                    if "type" in data__transition_keys:
+                        data__transition_keys.remove("type")
+                        data__transition__type = data__transition["type"]
+                        if not isinstance(data__transition__type, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".transition.type must be string", value=data__transition__type, name="" + (name_prefix or "data") + ".transition.type", definition={'enum': ['crossfade'], 'type': 'string'}, rule='type')
+                        if not (isinstance(data__transition__type, str) and data__transition__type == 'crossfade'):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".transition.type must be one of ['crossfade']", value=data__transition__type, name="" + (name_prefix or "data") + ".transition.type", definition={'enum': ['crossfade'], 'type': 'string'}, rule='enum')
+                    if data__transition_keys:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".transition must not contain "+str(data__transition_keys)+" properties", value=data__transition, name="" + (name_prefix or "data") + ".transition", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='additionalProperties')
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'concatenate'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: concatenate", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'concatenate'}, rule='const')
+            if data_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}, rule='additionalProperties')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'audio'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: audio", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'audio'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}, rule='type')
+        validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats, (name_prefix or "data") + "")
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['type', 'source']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}, rule='required')
+            data_keys = set(data.keys())
+            if "duration" in data_keys:
+                data_keys.remove("duration")
+                data__duration = data["duration"]
+                pass
+            if "effects" in data_keys:
+                data_keys.remove("effects")
+                data__effects = data["effects"]
+                pass
+            if "position" in data_keys:
+                data_keys.remove("position")
+                data__position = data["position"]
+                pass
+            if "source" in data_keys:
+                data_keys.remove("source")
+                data__source = data["source"]
+                if not isinstance(data__source, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must be string", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'string'}, rule='type')
+            if "start" in data_keys:
+                data_keys.remove("start")
+                data__start = data["start"]
+                pass
+            if "type" in data_keys:
+                data_keys.remove("type")
+                data__type = data["type"]
+                if not (isinstance(data__type, str) and data__type == 'audio'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: audio", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'audio'}, rule='const')
+            if data_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}, rule='additionalProperties')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['type']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'clips': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'video'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'video'}}, 'required': ['type', 'source'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'enhanced_image'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'prompt': {'type': 'string'}, 'snap_to_keyframe': {'type': 'boolean'}, 'source': {'type': 'string'}, 'start': True, 'target_size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'type': {'const': 'enhanced_image'}}, 'required': ['type', 'source', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'text'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'align': {'enum': ['left', 'center', 'right'], 'type': 'string'}, 'color': {'type': 'string'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'font': {'type': 'string'}, 'font_size': {'minimum': 1, 'type': 'number'}, 'position': True, 'start': True, 'text': {'type': 'string'}, 'type': {'const': 'text'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type', 'text', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'color'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'color': {'items': {'maximum': 255, 'minimum': 0, 'type': 'integer'}, 'maxItems': 3, 'minItems': 3, 'type': 'array'}, 'duration': {'minimum': 0, 'type': 'number'}, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'color'}}, 'required': ['type', 'size', 'color', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'composite'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'size': {'items': {'minimum': 1, 'type': 'integer'}, 'maxItems': 2, 'minItems': 2, 'type': 'array'}, 'start': True, 'type': {'const': 'composite'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'concatenate'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'clips': {'items': {'$ref': '#/$defs/clip'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'$ref': '#/$defs/clipBase'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, 'minItems': 1, 'type': 'array'}, 'concurrent_children': {'type': 'boolean'}, 'duration': True, 'effects': True, 'position': True, 'start': True, 'transition': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'enum': ['crossfade'], 'type': 'string'}}, 'required': ['type', 'duration'], 'type': 'object'}, 'type': {'const': 'concatenate'}}, 'required': ['type', 'clips'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio'}}}, 'then': {'additionalProperties': False, 'allOf': [{'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}], 'properties': {'duration': True, 'effects': True, 'position': True, 'source': {'type': 'string'}, 'start': True, 'type': {'const': 'audio'}}, 'required': ['type', 'source'], 'type': 'object'}}], 'properties': {'type': {'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}}, 'required': ['type'], 'type': 'object'}, rule='required')
+        data_keys = set(data.keys())
+        if "type" in data_keys:
+            data_keys.remove("type")
+            data__type = data["type"]
+            if not (isinstance(data__type, str) and data__type == 'video' or isinstance(data__type, str) and data__type == 'image' or isinstance(data__type, str) and data__type == 'enhanced_image' or isinstance(data__type, str) and data__type == 'text' or isinstance(data__type, str) and data__type == 'color' or isinstance(data__type, str) and data__type == 'composite' or isinstance(data__type, str) and data__type == 'concatenate' or isinstance(data__type, str) and data__type == 'audio'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be one of ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'enum': ['video', 'image', 'enhanced_image', 'text', 'color', 'composite', 'concatenate', 'audio']}, rule='enum')
+    return data
+
+def validate_https___declarativemoviepy_com_schema_composition_json___defs_clipbase(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'effects': {'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, 'position': {'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, 'start': {'minimum': 0, 'type': 'number'}, 'type': {'type': 'string'}}, 'type': 'object'}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "duration" in data_keys:
+            data_keys.remove("duration")
+            data__duration = data["duration"]
+            if not isinstance(data__duration, (int, float, Decimal)) or isinstance(data__duration, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be number", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='type')
+            if isinstance(data__duration, (int, float, Decimal)):
+                if data__duration < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration must be bigger than or equal to 0", value=data__duration, name="" + (name_prefix or "data") + ".duration", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+        if "effects" in data_keys:
+            data_keys.remove("effects")
+            data__effects = data["effects"]
+            if not isinstance(data__effects, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects must be array", value=data__effects, name="" + (name_prefix or "data") + ".effects", definition={'items': {'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, 'type': 'array'}, rule='type')
+            data__effects_is_list = isinstance(data__effects, (list, tuple))
+            if data__effects_is_list:
+                data__effects_len = len(data__effects)
+                for data__effects_x, data__effects_item in enumerate(data__effects):
+                    if not isinstance(data__effects_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, rule='type')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'fadein'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: fadein", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'fadein'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type', 'duration']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "duration" in data__effects_item_keys:
+                                data__effects_item_keys.remove("duration")
+                                data__effects_item__duration = data__effects_item["duration"]
+                                if not isinstance(data__effects_item__duration, (int, float, Decimal)) or isinstance(data__effects_item__duration, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + " must be number", value=data__effects_item__duration, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__duration, (int, float, Decimal)):
+                                    if data__effects_item__duration < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__duration, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'fadein'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: fadein", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'fadein'}, rule='const')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='additionalProperties')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'fadeout'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: fadeout", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'fadeout'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type', 'duration']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "duration" in data__effects_item_keys:
+                                data__effects_item_keys.remove("duration")
+                                data__effects_item__duration = data__effects_item["duration"]
+                                if not isinstance(data__effects_item__duration, (int, float, Decimal)) or isinstance(data__effects_item__duration, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + " must be number", value=data__effects_item__duration, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__duration, (int, float, Decimal)):
+                                    if data__effects_item__duration < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__duration, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'fadeout'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: fadeout", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'fadeout'}, rule='const')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='additionalProperties')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'speed'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: speed", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'speed'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type', 'factor']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "factor" in data__effects_item_keys:
+                                data__effects_item_keys.remove("factor")
+                                data__effects_item__factor = data__effects_item["factor"]
+                                if not isinstance(data__effects_item__factor, (int, float, Decimal)) or isinstance(data__effects_item__factor, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + " must be number", value=data__effects_item__factor, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__factor, (int, float, Decimal)):
+                                    if data__effects_item__factor < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__factor, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'speed'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: speed", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'speed'}, rule='const')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='additionalProperties')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'multiply_speed'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: multiply_speed", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'multiply_speed'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type', 'factor']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "factor" in data__effects_item_keys:
+                                data__effects_item_keys.remove("factor")
+                                data__effects_item__factor = data__effects_item["factor"]
+                                if not isinstance(data__effects_item__factor, (int, float, Decimal)) or isinstance(data__effects_item__factor, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + " must be number", value=data__effects_item__factor, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__factor, (int, float, Decimal)):
+                                    if data__effects_item__factor < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__factor, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'multiply_speed'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: multiply_speed", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'multiply_speed'}, rule='const')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='additionalProperties')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'multiply_volume'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: multiply_volume", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'multiply_volume'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type', 'factor']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "factor" in data__effects_item_keys:
+                                data__effects_item_keys.remove("factor")
+                                data__effects_item__factor = data__effects_item["factor"]
+                                if not isinstance(data__effects_item__factor, (int, float, Decimal)) or isinstance(data__effects_item__factor, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + " must be number", value=data__effects_item__factor, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__factor, (int, float, Decimal)):
+                                    if data__effects_item__factor < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__factor, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].factor".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'multiply_volume'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: multiply_volume", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'multiply_volume'}, rule='const')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}, rule='additionalProperties')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'audio_fadein'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: audio_fadein", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'audio_fadein'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type', 'duration']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "duration" in data__effects_item_keys:
+                                data__effects_item_keys.remove("duration")
+                                data__effects_item__duration = data__effects_item["duration"]
+                                if not isinstance(data__effects_item__duration, (int, float, Decimal)) or isinstance(data__effects_item__duration, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + " must be number", value=data__effects_item__duration, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__duration, (int, float, Decimal)):
+                                    if data__effects_item__duration < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__duration, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'audio_fadein'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: audio_fadein", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'audio_fadein'}, rule='const')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='additionalProperties')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'audio_fadeout'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: audio_fadeout", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'audio_fadeout'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type', 'duration']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "duration" in data__effects_item_keys:
+                                data__effects_item_keys.remove("duration")
+                                data__effects_item__duration = data__effects_item["duration"]
+                                if not isinstance(data__effects_item__duration, (int, float, Decimal)) or isinstance(data__effects_item__duration, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + " must be number", value=data__effects_item__duration, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__duration, (int, float, Decimal)):
+                                    if data__effects_item__duration < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__duration, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].duration".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'audio_fadeout'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: audio_fadeout", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'audio_fadeout'}, rule='const')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}, rule='additionalProperties')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'subclip'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: subclip", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'subclip'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type', 't_start', 't_end']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "t_end" in data__effects_item_keys:
+                                data__effects_item_keys.remove("t_end")
+                                data__effects_item__tend = data__effects_item["t_end"]
+                                if not isinstance(data__effects_item__tend, (int, float, Decimal)) or isinstance(data__effects_item__tend, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].t_end".format(**locals()) + " must be number", value=data__effects_item__tend, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].t_end".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__tend, (int, float, Decimal)):
+                                    if data__effects_item__tend < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].t_end".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__tend, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].t_end".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "t_start" in data__effects_item_keys:
+                                data__effects_item_keys.remove("t_start")
+                                data__effects_item__tstart = data__effects_item["t_start"]
+                                if not isinstance(data__effects_item__tstart, (int, float, Decimal)) or isinstance(data__effects_item__tstart, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].t_start".format(**locals()) + " must be number", value=data__effects_item__tstart, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].t_start".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__tstart, (int, float, Decimal)):
+                                    if data__effects_item__tstart < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].t_start".format(**locals()) + " must be bigger than or equal to 0", value=data__effects_item__tstart, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].t_start".format(**locals()) + "", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'subclip'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: subclip", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'subclip'}, rule='const')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}, rule='additionalProperties')
+                    try:
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'resize'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: resize", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'resize'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        if not isinstance(data__effects_item, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must be object", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}, rule='type')
+                        data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                        if data__effects_item_is_dict:
+                            data__effects_item__missing_keys = set(['type']) - data__effects_item.keys()
+                            if data__effects_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}, rule='required')
+                            data__effects_item_keys = set(data__effects_item.keys())
+                            if "height" in data__effects_item_keys:
+                                data__effects_item_keys.remove("height")
+                                data__effects_item__height = data__effects_item["height"]
+                                if not isinstance(data__effects_item__height, (int, float, Decimal)) or isinstance(data__effects_item__height, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].height".format(**locals()) + " must be number", value=data__effects_item__height, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].height".format(**locals()) + "", definition={'minimum': 1, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__height, (int, float, Decimal)):
+                                    if data__effects_item__height < 1:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].height".format(**locals()) + " must be bigger than or equal to 1", value=data__effects_item__height, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].height".format(**locals()) + "", definition={'minimum': 1, 'type': 'number'}, rule='minimum')
+                            if "type" in data__effects_item_keys:
+                                data__effects_item_keys.remove("type")
+                                data__effects_item__type = data__effects_item["type"]
+                                if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'resize'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be same as const definition: resize", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'const': 'resize'}, rule='const')
+                            if "width" in data__effects_item_keys:
+                                data__effects_item_keys.remove("width")
+                                data__effects_item__width = data__effects_item["width"]
+                                if not isinstance(data__effects_item__width, (int, float, Decimal)) or isinstance(data__effects_item__width, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].width".format(**locals()) + " must be number", value=data__effects_item__width, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].width".format(**locals()) + "", definition={'minimum': 1, 'type': 'number'}, rule='type')
+                                if isinstance(data__effects_item__width, (int, float, Decimal)):
+                                    if data__effects_item__width < 1:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].width".format(**locals()) + " must be bigger than or equal to 1", value=data__effects_item__width, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].width".format(**locals()) + "", definition={'minimum': 1, 'type': 'number'}, rule='minimum')
+                            if data__effects_item_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must not contain "+str(data__effects_item_keys)+" properties", value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}, rule='additionalProperties')
+                    data__effects_item_is_dict = isinstance(data__effects_item, dict)
+                    if data__effects_item_is_dict:
+                        data__effects_item__missing_keys = set(['type']) - data__effects_item.keys()
+                        if data__effects_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + " must contain " + (str(sorted(data__effects_item__missing_keys)) + " properties"), value=data__effects_item, name="" + (name_prefix or "data") + ".effects[{data__effects_x}]".format(**locals()) + "", definition={'allOf': [{'if': {'properties': {'type': {'const': 'fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_speed'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_speed'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'multiply_volume'}}}, 'then': {'additionalProperties': False, 'properties': {'factor': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'multiply_volume'}}, 'required': ['type', 'factor'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadein'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadein'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'audio_fadeout'}}}, 'then': {'additionalProperties': False, 'properties': {'duration': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'audio_fadeout'}}, 'required': ['type', 'duration'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'subclip'}}}, 'then': {'additionalProperties': False, 'properties': {'t_end': {'minimum': 0, 'type': 'number'}, 't_start': {'minimum': 0, 'type': 'number'}, 'type': {'const': 'subclip'}}, 'required': ['type', 't_start', 't_end'], 'type': 'object'}}, {'if': {'properties': {'type': {'const': 'resize'}}}, 'then': {'additionalProperties': False, 'properties': {'height': {'minimum': 1, 'type': 'number'}, 'type': {'const': 'resize'}, 'width': {'minimum': 1, 'type': 'number'}}, 'required': ['type'], 'type': 'object'}}], 'properties': {'type': {'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}}, 'required': ['type'], 'type': 'object'}, rule='required')
+                        data__effects_item_keys = set(data__effects_item.keys())
+                        if "type" in data__effects_item_keys:
+                            data__effects_item_keys.remove("type")
+                            data__effects_item__type = data__effects_item["type"]
+                            if not (isinstance(data__effects_item__type, str) and data__effects_item__type == 'fadein' or isinstance(data__effects_item__type, str) and data__effects_item__type == 'fadeout' or isinstance(data__effects_item__type, str) and data__effects_item__type == 'speed' or isinstance(data__effects_item__type, str) and data__effects_item__type == 'multiply_speed' or isinstance(data__effects_item__type, str) and data__effects_item__type == 'multiply_volume' or isinstance(data__effects_item__type, str) and data__effects_item__type == 'audio_fadein' or isinstance(data__effects_item__type, str) and data__effects_item__type == 'audio_fadeout' or isinstance(data__effects_item__type, str) and data__effects_item__type == 'subclip' or isinstance(data__effects_item__type, str) and data__effects_item__type == 'resize'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + " must be one of ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']", value=data__effects_item__type, name="" + (name_prefix or "data") + ".effects[{data__effects_x}].type".format(**locals()) + "", definition={'enum': ['fadein', 'fadeout', 'speed', 'multiply_speed', 'multiply_volume', 'audio_fadein', 'audio_fadeout', 'subclip', 'resize']}, rule='enum')
+        if "position" in data_keys:
+            data_keys.remove("position")
+            data__position = data["position"]
+            if not isinstance(data__position, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".position must be array", value=data__position, name="" + (name_prefix or "data") + ".position", definition={'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, rule='type')
+            data__position_is_list = isinstance(data__position, (list, tuple))
+            if data__position_is_list:
+                data__position_len = len(data__position)
+                if data__position_len < 2:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".position must contain at least 2 items", value=data__position, name="" + (name_prefix or "data") + ".position", definition={'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, rule='minItems')
+                if data__position_len > 2:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".position must contain less than or equal to 2 items", value=data__position, name="" + (name_prefix or "data") + ".position", definition={'maxItems': 2, 'minItems': 2, 'prefixItems': [{'anyOf': [{'enum': ['left', 'center', 'right'], 'type': 'string'}, {'type': 'number'}]}, {'anyOf': [{'enum': ['top', 'center', 'bottom'], 'type': 'string'}, {'type': 'number'}]}], 'type': 'array'}, rule='maxItems')
+        if "start" in data_keys:
+            data_keys.remove("start")
+            data__start = data["start"]
+            if not isinstance(data__start, (int, float, Decimal)) or isinstance(data__start, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".start must be number", value=data__start, name="" + (name_prefix or "data") + ".start", definition={'minimum': 0, 'type': 'number'}, rule='type')
+            if isinstance(data__start, (int, float, Decimal)):
+                if data__start < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".start must be bigger than or equal to 0", value=data__start, name="" + (name_prefix or "data") + ".start", definition={'minimum': 0, 'type': 'number'}, rule='minimum')
+        if "type" in data_keys:
+            data_keys.remove("type")
+            data__type = data["type"]
+            if not isinstance(data__type, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be string", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'type': 'string'}, rule='type')
+    return data
+
+validate = validate_https___declarativemoviepy_com_schema_composition_json
@@ -5,12 +5,15 @@ from moviepy.video.VideoClip import (
 )
 from moviepy.video.io.VideoFileClip import VideoFileClip
 from moviepy.audio.io.AudioFileClip import AudioFileClip
-import re
+import io
+import logging
+from typing import Dict, List
 import numpy as np
 from PIL import Image
-from moviepy.tools import convert_to_seconds
 
-from .image_enhancer import enhance_image, numpy_to_pil, ImageEnhancementFailedException
+from .frame_extractor import extract_frame, fit_frame_size, frame_key, resolve_frame_time
+from .gcs_utils import AssetManager, get_image_size, get_video_metadata, is_gcs_path, open_video_file, parse_source
+from .image_enhancer import enhance_image, enhance_images_batch, numpy_to_pil, ImageEnhancementFailedException
 
 
 def _resolve_source(source: str, asset_map: dict) -> str:
@@ -23,88 +26,224 @@ def _resolve_source(source: str, asset_map: dict) -> str:
     return source
 
 
-def build_video_clip(config: dict, asset_map: dict) -> VideoFileClip:
+def _pil_to_np(image: Image.Image) -> np.ndarray:
+    """
+    Converts a PIL image to a contiguous uint8 array with a single copy.
+
+    Images with transparency keep their alpha channel (RGBA); everything
+    else is converted to RGB.
+    """
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    mode = "RGBA" if has_alpha else "RGB"
+    if image.mode != mode:
+        image = image.convert(mode)
+    return np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(image.height, image.width, len(mode))
+
+
+def _video_use_key(config: dict) -> tuple:
+    """
+    Identifies which part of its source a video clip config plays.
+
+    Uses of different parts (e.g. two subclips joined by a crossfade) may play
+    at the same time, so they must not share a reader.
+    """
+    subclips = tuple(
+        (effect.get("t_start", 0), effect.get("t_end"))
+        for effect in config.get("effects", [])
+        if effect.get("type") == "subclip"
+    )
+    return config.get("duration"), subclips
+
+
+def build_video_clip(config: dict, asset_map: dict, asset_manager: AssetManager | None = None) -> VideoFileClip:
     """Builds a moviepy.VideoFileClip from a JSON config."""
     source = _resolve_source(config["source"], asset_map)
-    try:
-        clip = VideoFileClip(source)
-    except (OSError, TypeError) as e:
-        # Handle MoviePy ffmpeg parsing issues with certain video formats
-        if "Error passing `ffmpeg -i` command output" in str(e) or "unsupported operand type(s) for +" in str(e):
-            # Try loading with verbose=False to skip problematic metadata parsing
-            clip = VideoFileClip(source)
-        else:
-            raise
-    if "duration" in config:
-        clip = clip.subclipped(0, config["duration"])
+    # Reuse the reader already opened for this part of the source during this render
+    if asset_manager is not None:
+        clip = asset_manager.get_or_open_video(source, _video_use_key(config))
+    else:
+        clip = open_video_file(source)
+    # Only trim when it actually shortens the clip; subclipping to the full
+    # length would just wrap the reader in another clip
+    duration = config.get("duration")
+    if duration is not None and clip.duration is not None and duration < clip.duration:
+        clip = clip.subclipped(0, duration)
     return clip
 
 
-def build_image_clip(config: dict, asset_map: dict) -> ImageClip:
+def build_image_clip(config: dict, asset_map: dict, asset_manager: AssetManager | None = None) -> ImageClip:
     """Builds a moviepy.ImageClip from a JSON config."""
-    source = _resolve_source(config["source"], asset_map)
     # If duration is not specified, use None to let the clip inherit duration from parent
     duration = config.get("duration")
+
+    # Small GCS images are decoded straight from memory, without a temp file
+    data = asset_manager.get_asset_bytes(config["source"]) if asset_manager else None
+    if data is not None:
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                image_np = _pil_to_np(img)
+        except Exception as e:
+            logging.warning(f"Failed to load image, skipping clip: {config['source']} - {e}")
+            return None
+        if image_np.shape[0] == 0 or image_np.shape[1] == 0:
+            logging.warning(f"Skipping image clip with zero dimensions: {config['source']} (shape: {image_np.shape})")
+            return None
+        return ImageClip(image_np, duration=duration)
+
+    source = _resolve_source(config["source"], asset_map)
     
-    # Validate the image before creating the clip
-    try:
-        # Load the image to check its dimensions
-        img = Image.open(source)
-        if img.width == 0 or img.height == 0:
-            logging.warning(f"Skipping image clip with zero dimensions: {source} ({img.width}x{img.height})")
+    # Validate the image before creating the clip, reusing the dimensions
+    # probed at download time when the asset came from GCS
+    metadata = asset_manager.get_asset_metadata(config["source"]) if asset_manager else None
+    if metadata and "width" in metadata and "height" in metadata:
+        width, height = metadata["width"], metadata["height"]
+    else:
+        try:
+            # Only the header is parsed; pixels are not decoded here
+            width, height = get_image_size(source)
+        except Exception as e:
+            # If we can't load the image, skip this clip
+            logging.warning(f"Failed to load image, skipping clip: {source} - {e}")
             return None
-        img.close()
-    except Exception as e:
-        # If we can't load the image, skip this clip
-        logging.warning(f"Failed to load image, skipping clip: {source} - {e}")
+
+    if width == 0 or height == 0:
+        logging.warning(f"Skipping image clip with zero dimensions: {source} ({width}x{height})")
         return None
     
     return ImageClip(source, duration=duration)
 
 
-def build_enhanced_image_clip(config: dict, asset_map: dict) -> ImageClip:
-    """Builds a moviepy.ImageClip from a JSON config after enhancing it."""
+def _load_enhanced_image_source(
+    config: dict, asset_map: dict, asset_manager: AssetManager | None = None
+) -> Image.Image | None:
+    """Loads the source image of an enhanced_image clip, or None if the clip should be skipped."""
     source = config["source"]
-    prompt = config.get("prompt", "Enhance this image.")
 
     # Video frame reference: path/to/video.mp4@HH:MM:SS.ss
-    match = re.match(r"(.+)@([\d:.]+)", source)
-    if match:
-        video_path, timestamp = match.groups()
+    video_path, frame_time = parse_source(source)
+    if frame_time is not None:
         resolved_video_path = _resolve_source(video_path, asset_map)
 
-        time_in_seconds = convert_to_seconds(timestamp)
-
-        with VideoFileClip(resolved_video_path) as video_clip:
-            # Ensure the timestamp is within bounds
-            if time_in_seconds >= video_clip.duration:
-                time_in_seconds = min(time_in_seconds, video_clip.duration - 0.1)
-            
-            frame = video_clip.get_frame(time_in_seconds)
-            
-            # Validate frame dimensions
-            if frame.shape[0] == 0 or frame.shape[1] == 0:
-                # Return None to skip this clip entirely
-                return None
+        metadata = get_video_metadata(resolved_video_path)
+        # Validate frame dimensions
+        if metadata["width"] == 0 or metadata["height"] == 0:
+            # Return None to skip this clip entirely
+            return None
+
+        time_in_seconds = resolve_frame_time(
+            resolved_video_path, frame_time, config.get("snap_to_keyframe", False)
+        )
+
+        # Let ffmpeg downscale while decoding instead of resizing in Python
+        size = fit_frame_size(metadata["width"], metadata["height"], config.get("target_size"))
+        scale = size != (metadata["width"], metadata["height"])
+
+        # Use the frame batch-extracted up front when available
+        frame = None
+        if asset_manager is not None:
+            frame = asset_manager.video_frames.get(frame_key(resolved_video_path, time_in_seconds, size))
+        if frame is None:
+            frame = extract_frame(resolved_video_path, time_in_seconds, size[0], size[1], scale)
+        if frame is None:
+            return None
                 
-        source_image = numpy_to_pil(frame)
-    else:
-        # For other types, we assume it's a path that Image.open can handle
-        # after resolving GCS paths.
-        resolved_source = _resolve_source(source, asset_map)
-        source_image = Image.open(resolved_source)
+        return numpy_to_pil(frame)
+
+    # For other types, we assume it's a path that Image.open can handle
+    # after resolving GCS paths.
+    data = asset_manager.get_asset_bytes(source) if asset_manager else None
+    if data is not None:
+        return Image.open(io.BytesIO(data))
+    resolved_source = _resolve_source(source, asset_map)
+    return Image.open(resolved_source)
+
+
+def _find_enhanced_image_configs(composition: dict) -> List[dict]:
+    """Finds all enhanced_image clip configs with a non-empty prompt."""
+    configs = []
+    stack = [composition]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if obj.get("type") == "enhanced_image" and isinstance(obj.get("source"), str):
+                prompt = obj.get("prompt", "Enhance this image.")
+                if prompt and prompt.strip():
+                    configs.append(obj)
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return configs
+
+
+def prefetch_enhanced_images(
+    composition: dict,
+    asset_map: dict,
+    asset_manager: AssetManager | None = None,
+    gcs_sources: bool = True,
+) -> Dict[int, Image.Image | None]:
+    """
+    Enhances the enhanced_image clips of the composition up front, in parallel.
+
+    Each enhancement is a slow, network-bound model request, so they are all
+    issued at once instead of one by one as the clip tree is built. Clips whose
+    source cannot be loaded here are left to build_enhanced_image_clip.
+
+    gcs_sources selects the clips whose source lives on GCS (True) or locally
+    (False). Local sources can be enhanced while GCS assets are still downloading.
+
+    Returns:
+        A dict mapping id(clip_config) to the enhanced image, or None if the
+        enhancement failed and the clip should be skipped.
+    """
+    configs, pairs = [], []
+    for config in _find_enhanced_image_configs(composition):
+        if is_gcs_path(parse_source(config["source"])[0]) != gcs_sources:
+            continue
+        try:
+            source_image = _load_enhanced_image_source(config, asset_map, asset_manager)
+        except Exception as e:
+            logging.warning(f"Could not load enhanced image source {config['source']}: {e}")
+            continue
+        if source_image is not None:
+            configs.append(config)
+            pairs.append((source_image, config.get("prompt", "Enhance this image.")))
+    if not pairs:
+        return {}
+
+    logging.info(f"Enhancing {len(pairs)} images in parallel")
+    enhanced_images = enhance_images_batch(pairs)
+    return {id(config): image for config, image in zip(configs, enhanced_images)}
+
+
+def build_enhanced_image_clip(config: dict, asset_map: dict, asset_manager: AssetManager | None = None) -> ImageClip:
+    """Builds a moviepy.ImageClip from a JSON config after enhancing it."""
+    source = config["source"]
+    prompt = config.get("prompt", "Enhance this image.")
 
     # Skip enhancement if prompt is empty or whitespace-only
     if prompt and prompt.strip():
-        try:
-            enhanced_image = enhance_image(source_image, prompt)
-            enhanced_image_np = np.array(enhanced_image)
-        except ImageEnhancementFailedException:
-            # Skip this clip entirely when enhancement fails
-            return None
+        if asset_manager is not None and id(config) in asset_manager.enhanced_images:
+            # Enhanced up front by prefetch_enhanced_images
+            enhanced_image = asset_manager.enhanced_images[id(config)]
+            if enhanced_image is None:
+                return None
+            enhanced_image_np = _pil_to_np(enhanced_image)
+        else:
+            source_image = _load_enhanced_image_source(config, asset_map, asset_manager)
+            if source_image is None:
+                return None
+            try:
+                enhanced_image = enhance_image(source_image, prompt)
+                enhanced_image_np = _pil_to_np(enhanced_image)
+            except ImageEnhancementFailedException:
+                # Skip this clip entirely when enhancement fails
+                return None
     else:
         # Use original image when prompt is empty
-        enhanced_image_np = np.array(source_image)
+        source_image = _load_enhanced_image_source(config, asset_map, asset_manager)
+        if source_image is None:
+            return None
+        enhanced_image_np = _pil_to_np(source_image)
 
     # Validate the final image array dimensions before creating the clip
     if enhanced_image_np.size == 0 or enhanced_image_np.shape[0] == 0 or enhanced_image_np.shape[1] == 0:
@@ -160,12 +299,16 @@ def build_color_clip(config: dict) -> ColorClip:
     )
 
 
-def build_audio_clip(config: dict, asset_map: dict) -> AudioFileClip:
+def build_audio_clip(config: dict, asset_map: dict, asset_manager: AssetManager | None = None) -> AudioFileClip:
     """Builds a moviepy.AudioFileClip from a JSON config."""
     source = _resolve_source(config["source"], asset_map)
-    audio = AudioFileClip(source)
+    if asset_manager is not None:
+        audio = asset_manager.get_or_open_audio(source)
+    else:
+        audio = AudioFileClip(source)
     
-    if "duration" in config:
-        audio = audio.subclipped(0, config["duration"])
+    duration = config.get("duration")
+    if duration is not None and audio.duration is not None and duration < audio.duration:
+        audio = audio.subclipped(0, duration)
     
     return audio
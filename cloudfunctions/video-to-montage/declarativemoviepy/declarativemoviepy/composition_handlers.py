@@ -1,4 +1,5 @@
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 import numpy as np
 
 from moviepy.Clip import Clip
@@ -9,14 +10,45 @@ from moviepy.video.compositing.CompositeVideoClip import (
    concatenate_videoclips,
 )
 
+from .gcs_utils import AssetManager
+
+# Upper bound on children built at once by a single composite/concatenate clip
+MAX_CHILD_WORKERS = 8
+
+
+def _build_child_clips(
+    config: dict,
+    asset_map: dict,
+    interpreter_func: Callable[..., Clip],
+    asset_manager: Optional[AssetManager] = None,
+) -> List[Optional[Clip]]:
+    """
+    Builds the child clips of a composition clip, in config order.
+
+    Children are built in a thread pool unless "concurrent_children" is false,
+    so that I/O-bound children (image enhancement requests, frame extraction,
+    opening video files) overlap. None entries mark skipped children.
+    """
+    clip_configs = config["clips"]
+    if not config.get("concurrent_children", True) or len(clip_configs) < 2:
+        return [interpreter_func(c, asset_map, asset_manager) for c in clip_configs]
+    with ThreadPoolExecutor(max_workers=min(MAX_CHILD_WORKERS, len(clip_configs))) as executor:
+        return list(executor.map(lambda c: interpreter_func(c, asset_map, asset_manager), clip_configs))
+
 
 def build_composite_clip(
-    config: dict, asset_map: dict, interpreter_func: Callable[[dict, dict], Clip]
+    config: dict,
+    asset_map: dict,
+    interpreter_func: Callable[..., Clip],
+    asset_manager: Optional[AssetManager] = None,
 ) -> CompositeVideoClip:
     """Builds a moviepy.CompositeVideoClip from a JSON config."""
     child_clips = []
-    for c_config in config["clips"]:
-        child_clip = interpreter_func(c_config, asset_map)
+    # Track the auto-size and auto-duration while building the children
+    first_size = None
+    max_duration = None
+    built_clips = _build_child_clips(config, asset_map, interpreter_func, asset_manager)
+    for c_config, child_clip in zip(config["clips"], built_clips):
         # Skip None clips (failed enhanced images)
         if child_clip is None:
             continue
@@ -26,35 +58,39 @@ def build_composite_clip(
             child_clip = child_clip.with_position(tuple(c_config["position"]))
         child_clips.append(child_clip)
 
+        if first_size is None and hasattr(child_clip, 'size'):
+            first_size = child_clip.size
+        if child_clip.duration is not None and (max_duration is None or child_clip.duration > max_duration):
+            max_duration = child_clip.duration
+
     # Determine composite size
     size = None
     if "size" in config:
         size = tuple(config["size"])
-    else:
+    elif first_size is not None:
         # Auto-determine size from the first clip (usually background)
-        if child_clips and hasattr(child_clips[0], 'size'):
-            size = child_clips[0].size
-            print(f"Auto-determined composite size from first clip: {size}")
+        size = first_size
+        print(f"Auto-determined composite size from first clip: {size}")
     
     composite = CompositeVideoClip(child_clips, size=size)
 
     if "duration" in config:
         composite = composite.with_duration(config["duration"])
-    else:
-        # Try to determine duration from child clips that have duration
-        durations = [clip.duration for clip in child_clips if clip.duration is not None]
-        if durations:
-            # Use the maximum duration from clips that have duration set
-            composite = composite.with_duration(max(durations))
+    elif max_duration is not None:
+        # Use the maximum duration from clips that have duration set
+        composite = composite.with_duration(max_duration)
 
     return composite
 
 
 def build_concatenate_clip(
-   config: dict, asset_map: dict, interpreter_func: Callable[[dict, dict], Clip]
+   config: dict,
+   asset_map: dict,
+   interpreter_func: Callable[..., Clip],
+   asset_manager: Optional[AssetManager] = None,
 ) -> VideoClip:
     """Builds a concatenated moviepy.VideoClip from a JSON config."""
-    child_clips = [interpreter_func(c, asset_map) for c in config["clips"]]
+    child_clips = _build_child_clips(config, asset_map, interpreter_func, asset_manager)
     # Filter out None clips (failed enhanced images)
     child_clips = [clip for clip in child_clips if clip is not None]
 
@@ -68,19 +104,25 @@ def build_concatenate_clip(
         td = transition_config["duration"]
         composite_clips = []
         current_time = 0
+        last_index = len(child_clips) - 1
         for i, clip in enumerate(child_clips):
             effects = []
             # Add CrossFadeOut to all clips except the last
-            if i < len(child_clips) - 1:
+            if i < last_index:
                 effects.append(vfx.CrossFadeOut(td))
             # Add CrossFadeIn to all clips except the first
             if i > 0:
                 effects.append(vfx.CrossFadeIn(td))
             if effects:
                 clip = clip.with_effects(effects)
-            composite_clips.append(clip.with_start(current_time))
+            clip = clip.with_start(current_time)
+            # Fix masks created by CrossFade effects to have precomputed attribute
+            mask = getattr(clip, 'mask', None)
+            if mask is not None and not hasattr(mask, 'precomputed'):
+                mask.precomputed = {}
+            composite_clips.append(clip)
             # Calculate next start time with overlap for crossfade
-            if i < len(child_clips) - 1:
+            if i < last_index:
                 current_time += clip.duration - td
             else:
                 current_time += clip.duration
@@ -91,11 +133,6 @@ def build_concatenate_clip(
         concatenated = CompositeVideoClip(
             composite_clips, size=size, bg_color=None
         )
-        # Fix masks created by CrossFade effects to have precomputed attribute
-        for clip in composite_clips:
-            if hasattr(clip, 'mask') and clip.mask is not None:
-                if not hasattr(clip.mask, 'precomputed'):
-                    clip.mask.precomputed = {}
     else:
         concatenated = concatenate_videoclips(child_clips)
 
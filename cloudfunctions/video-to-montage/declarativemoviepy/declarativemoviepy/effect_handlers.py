@@ -42,14 +42,14 @@ def apply_effects(clip: Clip, effects_config: list) -> Clip:
         A moviepy.Clip.Clip object with the effects applied.
     """
     effects: list[Effect] = []
+    get_effect_class = EFFECT_MAP.get
     for effect_config in effects_config:
-        config = effect_config.copy()
-        effect_type = config.pop("type")
+        effect_type = effect_config["type"]
         
         # Handle subclip specially since it's a method, not an effect
         if effect_type == "subclip":
-            t_start = config.get("t_start", 0)
-            t_end = config.get("t_end", None)
+            t_start = effect_config.get("t_start", 0)
+            t_end = effect_config.get("t_end", None)
             
             # Validate and clamp t_end to clip duration to prevent errors
             if t_end is not None and hasattr(clip, 'duration') and clip.duration is not None:
@@ -60,13 +60,13 @@ def apply_effects(clip: Clip, effects_config: list) -> Clip:
             clip = clip.subclipped(t_start, t_end)
             continue
             
-        effect_class = EFFECT_MAP.get(effect_type)
+        effect_class = get_effect_class(effect_type)
 
         if not effect_class:
             raise ValueError(f"Unknown effect type '{effect_type}'")
 
         # The rest of the config are parameters for the effect
-        effects.append(effect_class(**config))
+        effects.append(effect_class(**{k: v for k, v in effect_config.items() if k != "type"}))
 
     if not effects:
         return clip
@@ -0,0 +1,276 @@
+import logging
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+from moviepy.config import FFMPEG_BINARY
+
+try:
+    import av
+except ImportError:  # PyAV is optional; frames are extracted with ffmpeg processes without it
+    av = None
+
+from .gcs_utils import get_video_keyframes, get_video_metadata, is_gcs_path, parse_source, snap_to_keyframe
+
+# Prefetched frames are keyed by (local video path, time rounded to the ms, output size)
+FrameKey = Tuple[str, float, Tuple[int, int]]
+
+# Timestamp of each frame reported by the showinfo filter
+_PTS_TIME_RE = re.compile(r"pts_time:\s*([-\d.]+)")
+
+
+def frame_key(video_path: str, time_in_seconds: float, size: Tuple[int, int]) -> FrameKey:
+    """Builds the lookup key for a prefetched frame."""
+    return (video_path, round(time_in_seconds, 3), tuple(size))
+
+
+def fit_frame_size(width: int, height: int, target_size: List[int] | None = None) -> Tuple[int, int]:
+    """
+    Returns the size a frame is extracted at.
+
+    Without target_size this is the native size. Otherwise the frame is scaled
+    down (never up) to fit within target_size, keeping the aspect ratio and
+    rounding to even dimensions as ffmpeg scalers prefer.
+    """
+    if not target_size:
+        return width, height
+    scale = min(target_size[0] / width, target_size[1] / height)
+    if scale >= 1.0:
+        return width, height
+    return max(2, int(width * scale) // 2 * 2), max(2, int(height * scale) // 2 * 2)
+
+
+def resolve_frame_time(video_path: str, time_in_seconds: float, snap: bool = False) -> float:
+    """
+    Converts a frame reference time into the time that will be extracted.
+
+    The time is clamped to the video duration and, if requested, snapped down
+    to the preceding keyframe.
+    """
+    duration = get_video_metadata(video_path)["duration"]
+    # Ensure the timestamp is within bounds
+    if duration and time_in_seconds >= duration:
+        time_in_seconds = min(time_in_seconds, duration - 0.1)
+    # Seeking straight to a keyframe skips decoding the rest of the GOP
+    if snap:
+        time_in_seconds = snap_to_keyframe(get_video_keyframes(video_path), time_in_seconds)
+    return time_in_seconds
+
+
+def _decode_frames_with_pyav(
+    video_path: str, times: List[float], width: int, height: int, scale: bool = False
+) -> Dict[float, np.ndarray]:
+    """
+    Decodes the frames at the given sorted times in-process with PyAV.
+
+    Seeks once to the keyframe before the first time and decodes forward,
+    taking the first frame at or after each time, as ffmpeg -ss does. This
+    avoids a process start and container parse per call, and lets the decoder
+    use its own threads. Rotated videos are left to ffmpeg, which applies the
+    display matrix. Times that could not be decoded are missing from the result.
+    """
+    frames: Dict[float, np.ndarray] = {}
+    try:
+        with av.open(video_path) as container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            # ffmpeg -ss is relative to the stream start, frame.time is not
+            start_offset = float(stream.start_time * stream.time_base) if stream.start_time else 0.0
+            container.seek(int((times[0] + start_offset) / stream.time_base), stream=stream)
+            pending = list(times)
+            for frame in container.decode(stream):
+                if frame.rotation:
+                    return {}
+                if frame.time is None:
+                    continue
+                frame_time = frame.time - start_offset
+                while pending and frame_time >= pending[0] - 1e-3:
+                    if scale:
+                        # Bicubic, like ffmpeg's scale filter
+                        frames[pending.pop(0)] = frame.to_ndarray(
+                            width=width, height=height, format="rgb24", interpolation="BICUBIC"
+                        )
+                    else:
+                        frames[pending.pop(0)] = frame.to_ndarray(format="rgb24")
+                if not pending:
+                    break
+    except Exception as e:
+        logging.warning(f"PyAV could not decode frames from {video_path}, using ffmpeg: {e}")
+    return frames
+
+
+def extract_frame(
+    video_path: str, time_in_seconds: float, width: int, height: int, scale: bool = False
+) -> np.ndarray | None:
+    """
+    Extracts a single RGB frame, in-process with PyAV when installed, otherwise
+    with one ffmpeg call.
+
+    Passing -ss before -i lets ffmpeg seek to the nearest keyframe and decode
+    only up to the requested time, instead of spinning up a full VideoFileClip
+    reader. width/height are the output frame size: the displayed (rotated)
+    size, or the downscaled size when scale is True, in which case ffmpeg
+    resizes the frame before it is piped back.
+    """
+    if av is not None:
+        frame = _decode_frames_with_pyav(video_path, [time_in_seconds], width, height, scale).get(time_in_seconds)
+        if frame is not None:
+            return frame
+
+    cmd = [
+        FFMPEG_BINARY, "-v", "error",
+        "-ss", f"{time_in_seconds:.3f}", "-i", video_path,
+        "-frames:v", "1", "-an", "-sn",
+        *(["-vf", f"scale={width}:{height}"] if scale else []),
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True)
+    frame_size = width * height * 3
+    if result.returncode != 0 or len(result.stdout) < frame_size:
+        logging.warning(f"ffmpeg could not extract frame at {time_in_seconds}s from {video_path}: {result.stderr.decode(errors='replace').strip()}")
+        return None
+    return np.frombuffer(result.stdout[:frame_size], dtype=np.uint8).reshape(height, width, 3)
+
+
+def _extract_frames_in_range(
+    video_path: str, times: List[float], width: int, height: int, scale: bool = False
+) -> Dict[float, np.ndarray]:
+    """
+    Extracts several frames from one GOP range with a single seek.
+
+    PyAV decodes the range in-process when installed. Otherwise ffmpeg seeks
+    once to the first time and a select filter emits the first frame at or
+    after each requested offset. showinfo reports the timestamp of every
+    emitted frame so each requested time can be mapped back to its frame.
+    Times that cannot be matched fall back to single-frame extraction.
+    """
+    if len(times) == 1:
+        frame = extract_frame(video_path, times[0], width, height, scale)
+        return {times[0]: frame} if frame is not None else {}
+
+    if av is not None:
+        frames = _decode_frames_with_pyav(video_path, times, width, height, scale)
+        if len(frames) == len(times):
+            return frames
+
+    start = times[0]
+    offsets = [round(t - start, 3) for t in times]
+    select_expr = "+".join(
+        f"gte(t,{o})*(isnan(prev_selected_t)+lt(prev_selected_t,{o}))" for o in offsets
+    )
+    cmd = [
+        FFMPEG_BINARY, "-hide_banner", "-nostats", "-loglevel", "info",
+        "-ss", f"{start:.3f}", "-t", f"{offsets[-1] + 1.0:.3f}", "-i", video_path,
+        "-an", "-sn",
+        "-vf", f"select='gt({select_expr},0)',showinfo" + (f",scale={width}:{height}" if scale else ""),
+        "-fps_mode", "passthrough",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True)
+
+    frames: Dict[float, np.ndarray] = {}
+    frame_size = width * height * 3
+    stderr = result.stderr.decode(errors="replace")
+    pts_times = [
+        float(m.group(1))
+        for line in stderr.splitlines() if "showinfo" in line
+        for m in [_PTS_TIME_RE.search(line)] if m
+    ]
+    if result.returncode == 0 and len(result.stdout) == frame_size * len(pts_times):
+        decoded = np.frombuffer(result.stdout, dtype=np.uint8).reshape(len(pts_times), height, width, 3)
+        for t, offset in zip(times, offsets):
+            for i, pts in enumerate(pts_times):
+                if pts >= offset - 1e-3:
+                    frames[t] = decoded[i]
+                    break
+    else:
+        logging.warning(f"Batch frame extraction failed for {video_path}, extracting frames one by one")
+
+    for t in times:
+        if t not in frames:
+            frame = extract_frame(video_path, t, width, height, scale)
+            if frame is not None:
+                frames[t] = frame
+    return frames
+
+
+def _group_times_by_gop(times: List[float], keyframes: np.ndarray) -> List[List[float]]:
+    """Groups sorted times so that each group lies within a single GOP."""
+    if keyframes.size == 0:
+        # Without a keyframe index we cannot tell which times share a GOP
+        return [[t] for t in times]
+    gop_indices = np.searchsorted(keyframes, times, side="right")
+    groups: Dict[int, List[float]] = {}
+    for t, gop in zip(times, gop_indices):
+        groups.setdefault(int(gop), []).append(t)
+    return list(groups.values())
+
+
+def _find_frame_refs(composition: dict) -> List[dict]:
+    """Finds all enhanced_image clip configs that reference a video frame."""
+    refs = []
+    stack = [composition]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            source = obj.get("source")
+            if obj.get("type") == "enhanced_image" and isinstance(source, str) and parse_source(source)[1] is not None:
+                refs.append(obj)
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return refs
+
+
+def prefetch_video_frames(composition: dict, asset_map: dict) -> Dict[FrameKey, np.ndarray]:
+    """
+    Extracts every video frame referenced by the composition up front.
+
+    Frame references are grouped by source video and then by GOP, using the
+    cached keyframe index. Each GOP range is decoded by its own ffmpeg process
+    and all ranges run in parallel. Frames that cannot be resolved here are
+    left for build_enhanced_image_clip to extract on demand.
+
+    Returns:
+        A dict mapping frame_key(local_path, time, size) to an RGB numpy array.
+    """
+    times_by_video: Dict[Tuple[str, Tuple[int, int]], set] = {}
+    for clip_config in _find_frame_refs(composition):
+        video_path, frame_time = parse_source(clip_config["source"])
+        local_path = asset_map.get(video_path) if is_gcs_path(video_path) else video_path
+        if not local_path or not os.path.exists(local_path):
+            continue
+        try:
+            time_in_seconds = resolve_frame_time(local_path, frame_time, clip_config.get("snap_to_keyframe", False))
+            metadata = get_video_metadata(local_path)
+        except Exception as e:
+            logging.warning(f"Could not resolve frame reference {clip_config['source']}: {e}")
+            continue
+        if metadata["width"] == 0 or metadata["height"] == 0:
+            continue
+        size = fit_frame_size(metadata["width"], metadata["height"], clip_config.get("target_size"))
+        times_by_video.setdefault((local_path, size), set()).add(round(time_in_seconds, 3))
+
+    jobs = []
+    for (local_path, size), times in times_by_video.items():
+        metadata = get_video_metadata(local_path)
+        scale = size != (metadata["width"], metadata["height"])
+        for group in _group_times_by_gop(sorted(times), get_video_keyframes(local_path)):
+            jobs.append((local_path, group, size[0], size[1], scale))
+    if not jobs:
+        return {}
+
+    logging.info(f"Prefetching {sum(len(job[1]) for job in jobs)} video frames in {len(jobs)} ffmpeg jobs")
+    frames: Dict[FrameKey, np.ndarray] = {}
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 4)) as executor:
+        futures = [(job, executor.submit(_extract_frames_in_range, *job)) for job in jobs]
+        for (local_path, _, width, height, _), future in futures:
+            try:
+                for t, frame in future.result().items():
+                    frames[frame_key(local_path, t, (width, height))] = frame
+            except Exception as e:
+                logging.warning(f"Failed to prefetch frames from {local_path}: {e}")
+    return frames
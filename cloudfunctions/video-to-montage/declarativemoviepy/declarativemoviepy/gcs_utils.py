@@ -1,24 +1,90 @@
+import functools
+import io
+import json
 import os
 import shutil
+import subprocess
 import tempfile
 import logging
 import re
-from typing import Dict, Any, List, Tuple, Optional
+import struct
+import threading
+from fractions import Fraction
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Hashable, List, Tuple, Optional
 
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 from google.auth import default
+import requests
+from moviepy.audio.io.AudioFileClip import AudioFileClip
+from moviepy.tools import convert_to_seconds
 from moviepy.video.io.VideoFileClip import VideoFileClip
+import numpy as np
 from PIL import Image
 
+try:
+    import av
+except ImportError:  # PyAV is optional; ffprobe/moviepy are used without it
+    av = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# ffprobe is not bundled with imageio-ffmpeg, so it is only used when installed
+FFPROBE_BINARY = os.environ.get("FFPROBE_BINARY") or shutil.which("ffprobe")
+
+# Video frame references: path/to/video.mp4@HH:MM:SS.ss
+FRAME_REF_RE = re.compile(r"(.+)@([\d:.]+)")
+
+# Objects larger than this are downloaded as concurrent byte-range slices
+SLICED_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+SLICED_DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+SLICED_DOWNLOAD_MAX_WORKERS = 8
+
+# Composition assets downloaded concurrently
+DOWNLOAD_MAX_WORKERS = 32
+# Pooled HTTPS connections on the shared client: one per download worker, plus
+# the slices of one large object, so parallel downloads reuse connections
+STORAGE_HTTP_POOL_SIZE = DOWNLOAD_MAX_WORKERS + SLICED_DOWNLOAD_MAX_WORKERS
+
+# Small images are kept in memory instead of being written to disk and re-read
+IN_MEMORY_MAX_BYTES = 4 * 1024 * 1024
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')
+
+# MP4 headers are located with ranged reads instead of downloading the whole video
+MP4_HEAD_BYTES = 1024 * 1024
+MP4_RANGE_BYTES = 4 * 1024 * 1024
+MP4_MAX_MOOV_BYTES = 64 * 1024 * 1024
+
 
 def is_gcs_path(path: str) -> bool:
     """Checks if a given path is a GCS URI."""
     return path.startswith("gs://")
 
 
+@functools.lru_cache(maxsize=1024)
+def parse_source(source: str) -> Tuple[str, Optional[float]]:
+    """
+    Splits a source into its base path and, for video frame references, the frame time.
+
+    Sources are parsed once and cached, since the same reference is looked up
+    during asset discovery, downloading, frame prefetching and clip building.
+
+    Returns:
+        (base, time_in_seconds) for path/to/video.mp4@HH:MM:SS.ss, otherwise (source, None).
+    """
+    match = FRAME_REF_RE.match(source)
+    if match:
+        base, timestamp = match.groups()
+        try:
+            return base, float(convert_to_seconds(timestamp))
+        except ValueError:
+            logging.warning(f"Ignoring malformed frame timestamp in source: {source}")
+    return source, None
+
+
 def parse_gcs_uri(uri: str) -> Tuple[str, str]:
     """Parses a GCS URI into bucket and blob path."""
     if not is_gcs_path(uri):
@@ -29,31 +95,14 @@ def parse_gcs_uri(uri: str) -> Tuple[str, str]:
     return bucket, blob_path
 
 
-def download_gcs_file(gcs_uri: str, local_dir: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _get_storage_client() -> storage.Client:
     """
-    Downloads a file from GCS to a specified local directory.
+    Returns a process-wide storage client, honoring GCP_SERVICE_ACCOUNT_PATH.
     
-    Args:
-        gcs_uri: The full GCS URI (e.g., "gs://bucket/path/to/file.txt").
-        local_dir: The local directory to download the file into.
-
-    Returns:
-        The full local path to the downloaded file.
+    Credential resolution is slow, so the client is built once and reused. Its
+    HTTP session pools enough connections for the parallel asset downloads.
     """
-    if not is_gcs_path(gcs_uri):
-        raise ValueError(f"Not a GCS URI: {gcs_uri}")
-    
-    # Handle video frame references: path/to/video.mp4@HH:MM:SS
-    # For downloading, we need to strip the timestamp suffix
-    base_gcs_uri = gcs_uri
-    match = re.match(r"(.+)@([\d:.]+)", gcs_uri)
-    if match:
-        base_gcs_uri = match.group(1)
-    
-    bucket_name, blob_path = parse_gcs_uri(base_gcs_uri)
-    if not blob_path:
-        raise ValueError(f"GCS URI does not point to a file: {base_gcs_uri}")
-
     try:
         # Check for custom service account path first
         service_account_path = os.environ.get('GCP_SERVICE_ACCOUNT_PATH')
@@ -66,24 +115,88 @@ def download_gcs_file(gcs_uri: str, local_dir: str) -> str:
         # Fall back to default client initialization
         logging.warning(f"Could not load credentials, trying default client: {e}")
         client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    blob = bucket.blob(blob_path)
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=STORAGE_HTTP_POOL_SIZE, pool_maxsize=STORAGE_HTTP_POOL_SIZE, max_retries=3
+    )
+    client._http.mount("https://", adapter)
+    return client
+
+
+@functools.lru_cache(maxsize=64)
+def _get_bucket(bucket_name: str) -> storage.Bucket:
+    """Returns a cached bucket handle bound to the shared client."""
+    return _get_storage_client().bucket(bucket_name)
+
+
+def _get_gcs_blob(gcs_uri: str) -> Tuple[storage.Blob, str]:
+    """
+    Looks up the blob behind a GCS URI, ignoring any frame reference suffix.
+
+    Returns:
+        The blob (with its size populated) and the base GCS URI.
+    """
+    if not is_gcs_path(gcs_uri):
+        raise ValueError(f"Not a GCS URI: {gcs_uri}")
+    
+    # Handle video frame references: path/to/video.mp4@HH:MM:SS
+    # For downloading, we need to strip the timestamp suffix
+    base_gcs_uri, _ = parse_source(gcs_uri)
+    
+    bucket_name, blob_path = parse_gcs_uri(base_gcs_uri)
+    if not blob_path:
+        raise ValueError(f"GCS URI does not point to a file: {base_gcs_uri}")
 
-    if not blob.exists(client):
+    # get_blob fetches size and existence in a single metadata request
+    blob = _get_bucket(bucket_name).get_blob(blob_path)
+    if blob is None:
         raise FileNotFoundError(f"GCS object not found: {base_gcs_uri}")
+    return blob, base_gcs_uri
+
 
+def _download_blob_to_file(blob: storage.Blob, base_gcs_uri: str, local_dir: str) -> str:
+    """Downloads an already looked-up blob into local_dir and returns the local path."""
     # Create the local directory if it doesn't exist
     os.makedirs(local_dir, exist_ok=True)
     
     # Construct local path
-    local_filename = os.path.basename(blob_path)
+    local_filename = os.path.basename(blob.name)
     local_path = os.path.join(local_dir, local_filename)
 
-    blob.download_to_filename(local_path)
+    try:
+        if blob.size and blob.size > SLICED_DOWNLOAD_THRESHOLD:
+            # Large videos: saturate bandwidth with several parallel range requests.
+            # Threads are used since this may already run inside a worker thread.
+            transfer_manager.download_chunks_concurrently(
+                blob,
+                local_path,
+                chunk_size=SLICED_DOWNLOAD_CHUNK_SIZE,
+                max_workers=SLICED_DOWNLOAD_MAX_WORKERS,
+                worker_type=transfer_manager.THREAD,
+            )
+        else:
+            blob.download_to_filename(local_path)
+    except NotFound as e:
+        # The object was deleted after its metadata was fetched
+        raise FileNotFoundError(f"GCS object not found: {base_gcs_uri}") from e
     logging.info(f"Downloaded {base_gcs_uri} to {local_path}")
     return local_path
 
 
+def download_gcs_file(gcs_uri: str, local_dir: str) -> str:
+    """
+    Downloads a file from GCS to a specified local directory.
+    
+    Args:
+        gcs_uri: The full GCS URI (e.g., "gs://bucket/path/to/file.txt").
+        local_dir: The local directory to download the file into.
+
+    Returns:
+        The full local path to the downloaded file.
+    """
+    blob, base_gcs_uri = _get_gcs_blob(gcs_uri)
+    return _download_blob_to_file(blob, base_gcs_uri, local_dir)
+
+
 def upload_local_file_to_gcs(local_path: str, gcs_uri: str):
     """
     Uploads a local file to a GCS URI.
@@ -96,31 +209,148 @@ def upload_local_file_to_gcs(local_path: str, gcs_uri: str):
         raise ValueError(f"Not a GCS URI for destination: {gcs_uri}")
 
     bucket_name, blob_path = parse_gcs_uri(gcs_uri)
-    try:
-        # Check for custom service account path first
-        service_account_path = os.environ.get('GCP_SERVICE_ACCOUNT_PATH')
-        if service_account_path and os.path.exists(service_account_path):
-            client = storage.Client.from_service_account_json(service_account_path)
-        else:
-            credentials, project = default()
-            client = storage.Client(credentials=credentials, project=project)
-    except Exception as e:
-        # Fall back to default client initialization
-        logging.warning(f"Could not load credentials, trying default client: {e}")
-        client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    blob = bucket.blob(blob_path)
+    blob = _get_bucket(bucket_name).blob(blob_path)
     blob.upload_from_filename(local_path)
     logging.info(f"Uploaded {local_path} to {gcs_uri}")
 
 
+def upload_many_local_files_to_gcs(pairs: List[Tuple[str, str]], max_workers: int = 8):
+    """
+    Uploads several local files to GCS in parallel.
+
+    Args:
+        pairs: A list of (local_path, gcs_uri) tuples.
+        max_workers: The number of concurrent uploads.
+    """
+    file_blob_pairs = []
+    for local_path, gcs_uri in pairs:
+        if not is_gcs_path(gcs_uri):
+            raise ValueError(f"Not a GCS URI for destination: {gcs_uri}")
+        bucket_name, blob_path = parse_gcs_uri(gcs_uri)
+        file_blob_pairs.append((local_path, _get_bucket(bucket_name).blob(blob_path)))
+    if not file_blob_pairs:
+        return
+
+    # Threads share the cached client; uploads are network-bound anyway
+    transfer_manager.upload_many(
+        file_blob_pairs,
+        max_workers=max_workers,
+        worker_type=transfer_manager.THREAD,
+        raise_exception=True,
+    )
+    for local_path, gcs_uri in pairs:
+        logging.info(f"Uploaded {local_path} to {gcs_uri}")
+
+
+def _parse_frame_rate(rate: str) -> float:
+    """Evaluates an ffprobe frame rate fraction such as '30000/1001'."""
+    try:
+        return float(Fraction(rate))
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _parse_ffprobe_metadata(output: bytes) -> Dict[str, Any]:
+    """Reads duration, displayed size and frame rate from ffprobe's JSON output."""
+    probe = json.loads(output)
+    streams = probe.get("streams") or [{}]
+    stream = streams[0]
+
+    width = int(stream.get("width") or 0)
+    height = int(stream.get("height") or 0)
+    # Match moviepy, which reports the displayed (rotated) size
+    rotation = stream.get("tags", {}).get("rotate")
+    for side_data in stream.get("side_data_list", []):
+        rotation = side_data.get("rotation", rotation)
+    if rotation is not None and abs(int(float(rotation))) % 180 == 90:
+        width, height = height, width
+
+    duration = probe.get("format", {}).get("duration") or stream.get("duration")
+    return {
+        "duration": float(duration) if duration else 0,
+        "width": width,
+        "height": height,
+        "fps": _parse_frame_rate(stream.get("r_frame_rate", "0/0")) or 24,
+    }
+
+
+def _run_ffprobe(source: str, data: bytes | None = None) -> Dict[str, Any]:
+    """Reads container and stream headers with a single ffprobe call, from a path or from stdin."""
+    result = subprocess.run(
+        [FFPROBE_BINARY, "-v", "quiet", "-print_format", "json",
+         "-show_streams", "-show_format", "-select_streams", "v:0", source],
+        input=data, capture_output=True, check=True,
+    )
+    return _parse_ffprobe_metadata(result.stdout)
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_video_with_ffprobe(video_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Reads container and stream headers with a single ffprobe call.
+    
+    Cached per (path, mtime) so repeated frame references into the same
+    video do not re-parse the container.
+    """
+    return _run_ffprobe(video_path)
+
+
+def _read_pyav_metadata(source: str | io.BytesIO) -> Dict[str, Any]:
+    """
+    Reads container and stream headers in-process with PyAV.
+    
+    Reports the same values as ffprobe without spawning a process. The display
+    rotation is only exposed on decoded frames, so the first frame is decoded
+    to detect it.
+    """
+    with av.open(source) as container:
+        stream = container.streams.video[0]
+        if container.duration is not None:
+            duration = container.duration / av.time_base
+        elif stream.duration is not None:
+            duration = float(stream.duration * stream.time_base)
+        else:
+            duration = 0
+        width, height = stream.width or 0, stream.height or 0
+        # Match moviepy, which reports the displayed (rotated) size
+        frame = next(container.decode(stream), None)
+        if frame is not None and abs(int(frame.rotation)) % 180 == 90:
+            width, height = height, width
+        fps = float(stream.base_rate) if stream.base_rate else 0
+    return {
+        "duration": duration,
+        "width": width,
+        "height": height,
+        "fps": fps or 24,
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_video_with_pyav(video_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Reads video headers with PyAV, cached per (path, mtime) like _probe_video_with_ffprobe."""
+    return _read_pyav_metadata(video_path)
+
+
 def get_video_metadata(video_path: str) -> Dict[str, Any]:
     """
     Extracts metadata from a video file.
     
+    Uses PyAV or ffprobe directly when available, which avoids the cost of
+    opening a full VideoFileClip reader just to read the headers.
+    
     Returns:
         Dict containing duration, width, height, fps
     """
+    if av is not None:
+        try:
+            return _probe_video_with_pyav(video_path, os.stat(video_path).st_mtime_ns)
+        except Exception as e:
+            logging.warning(f"PyAV probe failed for {video_path}, falling back: {e}")
+    if FFPROBE_BINARY:
+        try:
+            return _probe_video_with_ffprobe(video_path, os.stat(video_path).st_mtime_ns)
+        except Exception as e:
+            logging.warning(f"ffprobe failed for {video_path}, falling back to moviepy: {e}")
     try:
         with VideoFileClip(video_path) as clip:
             return {
@@ -134,19 +364,231 @@ def get_video_metadata(video_path: str) -> Dict[str, Any]:
         return {"duration": 0, "width": 0, "height": 0, "fps": 24}
 
 
-def get_image_metadata(image_path: str) -> Dict[str, Any]:
+def _iter_mp4_boxes(data: memoryview):
+    """Yields (type, payload) for each box directly contained in data."""
+    offset = 0
+    while offset + 8 <= len(data):
+        size, box_type = struct.unpack_from(">I4s", data, offset)
+        header = 8
+        if size == 1:
+            size = struct.unpack_from(">Q", data, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = len(data) - offset
+        if size < header:
+            raise ValueError(f"Malformed MP4 box {box_type!r} at offset {offset}")
+        yield box_type, data[offset + header:offset + size]
+        offset += size
+
+
+def _find_mp4_box(data: memoryview, *path: bytes) -> Optional[memoryview]:
+    """Returns the payload of the box at the given path of box types, or None."""
+    for box_type in path:
+        data = next((payload for t, payload in _iter_mp4_boxes(data) if t == box_type), None)
+        if data is None:
+            return None
+    return data
+
+
+def _read_mp4_moov(blob: storage.Blob) -> memoryview:
+    """
+    Fetches the moov box of an MP4/MOV blob with ranged reads.
+
+    The top-level boxes are walked by their headers alone, so the media data
+    is skipped whether moov sits at the start (faststart) or at the end.
+    """
+    size = blob.size
+    chunks = [(0, blob.download_as_bytes(start=0, end=min(size, MP4_HEAD_BYTES) - 1))]
+
+    def read(start: int, length: int) -> bytes:
+        for chunk_start, chunk in chunks:
+            if chunk_start <= start and start + length <= chunk_start + len(chunk):
+                return chunk[start - chunk_start:start + length - chunk_start]
+        end = min(size, start + max(length, MP4_RANGE_BYTES))
+        chunk = blob.download_as_bytes(start=start, end=end - 1)
+        chunks.append((start, chunk))
+        if len(chunk) < length:
+            raise ValueError(f"Truncated MP4 box at offset {start}")
+        return chunk[:length]
+
+    offset = 0
+    while offset + 8 <= size:
+        box_size, box_type = struct.unpack(">I4s", read(offset, 8))
+        header = 8
+        if box_size == 1:
+            box_size = struct.unpack(">Q", read(offset + 8, 8))[0]
+            header = 16
+        elif box_size == 0:
+            box_size = size - offset
+        if box_size < header:
+            raise ValueError(f"Malformed MP4 box {box_type!r} at offset {offset}")
+        if box_type == b"moov":
+            if box_size > MP4_MAX_MOOV_BYTES:
+                raise ValueError(f"MP4 moov box too large to probe remotely ({box_size} bytes)")
+            return memoryview(read(offset + header, box_size - header))
+        offset += box_size
+    raise ValueError("No moov box found")
+
+
+def _parse_mp4_moov(moov: memoryview) -> Dict[str, Any]:
+    """Reads duration, displayed size and frame rate of the first video track from a moov box."""
+    mvhd = _find_mp4_box(moov, b"mvhd")
+    if mvhd is None:
+        raise ValueError("No mvhd box found")
+    if mvhd[0] == 1:
+        timescale, duration = struct.unpack_from(">IQ", mvhd, 20)
+    else:
+        timescale, duration = struct.unpack_from(">II", mvhd, 12)
+    if not timescale or not duration:
+        # Fragmented MP4s carry their duration in the fragments
+        raise ValueError("MP4 has no movie duration")
+
+    for box_type, trak in _iter_mp4_boxes(moov):
+        if box_type != b"trak":
+            continue
+        hdlr = _find_mp4_box(trak, b"mdia", b"hdlr")
+        if hdlr is None or bytes(hdlr[8:12]) != b"vide":
+            continue
+
+        stsd = _find_mp4_box(trak, b"mdia", b"minf", b"stbl", b"stsd")
+        width, height = struct.unpack_from(">HH", stsd, 40)
+        # Match moviepy, which reports the displayed (rotated) size
+        tkhd = _find_mp4_box(trak, b"tkhd")
+        matrix_offset = 52 if tkhd[0] == 1 else 40
+        a, b = struct.unpack_from(">ii", tkhd, matrix_offset)
+        if a == 0 and b != 0:
+            width, height = height, width
+
+        # The most common sample delta gives the base frame rate, like ffprobe's r_frame_rate
+        mdhd = _find_mp4_box(trak, b"mdia", b"mdhd")
+        media_timescale = struct.unpack_from(">I", mdhd, 20 if mdhd[0] == 1 else 12)[0]
+        stts = _find_mp4_box(trak, b"mdia", b"minf", b"stbl", b"stts")
+        entry_count = struct.unpack_from(">I", stts, 4)[0]
+        entries = struct.iter_unpack(">II", stts[8:8 + 8 * entry_count])
+        _, delta = max(entries, default=(0, 0))
+        fps = media_timescale / delta if delta else 0
+
+        return {
+            "duration": duration / timescale,
+            "width": width,
+            "height": height,
+            "fps": fps or 24,
+        }
+    raise ValueError("No video track found")
+
+
+def get_gcs_video_metadata(gcs_uri: str) -> Dict[str, Any]:
+    """
+    Extracts metadata from an MP4/MOV video on GCS without downloading it.
+
+    Only the container headers are fetched, with a few ranged reads.
+
+    Returns:
+        Dict containing duration, width, height, fps
+
+    Raises:
+        ValueError: If the headers cannot be located or parsed; callers should
+            then fall back to downloading the file and using get_video_metadata.
+    """
+    blob, _ = _get_gcs_blob(gcs_uri)
+    try:
+        return _parse_mp4_moov(_read_mp4_moov(blob))
+    except (struct.error, TypeError) as e:
+        raise ValueError(f"Failed to parse MP4 headers: {e}") from e
+
+
+def get_video_metadata_from_bytes(data: bytes) -> Dict[str, Any]:
+    """
+    Extracts metadata from a complete video file held in memory, without writing it to disk.
+    
+    Uses PyAV when available, otherwise pipes the bytes into ffprobe.
+    
+    Returns:
+        Dict containing duration, width, height, fps
+    
+    Raises:
+        RuntimeError: If neither PyAV nor ffprobe is available.
+    """
+    if av is not None:
+        return _read_pyav_metadata(io.BytesIO(data))
+    if FFPROBE_BINARY:
+        return _run_ffprobe("pipe:0", data)
+    raise RuntimeError("Probing in-memory videos requires PyAV or ffprobe")
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_keyframes(video_path: str, mtime_ns: int) -> np.ndarray:
+    """Lists keyframe timestamps by decoding only the keyframes of the first video stream."""
+    result = subprocess.run(
+        [FFPROBE_BINARY, "-v", "quiet", "-print_format", "json",
+         "-select_streams", "v:0", "-skip_frame", "nokey",
+         "-show_entries", "frame=pts_time", video_path],
+        capture_output=True, check=True,
+    )
+    frames = json.loads(result.stdout).get("frames", [])
+    times = sorted(float(f["pts_time"]) for f in frames if "pts_time" in f)
+    return np.array(times, dtype=np.float64)
+
+
+def get_video_keyframes(video_path: str) -> np.ndarray:
+    """
+    Returns the sorted keyframe timestamps (in seconds) of a video.
+    
+    Returns an empty array when ffprobe is unavailable or probing fails,
+    in which case snapping becomes a no-op.
+    """
+    if not FFPROBE_BINARY:
+        return np.empty(0, dtype=np.float64)
+    try:
+        return _probe_keyframes(video_path, os.stat(video_path).st_mtime_ns)
+    except Exception as e:
+        logging.warning(f"Failed to probe keyframes for {video_path}: {e}")
+        return np.empty(0, dtype=np.float64)
+
+
+def snap_to_keyframe(keyframes: np.ndarray, time_in_seconds: float) -> float:
+    """Snaps a timestamp down to the closest preceding keyframe, if any."""
+    idx = int(np.searchsorted(keyframes, time_in_seconds, side="right")) - 1
+    if idx < 0:
+        return time_in_seconds
+    return float(keyframes[idx])
+
+
+def open_video_file(video_path: str) -> VideoFileClip:
+    """Opens a VideoFileClip, retrying once on known moviepy ffmpeg parsing issues."""
+    try:
+        return VideoFileClip(video_path)
+    except (OSError, TypeError) as e:
+        # Handle MoviePy ffmpeg parsing issues with certain video formats
+        if "Error passing `ffmpeg -i` command output" in str(e) or "unsupported operand type(s) for +" in str(e):
+            return VideoFileClip(video_path)
+        raise
+
+
+def get_image_size(image_path: str | io.BytesIO) -> Tuple[int, int]:
+    """
+    Returns (width, height) of an image from its header alone.
+
+    The context manager closes the file even if parsing fails, and the pixel
+    data is never decoded.
+    """
+    with Image.open(image_path) as img:
+        return img.size
+
+
+def get_image_metadata(image_path: str | io.BytesIO) -> Dict[str, Any]:
     """
-    Extracts metadata from an image file.
+    Extracts metadata from an image file or an in-memory image.
     
     Returns:
         Dict containing width, height
     """
     try:
-        with Image.open(image_path) as img:
-            return {
-                "width": img.width,
-                "height": img.height,
-            }
+        width, height = get_image_size(image_path)
+        return {
+            "width": width,
+            "height": height,
+        }
     except Exception as e:
         logging.warning(f"Failed to extract image metadata from {image_path}: {e}")
         return {"width": 0, "height": 0}
@@ -159,83 +601,179 @@ class AssetManager:
     It finds all "source" keys in a dictionary, downloads the GCS URIs,
     and provides a mapping to their local paths.
     """
-    def __init__(self, composition: Dict[str, Any]):
+    def __init__(self, composition: Dict[str, Any], temp_dir: Optional[str] = None):
         self.composition = composition
-        self.temp_dir = tempfile.mkdtemp(prefix="declarativemoviepy_assets_")
+        # Created under temp_dir when given, e.g. a per-request directory of the caller
+        self.temp_dir = tempfile.mkdtemp(prefix="declarativemoviepy_assets_", dir=temp_dir)
         self.local_asset_map: Dict[str, str] = {}
         self.asset_metadata: Dict[str, Dict[str, Any]] = {}
+        # Small images held in memory instead of local_asset_map, keyed by GCS URI
+        self.in_memory_assets: Dict[str, bytes] = {}
+        self._frame_ref_uris: set = set()
+        # Frames extracted up front, keyed by frame_extractor.frame_key
+        self.video_frames: Dict[Tuple[str, float, Tuple[int, int]], np.ndarray] = {}
+        # Images enhanced up front, keyed by id() of their clip config (None = failed)
+        self.enhanced_images: Dict[int, Optional[Image.Image]] = {}
+        # Opened file clips, keyed by (local path, "video" | "audio", use key). Values
+        # are futures so a source is opened outside the lock, and only once.
+        self._clip_cache: Dict[Tuple[str, str, Hashable], Future] = {}
+        self._clip_lock = threading.Lock()
         self._download_assets()
 
     def _find_asset_uris(self) -> List[str]:
-        """Recursively finds all 'source' URIs in the composition."""
-        uris = []
-        
-        def recurse(obj):
+        """Finds all 'source' URIs in the composition with an iterative scan."""
+        uris = set()
+        stack = [self.composition]
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, dict):
                 for key, value in obj.items():
                     if key == "source" and isinstance(value, str) and is_gcs_path(value):
                         # Handle video frame references: path/to/video.mp4@HH:MM:SS
-                        match = re.match(r"(.+)@([\d:.]+)", value)
-                        if match:
-                            # Extract just the base video path for downloading
-                            base_uri = match.groups()[0]
-                            uris.append(base_uri)
-                        else:
-                            uris.append(value)
+                        # Only the base video path is downloaded
+                        base_uri, frame_time = parse_source(value)
+                        uris.add(base_uri)
+                        if frame_time is not None:
+                            self._frame_ref_uris.add(base_uri)
                     else:
-                        recurse(value)
+                        stack.append(value)
             elif isinstance(obj, list):
-                for item in obj:
-                    recurse(item)
+                stack.extend(obj)
 
-        recurse(self.composition)
-        return sorted(list(set(uris))) # Return unique, sorted URIs for deterministic order
+        return sorted(uris) # Return unique, sorted URIs for deterministic order
+
+    def _download_asset(self, uri: str, local_dir: str) -> Tuple[str | bytes, Dict[str, Any]]:
+        """
+        Downloads a single asset into local_dir and probes its metadata. Runs in a worker thread.
+
+        Small images are returned as bytes rather than written to disk.
+        """
+        blob, base_uri = _get_gcs_blob(uri)
+        if blob.size is not None and blob.size <= IN_MEMORY_MAX_BYTES and blob.name.lower().endswith(IMAGE_EXTENSIONS):
+            data = blob.download_as_bytes()
+            logging.info(f"Downloaded {base_uri} into memory ({len(data)} bytes)")
+            return data, {"type": "image", **get_image_metadata(io.BytesIO(data))}
+
+        local_path = _download_blob_to_file(blob, base_uri, local_dir)
+        
+        # Extract metadata based on file extension
+        if local_path.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.webm')):
+            metadata = {"type": "video", **get_video_metadata(local_path)}
+            # Index keyframes up front for videos that frames are pulled from
+            if uri in self._frame_ref_uris:
+                metadata["keyframes"] = get_video_keyframes(local_path)
+        elif local_path.lower().endswith(IMAGE_EXTENSIONS):
+            metadata = {"type": "image", **get_image_metadata(local_path)}
+        else:
+            metadata = {"type": "unknown"}
+        return local_path, metadata
 
     def _download_assets(self):
-        """Downloads all found GCS assets to the temporary directory."""
+        """Downloads all found GCS assets to the temporary directory in parallel."""
         asset_uris = self._find_asset_uris()
-        if asset_uris:
-            logging.info(f"Found {len(asset_uris)} GCS assets to download.")
-        for uri in asset_uris:
-            try:
-                local_path = download_gcs_file(uri, self.temp_dir)
-                self.local_asset_map[uri] = local_path
-                
-                # Extract metadata based on file extension
-                if local_path.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.webm')):
-                    metadata = get_video_metadata(local_path)
-                    self.asset_metadata[uri] = {"type": "video", **metadata}
-                elif local_path.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')):
-                    metadata = get_image_metadata(local_path)
-                    self.asset_metadata[uri] = {"type": "image", **metadata}
-                else:
-                    self.asset_metadata[uri] = {"type": "unknown"}
-                    
-                logging.info(f"Asset {uri} metadata: {self.asset_metadata[uri]}")
-            except Exception as e:
-                logging.error(f"Failed to download asset {uri}: {e}")
-                # For robustness, we log and continue. A caller can check the map.
+        if not asset_uris:
+            return
+        logging.info(f"Found {len(asset_uris)} GCS assets to download.")
+        
+        # Downloads are network-bound, so threads overlap the round trips
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_MAX_WORKERS, len(asset_uris))) as executor:
+            # Each asset gets its own subdirectory, so assets with the same file
+            # name in different buckets/folders are never written to one path
+            futures = {
+                executor.submit(self._download_asset, uri, os.path.join(self.temp_dir, f"asset_{i}")): uri
+                for i, uri in enumerate(asset_uris)
+            }
+            for future in as_completed(futures):
+                uri = futures[future]
+                try:
+                    local_asset, metadata = future.result()
+                    # Results are collected on this thread, so no locking is needed
+                    if isinstance(local_asset, bytes):
+                        self.in_memory_assets[uri] = local_asset
+                    else:
+                        self.local_asset_map[uri] = local_asset
+                    self.asset_metadata[uri] = metadata
+                    summary = {k: v for k, v in metadata.items() if k != "keyframes"}
+                    logging.info(f"Asset {uri} metadata: {summary}")
+                except Exception as e:
+                    logging.error(f"Failed to download asset {uri}: {e}")
+                    # For robustness, we log and continue. A caller can check the map.
                 
     def get_local_path(self, gcs_uri: str) -> str | None:
         """Returns the local path for a given GCS URI if it was downloaded."""
         # Handle video frame references by looking up the base video path
-        match = re.match(r"(.+)@([\d:.]+)", gcs_uri)
-        if match:
-            base_uri = match.groups()[0]
-            return self.local_asset_map.get(base_uri)
-        return self.local_asset_map.get(gcs_uri)
+        return self.local_asset_map.get(parse_source(gcs_uri)[0])
     
     def get_asset_metadata(self, gcs_uri: str) -> Optional[Dict[str, Any]]:
         """Returns metadata for a given GCS URI if it was downloaded."""
         # Handle video frame references by looking up the base video path
-        match = re.match(r"(.+)@([\d:.]+)", gcs_uri)
-        if match:
-            base_uri = match.groups()[0]
-            return self.asset_metadata.get(base_uri)
-        return self.asset_metadata.get(gcs_uri)
+        return self.asset_metadata.get(parse_source(gcs_uri)[0])
+
+    def get_asset_bytes(self, gcs_uri: str) -> bytes | None:
+        """Returns the contents of a GCS asset that was downloaded into memory."""
+        return self.in_memory_assets.get(gcs_uri)
+
+    def snap_to_keyframe(self, gcs_uri: str, time_in_seconds: float) -> float:
+        """Snaps a timestamp in the given video down to its preceding keyframe."""
+        metadata = self.get_asset_metadata(gcs_uri) or {}
+        keyframes = metadata.get("keyframes")
+        if keyframes is None:
+            local_path = self.get_local_path(gcs_uri)
+            if local_path is None:
+                return time_in_seconds
+            keyframes = get_video_keyframes(local_path)
+        return snap_to_keyframe(keyframes, time_in_seconds)
+
+    def _get_or_open_clip(self, path: str, kind: str, use_key: Hashable, opener):
+        key = (path, kind, use_key)
+        with self._clip_lock:
+            future = self._clip_cache.get(key)
+            is_opener = future is None
+            if is_opener:
+                future = Future()
+                self._clip_cache[key] = future
+        if is_opener:
+            # Opened without the lock held, so different sources open concurrently;
+            # other users of this key wait on the future instead
+            try:
+                future.set_result(opener(path))
+            except BaseException as e:
+                with self._clip_lock:
+                    self._clip_cache.pop(key, None)
+                future.set_exception(e)
+        return future.result()
+
+    def get_or_open_video(self, path: str, use_key: Hashable = None) -> VideoFileClip:
+        """
+        Returns a VideoFileClip for path, opening it only once per render and use key.
+        
+        Callers derive their own clips with subclipped()/with_*(), which share
+        the reader instead of spawning a new ffmpeg process. A reader must not be
+        shared by uses that play at the same time (e.g. a crossfade between two
+        subclips of one source): it would re-seek, restarting ffmpeg, on every
+        frame. Callers pass a use_key that tells such uses apart, such as the
+        subclip interval.
+        """
+        return self._get_or_open_clip(path, "video", use_key, open_video_file)
+
+    def get_or_open_audio(self, path: str) -> AudioFileClip:
+        """Returns an AudioFileClip for path, opening it only once per render."""
+        return self._get_or_open_clip(path, "audio", None, AudioFileClip)
 
     def cleanup(self):
-        """Removes the temporary directory and all downloaded assets."""
+        """Closes cached clips and removes the temporary directory and all downloaded assets."""
+        self.video_frames.clear()
+        self.enhanced_images.clear()
+        self.in_memory_assets.clear()
+        with self._clip_lock:
+            for future in self._clip_cache.values():
+                if not future.done() or future.exception() is not None:
+                    continue
+                try:
+                    future.result().close()
+                except Exception as e:
+                    logging.warning(f"Failed to close cached clip: {e}")
+            self._clip_cache.clear()
         if os.path.exists(self.temp_dir):
             shutil.rmtree(self.temp_dir)
             logging.info(f"Cleaned up temporary asset directory: {self.temp_dir}")
@@ -3,89 +3,277 @@ from io import BytesIO
 import numpy as np
 import logging
 import hashlib
+import json
 import os
-import pickle
+import random
+import tempfile
 from pathlib import Path
 import base64
 import requests
 import time
+import urllib3
+import functools
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import google.auth
 import google.auth.transport.requests
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used without it
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; responses are parsed in full without it
+    ijson = None
+
+# Maximum number of enhancement requests in flight at once
+ENHANCE_MAX_WORKERS = 8
+
+# Number of bytes of an error response body included in error messages
+ERROR_BODY_PREVIEW_BYTES = 512
+
+# Upper bound on the wait between enhancement attempts, in seconds
+MAX_RETRY_DELAY = 30
+
+# Decoded enhanced images kept in memory, in front of the disk cache
+MEMORY_CACHE_SIZE = 64
+_memory_cache: OrderedDict[str, Image.Image] = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+# Cache keys of source images already hashed in this process, keyed by
+# (id(image), prompt). Entries hold a weak reference to the image, so an id
+# reused by a later object is never mistaken for it, and are dropped when
+# the image is garbage collected. Only single dict operations are used on it,
+# which are atomic, so it takes no lock: its entries are removed from weakref
+# callbacks, which can run during garbage collection on a thread that already
+# holds _memory_cache_lock.
+_source_cache_keys: Dict[Tuple[int, str], Tuple[weakref.ref, str]] = {}
+
 class ImageEnhancementFailedException(Exception):
     """Raised when image enhancement fails and the clip should be skipped."""
     pass
 
+@functools.lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """Returns a shared HTTP session so connections (and TLS) are reused across requests."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=ENHANCE_MAX_WORKERS)
+    session.mount("https://", adapter)
+    session.headers["Content-Type"] = "application/json; charset=utf-8"
+    return session
+
+@functools.lru_cache(maxsize=1)
+def _get_credentials() -> google.auth.credentials.Credentials:
+    """Resolves the default credentials once per process."""
+    credentials, _ = google.auth.default(scopes=['https://www.googleapis.com/auth/cloud-platform'])
+    return credentials
+
+@functools.lru_cache(maxsize=1)
+def _get_auth_request() -> google.auth.transport.requests.Request:
+    """Returns the transport used for token refreshes, so they reuse one connection pool."""
+    return google.auth.transport.requests.Request()
+
+_credentials_lock = threading.Lock()
+
+def _get_authorized_session() -> requests.Session:
+    """
+    Returns the shared HTTP session with a valid bearer token set.
+
+    The token is refreshed only when missing or expired, and the Authorization
+    header is updated only then, so most calls skip both the round trip to the
+    token endpoint and rebuilding request headers. The lock keeps concurrent
+    enhancements from refreshing at once.
+    """
+    credentials = _get_credentials()
+    session = _get_http_session()
+    with _credentials_lock:
+        if credentials.token is None or credentials.expired:
+            credentials.refresh(_get_auth_request())
+            session.headers["Authorization"] = f"Bearer {credentials.token}"
+    return session
+
+@functools.lru_cache(maxsize=1)
 def _get_cache_dir() -> Path:
-    """Get or create the cache directory for enhanced images."""
+    """Get or create the cache directory for enhanced images (resolved once per process)."""
     cache_dir = Path.home() / ".declarativemoviepy" / "enhanced_images_cache"
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir
 
 def _resize_to_max_1080_png(image: Image.Image) -> Image.Image:
-    """Resizes image to max 1080px on the longest side."""
+    """
+    Resizes image to max 1080px on the longest side.
+
+    resize() with a reducing_gap pre-reduces by an integer factor before the
+    final BICUBIC pass, which is much faster than a plain LANCZOS resize and
+    indistinguishable at this size. It returns a new image, so the caller's
+    image is never modified.
+    """
     max_size = 1080
     if image.width > max_size or image.height > max_size:
-        if image.width > image.height:
-            new_width = max_size
-            new_height = int(max_size * image.height / image.width)
-        else:
-            new_height = max_size
-            new_width = int(max_size * image.width / image.height)
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        scale = max_size / max(image.width, image.height)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.Resampling.BICUBIC, reducing_gap=2.0)
     return image
 
-def _get_image_hash(image: Image.Image) -> str:
-    """Generate a hash for the image content."""
-    # Convert image to bytes for hashing
-    img_bytes = BytesIO()
-    image.save(img_bytes, format='PNG')
-    img_bytes.seek(0)
-    return hashlib.md5(img_bytes.getvalue()).hexdigest()
-
 def _get_cache_key(image: Image.Image, prompt: str) -> str:
     """Generate a cache key from image content and prompt."""
-    image_hash = _get_image_hash(image)
-    prompt_hash = hashlib.md5(prompt.encode('utf-8')).hexdigest()
-    return f"{image_hash}_{prompt_hash}"
+    # A single hash over the raw pixels and the prompt; mode and size are
+    # included so equal buffers of different shapes do not collide
+    cache_key = hashlib.blake2b(digest_size=16)
+    cache_key.update(f"{image.mode}|{image.size}|".encode('utf-8'))
+    cache_key.update(image.tobytes())
+    cache_key.update(b"\0")
+    cache_key.update(prompt.encode('utf-8'))
+    return cache_key.hexdigest()
+
+def _lookup_source_cache_key(image: Image.Image, prompt: str) -> Optional[str]:
+    """Returns the cache key computed earlier for this image object and prompt, if any."""
+    entry = _source_cache_keys.get((id(image), prompt))
+    if entry is not None and entry[0]() is image:
+        return entry[1]
+    return None
+
+def _remember_source_cache_key(image: Image.Image, prompt: str, cache_key: str):
+    """
+    Records the cache key of a source image object, so enhancing the same
+    object again skips resizing and hashing it.
+
+    Source images must not be modified in place after being enhanced.
+    """
+    key = (id(image), prompt)
+
+    def _forget(ref):
+        # Runs from garbage collection, so it must not take any lock. Racing
+        # with a new entry for a reused id at worst drops that entry, which
+        # only costs hashing the new image again.
+        entry = _source_cache_keys.get(key)
+        if entry is not None and entry[0] is ref:
+            _source_cache_keys.pop(key, None)
+
+    _source_cache_keys[key] = (weakref.ref(image, _forget), cache_key)
+
+def _remember_image(cache_key: str, image: Image.Image):
+    """
+    Keeps a decoded enhanced image in the in-memory LRU cache.
+
+    Images are shared between callers and must be treated as read-only.
+    """
+    with _memory_cache_lock:
+        _memory_cache[cache_key] = image
+        _memory_cache.move_to_end(cache_key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
 
 def _load_cached_image(cache_key: str) -> Image.Image:
-    """Load a cached enhanced image if it exists."""
+    """Load a cached enhanced image from memory or disk if it exists."""
+    with _memory_cache_lock:
+        cached_image = _memory_cache.get(cache_key)
+        if cached_image is not None:
+            _memory_cache.move_to_end(cache_key)
+            return cached_image
+
     cache_dir = _get_cache_dir()
-    cache_file = cache_dir / f"{cache_key}.pkl"
+    cache_file = cache_dir / f"{cache_key}.png"
     
-    if cache_file.exists():
+    try:
+        # Cached images are plain PNG files, decoded straight from disk.
+        # Opening directly doubles as the existence check.
+        cached_image = Image.open(cache_file)
+        cached_image.load()
+        _remember_image(cache_key, cached_image)
+        return cached_image
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Failed to load cached image {cache_key}: {e}")
+        # Remove corrupted cache file
         try:
-            with open(cache_file, 'rb') as f:
-                cached_data = pickle.load(f)
-                return Image.open(BytesIO(cached_data))
-        except Exception as e:
-            logging.warning(f"Failed to load cached image {cache_key}: {e}")
-            # Remove corrupted cache file
-            try:
-                cache_file.unlink()
-            except:
-                pass
+            cache_file.unlink()
+        except:
+            pass
     return None
 
-def _save_cached_image(cache_key: str, image: Image.Image):
-    """Save an enhanced image to cache."""
+def _save_cached_image(cache_key: str, image_bytes: bytes):
+    """
+    Save an enhanced image to cache.
+
+    Takes the encoded image exactly as returned by the model, so it is stored
+    without being re-encoded. Image.open detects the format from the content.
+    """
     try:
         cache_dir = _get_cache_dir()
-        cache_file = cache_dir / f"{cache_key}.pkl"
+        cache_file = cache_dir / f"{cache_key}.png"
         
-        # Convert image to bytes for storage
-        img_bytes = BytesIO()
-        image.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-        
-        with open(cache_file, 'wb') as f:
-            pickle.dump(img_bytes.getvalue(), f)
+        # Write to a temporary file and rename it into place, so readers never
+        # see a partially written cache entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(image_bytes)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
             
         logging.info(f"Cached enhanced image to {cache_file}")
     except Exception as e:
         logging.warning(f"Failed to cache image {cache_key}: {e}")
 
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Returns how long to wait before retrying after the given (0-based) attempt.
+
+    Honors a numeric Retry-After header from the server, otherwise uses
+    exponential backoff with jitter so concurrent enhancements that fail
+    together do not retry in lockstep.
+    """
+    if retry_after:
+        try:
+            return min(MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form, fall back to backoff
+    return min(MAX_RETRY_DELAY, 0.1 * 2 ** attempt + random.uniform(0, 0.1))
+
+def _error_body_preview(response: requests.Response) -> str:
+    """
+    Returns the start of a streamed error response body for error messages.
+
+    Only the first ERROR_BODY_PREVIEW_BYTES are read; the rest is never
+    downloaded or decoded.
+    """
+    preview = next(response.iter_content(ERROR_BODY_PREVIEW_BYTES), b"")
+    return preview[:ERROR_BODY_PREVIEW_BYTES].decode('utf-8', errors='replace')
+
+def _find_inline_image_data(response: requests.Response) -> Optional[str]:
+    """
+    Returns the base64 data of the first inline image in a streamGenerateContent response.
+
+    With ijson the streamed body is parsed incrementally and reading stops at
+    the first image, instead of buffering and parsing the whole multi-megabyte
+    response.
+    """
+    if ijson is not None:
+        response.raw.decode_content = True
+        try:
+            for part in ijson.items(response.raw, "item.candidates.item.content.parts.item"):
+                if "inlineData" in part and part["inlineData"].get("data"):
+                    return part["inlineData"]["data"]
+        except ijson.JSONError as e:
+            logging.warning(f"Could not parse AI model response: {e}")
+        return None
+
+    for resp_item in response.json():
+        for candidate in resp_item.get("candidates", []):
+            for part in candidate.get("content", {}).get("parts", []):
+                if "inlineData" in part and part["inlineData"].get("data"):
+                    return part["inlineData"]["data"]
+    return None
+
 def enhance_image(image: Image.Image, prompt: str) -> Image.Image:
     """
     Enhances an image using a generative AI model with local caching.
@@ -100,8 +288,21 @@ def enhance_image(image: Image.Image, prompt: str) -> Image.Image:
     Raises:
         ImageEnhancementFailedException: When enhancement fails and clip should be skipped.
     """
+    # The same image object seen before: skip resizing and hashing it again
+    cache_key = _lookup_source_cache_key(image, prompt)
+    if cache_key is not None:
+        cached_image = _load_cached_image(cache_key)
+        if cached_image is not None:
+            logging.info(f"Using cached enhanced image: {cache_key}")
+            return cached_image
+
+    # Downscale before hashing: the key then describes exactly what the model
+    # sees, and JPEG sources can still be decoded at reduced size
+    processed_image = _resize_to_max_1080_png(image)
+
     # Generate cache key
-    cache_key = _get_cache_key(image, prompt)
+    cache_key = _get_cache_key(processed_image, prompt)
+    _remember_source_cache_key(image, prompt, cache_key)
     
     # Try to load from cache first
     cached_image = _load_cached_image(cache_key)
@@ -113,12 +314,10 @@ def enhance_image(image: Image.Image, prompt: str) -> Image.Image:
     try:
         logging.info(f"Enhancing image with Vertex AI model: {cache_key}")
 
-        processed_image = _resize_to_max_1080_png(image)
-
         buffered = BytesIO()
         processed_image.save(buffered, format="PNG")
-        img_bytes = buffered.getvalue()
-        encoded_image = base64.b64encode(img_bytes).decode('utf-8')
+        # Encode straight from the buffer's memoryview instead of copying it out first
+        encoded_image = base64.b64encode(buffered.getbuffer()).decode('ascii')
 
         project_id = os.environ.get("GOOGLE_CLOUD_PROJECT", "bounti-prod-322900")
         model_id = "gemini-2.5-flash-image-preview"
@@ -151,42 +350,40 @@ def enhance_image(image: Image.Image, prompt: str) -> Image.Image:
             ]
         }
 
-        credentials, _ = google.auth.default(scopes=['https://www.googleapis.com/auth/cloud-platform'])
-        auth_req = google.auth.transport.requests.Request()
+        # Serialize the (multi-megabyte) body once rather than on every attempt
+        body = orjson.dumps(request_body) if orjson is not None else json.dumps(request_body).encode('utf-8')
 
         last_error = None
         for attempt in range(3):
+            retry_after = None
             try:
-                credentials.refresh(auth_req)
-                headers = {
-                    "Authorization": f"Bearer {credentials.token}",
-                    "Content-Type": "application/json; charset=utf-8",
-                }
-
-                response = requests.post(url, headers=headers, json=request_body, timeout=60)
-
-                if response.status_code == 200:
-                    api_responses = response.json()
-                    for resp_item in api_responses:
-                        for candidate in resp_item.get("candidates", []):
-                            for part in candidate.get("content", {}).get("parts", []):
-                                if "inlineData" in part and part["inlineData"].get("data"):
-                                    image_data = part["inlineData"]["data"]
-                                    decoded_bytes = base64.b64decode(image_data)
-                                    enhanced_image = Image.open(BytesIO(decoded_bytes))
-                                    _save_cached_image(cache_key, enhanced_image)
-                                    return enhanced_image
-                    last_error = ImageEnhancementFailedException(f"AI model returned response without image data: {response.text}")
-                    continue
-                else:
-                    last_error = ImageEnhancementFailedException(f"API request failed on attempt {attempt + 1} with status {response.status_code}: {response.text}")
-
-            except requests.exceptions.RequestException as e:
+                with _get_authorized_session().post(url, data=body, timeout=60, stream=True) as response:
+                    if response.status_code == 200:
+                        image_data = _find_inline_image_data(response)
+                        if image_data:
+                            decoded_bytes = base64.b64decode(image_data)
+                            enhanced_image = Image.open(BytesIO(decoded_bytes))
+                            # Decode now so the shared in-memory copy is never lazily loaded
+                            enhanced_image.load()
+                            _remember_image(cache_key, enhanced_image)
+                            _save_cached_image(cache_key, decoded_bytes)
+                            return enhanced_image
+                        # The streamed body has been consumed, so it cannot be included here
+                        last_error = ImageEnhancementFailedException("AI model returned response without image data")
+                        continue
+                    else:
+                        last_error = ImageEnhancementFailedException(f"API request failed on attempt {attempt + 1} with status {response.status_code}: {_error_body_preview(response)}")
+                        retry_after = response.headers.get("Retry-After")
+
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                # ijson reads the streamed body from urllib3 directly, so a reset or
+                # read timeout mid-body raises urllib3's errors rather than requests'
                 last_error = ImageEnhancementFailedException(f"Network error on attempt {attempt + 1}: {e}")
 
             if attempt < 2:
-                logging.warning(f"{last_error} Retrying in 2 seconds...")
-                time.sleep(2)
+                delay = _retry_delay(attempt, retry_after)
+                logging.warning(f"{last_error} Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
 
         raise last_error
 
@@ -198,6 +395,40 @@ def enhance_image(image: Image.Image, prompt: str) -> Image.Image:
             logging.warning(f"Image enhancement failed: {str(e)}. Skipping this enhanced image clip.")
             raise e
 
+def enhance_images_batch(pairs: List[Tuple[Image.Image, str]]) -> List[Optional[Image.Image]]:
+    """
+    Enhances several images concurrently.
+
+    Args:
+        pairs: A list of (image, prompt) tuples.
+
+    Returns:
+        The enhanced images in the same order, with None for each image whose
+        enhancement failed.
+    """
+    def _enhance_or_none(pair: Tuple[Image.Image, str]) -> Optional[Image.Image]:
+        try:
+            return enhance_image(*pair)
+        except ImageEnhancementFailedException:
+            return None
+
+    if not pairs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(ENHANCE_MAX_WORKERS, len(pairs))) as executor:
+        return list(executor.map(_enhance_or_none, pairs))
+
 def numpy_to_pil(np_array: np.ndarray) -> Image.Image:
-    """Converts a NumPy array (frame) to a PIL Image."""
+    """
+    Converts a NumPy array (frame) to a PIL Image.
+
+    RGB/RGBA uint8 frames are wrapped without copying via Image.frombuffer, so
+    the image shares (and keeps alive) the array's memory; PIL marks it
+    read-only and copies on the first in-place edit. Other arrays fall back to
+    Image.fromarray.
+    """
+    modes = {3: "RGB", 4: "RGBA"}
+    if np_array.dtype == np.uint8 and np_array.ndim == 3 and np_array.shape[2] in modes:
+        mode = modes[np_array.shape[2]]
+        np_array = np.ascontiguousarray(np_array)
+        return Image.frombuffer(mode, (np_array.shape[1], np_array.shape[0]), np_array, "raw", mode, 0, 1)
     return Image.fromarray(np_array)
@@ -10,9 +10,28 @@ from .clip_handlers import (
 )
 from .composition_handlers import build_composite_clip, build_concatenate_clip
 from .effect_handlers import apply_effects
-
-
-def build_clip_from_json(clip_config: dict, asset_map: dict) -> Clip:
+from .gcs_utils import AssetManager
+
+# Builders by clip type, all called as builder(clip_config, asset_map, asset_manager)
+_BUILDERS = {
+    "video": build_video_clip,
+    "audio": build_audio_clip,
+    "image": build_image_clip,
+    "enhanced_image": build_enhanced_image_clip,
+    "text": lambda config, asset_map, asset_manager: build_text_clip(config),
+    "color": lambda config, asset_map, asset_manager: build_color_clip(config),
+    "composite": lambda config, asset_map, asset_manager: build_composite_clip(
+        config, asset_map, build_clip_from_json, asset_manager
+    ),
+    "concatenate": lambda config, asset_map, asset_manager: build_concatenate_clip(
+        config, asset_map, build_clip_from_json, asset_manager
+    ),
+}
+
+
+def build_clip_from_json(
+    clip_config: dict, asset_map: dict, asset_manager: AssetManager | None = None
+) -> Clip:
     """
     Parses a JSON clip configuration and builds a corresponding moviepy Clip object.
 
@@ -23,32 +42,18 @@ def build_clip_from_json(clip_config: dict, asset_map: dict) -> Clip:
     Args:
         clip_config: A dictionary representing the clip's configuration.
         asset_map: A dictionary mapping GCS URIs to local file paths.
+        asset_manager: Optional AssetManager holding per-render caches
+                       (e.g. prefetched video frames).
 
     Returns:
         A moviepy.Clip.Clip object.
     """
     clip_type = clip_config["type"]
-    if clip_type == "video":
-        clip = build_video_clip(clip_config, asset_map)
-    elif clip_type == "audio":
-        clip = build_audio_clip(clip_config, asset_map)
-    elif clip_type == "image":
-        clip = build_image_clip(clip_config, asset_map)
-    elif clip_type == "enhanced_image":
-        clip = build_enhanced_image_clip(clip_config, asset_map)
-        # Handle the case where enhanced_image_clip returns None (failed enhancement)
-        if clip is None:
-            return None
-    elif clip_type == "text":
-        clip = build_text_clip(clip_config)
-    elif clip_type == "color":
-        clip = build_color_clip(clip_config)
-    elif clip_type == "composite":
-        clip = build_composite_clip(clip_config, asset_map, build_clip_from_json)
-    elif clip_type == "concatenate":
-        clip = build_concatenate_clip(clip_config, asset_map, build_clip_from_json)
-    else:
+    builder = _BUILDERS.get(clip_type)
+    if builder is None:
         raise ValueError(f"Unknown clip type: {clip_type}")
+    # Builders return None for clips that should be skipped (e.g. failed enhanced images)
+    clip = builder(clip_config, asset_map, asset_manager)
 
     # Only apply effects if clip is not None
     if clip is not None and "effects" in clip_config:
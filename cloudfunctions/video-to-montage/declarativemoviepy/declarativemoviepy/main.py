@@ -3,17 +3,25 @@ import logging
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
+from .clip_handlers import prefetch_enhanced_images
+from .frame_extractor import prefetch_video_frames
 from .gcs_utils import AssetManager, is_gcs_path, upload_local_file_to_gcs
 from .interpreter import build_clip_from_json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used without it
+    orjson = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
 
-def render_from_json(composition: dict):
+def render_from_json(composition: dict, temp_dir: str | None = None):
     """
     Renders a video from a JSON composition dictionary.
 
@@ -27,19 +35,38 @@ def render_from_json(composition: dict):
 
     Args:
         composition: A dictionary containing the JSON composition data.
+        temp_dir: Optional directory to create the temporary files under, such as
+            a per-request directory of the caller. Defaults to the system temp dir.
     """
     asset_manager = None
     temp_render_dir = None
     try:
         logging.info("Starting video rendering from composition dictionary")
 
-        # 2. Instantiate AssetManager to handle GCS assets
-        asset_manager = AssetManager(composition)
+        # 2. Instantiate AssetManager to handle GCS assets. The downloads run in
+        # the background while images with local sources are already enhanced.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            asset_manager_future = executor.submit(AssetManager, composition, temp_dir)
+            try:
+                local_enhanced_images = prefetch_enhanced_images(composition, {}, gcs_sources=False)
+            finally:
+                asset_manager = asset_manager_future.result()
+
+        # 2.5. Extract all referenced video frames up front, in parallel
+        asset_manager.video_frames = prefetch_video_frames(
+            composition, asset_manager.local_asset_map
+        )
+
+        # 2.6. Run the remaining image enhancement requests up front, in parallel
+        asset_manager.enhanced_images = {
+            **local_enhanced_images,
+            **prefetch_enhanced_images(composition, asset_manager.local_asset_map, asset_manager),
+        }
 
         # 3. Build the final moviepy clip from the JSON config
         logging.info("Building clip from JSON configuration...")
         final_clip = build_clip_from_json(
-            composition["clip"], asset_manager.local_asset_map
+            composition["clip"], asset_manager.local_asset_map, asset_manager
         )
         
         # 3.5. Add background audio if specified
@@ -51,7 +78,7 @@ def render_from_json(composition: dict):
             audio_effects = audio_config.pop("effects", [])
             
             # Create base audio clip
-            audio_clip = build_clip_from_json(audio_config, asset_manager.local_asset_map)
+            audio_clip = build_clip_from_json(audio_config, asset_manager.local_asset_map, asset_manager)
             
             # Adjust duration to match video BEFORE applying effects
             target_duration = final_clip.duration
@@ -81,7 +108,7 @@ def render_from_json(composition: dict):
 
         if is_gcs_output:
             # Create a temporary local file for rendering
-            temp_render_dir = tempfile.mkdtemp(prefix="declarativemoviepy_render_")
+            temp_render_dir = tempfile.mkdtemp(prefix="declarativemoviepy_render_", dir=temp_dir)
             filename = os.path.basename(output_path)
             local_render_path = os.path.join(temp_render_dir, filename)
             logging.info(
@@ -132,8 +159,12 @@ def render_from_json_file(json_path: str):
     """
     try:
         # Load the JSON composition from file
-        with open(json_path, "r") as f:
-            composition = json.load(f)
+        if orjson is not None:
+            with open(json_path, "rb") as f:
+                composition = orjson.loads(f.read())
+        else:
+            with open(json_path, "r") as f:
+                composition = json.load(f)
         logging.info(f"Successfully loaded composition from {json_path}")
         
         # Call the main rendering function
@@ -1,89 +1,76 @@
 """
 Validates the declarativemoviepy JSON schema.
 """
+import fastjsonschema
 
 class SchemaValidationError(ValueError):
     """Custom exception for schema validation errors."""
     pass
 
-def _validate_clip(clip_data: dict):
-    """Recursively validates a clip object."""
-    if not isinstance(clip_data, dict):
-        raise SchemaValidationError("Clip configuration must be a dictionary.")
+def _requires(clip_type: str, *properties: str, **property_schemas: dict) -> dict:
+    """Builds the rule requiring the given properties on clips of one type."""
+    return {
+        "if": {"required": ["type"], "properties": {"type": {"const": clip_type}}},
+        "then": {"required": list(properties), "properties": property_schemas},
+    }
 
-    clip_type = clip_data.get("type")
-    if not clip_type:
-        raise SchemaValidationError("Each clip must have a 'type'.")
+# The minimal structural rules a composition must satisfy before rendering.
+# This is intentionally looser than composition_schema.json: unknown
+# properties are allowed and only what the builders rely on is enforced.
+COMPOSITION_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["output_path", "clip"],
+    "properties": {
+        "clip": {"$ref": "#/definitions/clip"},
+    },
+    "definitions": {
+        "clip": {
+            "type": "object",
+            "required": ["type"],
+            "properties": {
+                "type": {
+                    "enum": [
+                        "video", "audio", "image", "enhanced_image",
+                        "text", "color", "composite", "concatenate"
+                    ]
+                },
+                "start": {"type": "number"},
+                "duration": {"type": "number"},
+                "position": {"type": "array"},
+                # Composite and concatenate clips recurse into their children
+                "clips": {"type": "array", "items": {"$ref": "#/definitions/clip"}},
+                "effects": {
+                    "type": "array",
+                    "items": {"type": "object", "required": ["type"]},
+                },
+            },
+            "allOf": [
+                _requires("video", "source"),
+                _requires("audio", "source"),
+                _requires("image", "source", "duration"),
+                _requires("enhanced_image", "source", "duration"),
+                _requires("text", "text", "duration"),
+                _requires(
+                    "color", "size", "color", "duration",
+                    size={"type": "array"}, color={"type": "array"},
+                ),
+                _requires("composite", "clips"),
+                _requires("concatenate", "clips"),
+            ],
+        },
+    },
+}
 
-    # Common properties check
-    if "start" in clip_data and not isinstance(clip_data["start"], (int, float)):
-        raise SchemaValidationError(f"Clip 'start' must be a number for clip type {clip_type}.")
-    if "duration" in clip_data and not isinstance(clip_data["duration"], (int, float)):
-        raise SchemaValidationError(f"Clip 'duration' must be a number for clip type {clip_type}.")
-    if "position" in clip_data and not isinstance(clip_data["position"], list):
-        raise SchemaValidationError(f"Clip 'position' must be a list for clip type {clip_type}.")
-
-    # Type-specific checks
-    if clip_type == "video":
-        if "source" not in clip_data:
-            raise SchemaValidationError("Video clip must have a 'source'.")
-    elif clip_type == "audio":
-        if "source" not in clip_data:
-            raise SchemaValidationError("Audio clip must have a 'source'.")
-    elif clip_type == "image":
-        if "source" not in clip_data:
-            raise SchemaValidationError("Image clip must have a 'source'.")
-        if "duration" not in clip_data:
-            raise SchemaValidationError("Image clip must have a 'duration'.")
-    elif clip_type == "enhanced_image":
-        if "source" not in clip_data:
-            raise SchemaValidationError("Enhanced image clip must have a 'source'.")
-        if "duration" not in clip_data:
-            raise SchemaValidationError("Enhanced image clip must have a 'duration'.")
-    elif clip_type == "text":
-        if "text" not in clip_data:
-            raise SchemaValidationError("Text clip must have 'text'.")
-        if "duration" not in clip_data:
-            raise SchemaValidationError("Text clip must have a 'duration'.")
-    elif clip_type == "color":
-        if "size" not in clip_data or not isinstance(clip_data["size"], list):
-            raise SchemaValidationError("Color clip must have a 'size' array.")
-        if "color" not in clip_data or not isinstance(clip_data["color"], list):
-            raise SchemaValidationError("Color clip must have a 'color' array.")
-        if "duration" not in clip_data:
-            raise SchemaValidationError("Color clip must have a 'duration'.")
-    elif clip_type in ["composite", "concatenate"]:
-        if "clips" not in clip_data or not isinstance(clip_data["clips"], list):
-            raise SchemaValidationError(f"{clip_type} clip must have a 'clips' array.")
-        for sub_clip in clip_data["clips"]:
-            _validate_clip(sub_clip)
-    else:
-        allowed_clip_types = [
-            "video", "audio", "image", "enhanced_image",
-            "text", "color", "composite", "concatenate"
-        ]
-        if clip_type not in allowed_clip_types:
-            raise SchemaValidationError(f"Unknown clip type: '{clip_type}'")
-
-    if "effects" in clip_data:
-        if not isinstance(clip_data["effects"], list):
-            raise SchemaValidationError("'effects' must be a list.")
-        for effect in clip_data["effects"]:
-            if not isinstance(effect, dict) or "type" not in effect:
-                raise SchemaValidationError("Each effect must be a dictionary with a 'type'.")
+# Compiled once to Python code at import
+_validate = fastjsonschema.compile(COMPOSITION_SCHEMA)
 
 def validate_composition_json(data: dict):
     """
     Validates a declarativemoviepy composition JSON.
     Raises SchemaValidationError on failure.
     """
-    if not isinstance(data, dict):
-        raise SchemaValidationError("Top-level configuration must be a dictionary.")
-
-    if "output_path" not in data:
-        raise SchemaValidationError("Composition must have 'output_path'.")
-    
-    if "clip" not in data:
-        raise SchemaValidationError("Composition must have a root 'clip' object.")
-        
-    _validate_clip(data["clip"])
\ No newline at end of file
+    try:
+        _validate(data)
+    except fastjsonschema.JsonSchemaException as e:
+        raise SchemaValidationError(e.message) from e
@@ -1,266 +1,260 @@
 #!/usr/bin/env python3
 
+import copy
+import fastjsonschema
+from fastjsonschema.ref_resolver import RefResolver
+import hashlib
 import json
-from typing import Dict, Any, List
+import jsonschema
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Set
 
-def generate_json_schema() -> Dict[str, Any]:
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used without it
+    orjson = None
+
+# Keywords that only annotate the schema and never affect validation
+ANNOTATION_KEYWORDS = {"description", "default"}
+
+# Keywords whose values map property or definition names to subschemas
+SUBSCHEMA_MAP_KEYWORDS = {"properties", "$defs"}
+
+# $defs referenced at most this many times are inlined by inline_refs()
+MAX_INLINE_USES = 5
+
+DEFS_PREFIX = "#/$defs/"
+
+# Generated files are written next to this script, where validate_examples.py
+# reads them, whatever the current directory
+SCHEMA_DIR = Path(__file__).parent
+
+def _number(description: str, minimum: int = 0) -> Dict[str, Any]:
+    """A number property with a lower bound."""
+    return {"type": "number", "minimum": minimum, "description": description}
+
+def _size(description: str) -> Dict[str, Any]:
+    """A [width, height] property in pixels."""
+    return {
+        "type": "array",
+        "description": description,
+        "items": {"type": "integer", "minimum": 1},
+        "minItems": 2,
+        "maxItems": 2
+    }
+
+def _child_clips(description: str) -> Dict[str, Any]:
+    """The non-empty list of child clips of a composite or concatenate clip."""
+    return {
+        "type": "array",
+        "description": description,
+        "items": {"$ref": "#/$defs/clip"},
+        "minItems": 1
+    }
+
+def _variant(type_name: str, properties: Dict[str, Any], required: Sequence[str] = ()) -> Dict[str, Any]:
+    """A closed object variant identified by its "type" const."""
+    return {
+        "type": "object",
+        "properties": {"type": {"const": type_name}, **properties},
+        "required": ["type", *required],
+        "additionalProperties": False
+    }
+
+def _variants_schema(variants: List[Dict[str, Any]], pointer: str, strict: bool = False) -> Dict[str, Any]:
     """
-    Generate JSON Schema for declarativemoviepy composition format.
+    Combine object variants that are told apart by their "type" const.
+
+    The strict form is a plain oneOf with an OpenAPI discriminator, whose
+    mapping from each type to its branch (under pointer, the location of
+    this schema) is computed here once. Validators that ignore the
+    discriminator try every branch, so the default form dispatches on "type"
+    with if/then instead: only the branch whose "if" matches is evaluated.
+    Both accept exactly the same documents.
     """
-    
-    # Base clip properties that all clips inherit
-    clip_base_properties = {
-        "type": {"type": "string", "description": "The type of the clip"},
-        "start": {"type": "number", "description": "Time in seconds when the clip starts within a composite", "minimum": 0},
-        "position": {
-            "type": "array",
-            "description": "Position of the clip's top-left corner within a composite",
-            "prefixItems": [
-                {"anyOf": [{"type": "string", "enum": ["left", "center", "right"]}, {"type": "number"}]},
-                {"anyOf": [{"type": "string", "enum": ["top", "center", "bottom"]}, {"type": "number"}]}
-            ],
-            "minItems": 2,
-            "maxItems": 2
-        },
-        "duration": {"type": "number", "description": "Duration of the clip in seconds", "minimum": 0},
-        "effects": {
-            "type": "array",
-            "description": "List of effects to apply to this clip",
-            "items": {"$ref": "#/$defs/effect"}
-        }
-    }
-    
-    # Effect definitions
-    effect_definitions = {
-        "effect": {
+    if strict:
+        return {
             "type": "object",
-            "discriminator": {"propertyName": "type"},
-            "oneOf": [
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "fadein"},
-                        "duration": {"type": "number", "minimum": 0, "description": "Duration of the fade-in effect"}
-                    },
-                    "required": ["type", "duration"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "fadeout"},
-                        "duration": {"type": "number", "minimum": 0, "description": "Duration of the fade-out effect"}
-                    },
-                    "required": ["type", "duration"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "speed"},
-                        "factor": {"type": "number", "minimum": 0, "description": "Speed multiplier"}
-                    },
-                    "required": ["type", "factor"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "multiply_speed"},
-                        "factor": {"type": "number", "minimum": 0, "description": "Speed multiplier"}
-                    },
-                    "required": ["type", "factor"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "multiply_volume"},
-                        "factor": {"type": "number", "minimum": 0, "description": "Volume multiplier"}
-                    },
-                    "required": ["type", "factor"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "audio_fadein"},
-                        "duration": {"type": "number", "minimum": 0, "description": "Duration of the audio fade-in effect"}
-                    },
-                    "required": ["type", "duration"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "audio_fadeout"},
-                        "duration": {"type": "number", "minimum": 0, "description": "Duration of the audio fade-out effect"}
-                    },
-                    "required": ["type", "duration"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "subclip"},
-                        "t_start": {"type": "number", "minimum": 0, "description": "Start time for subclip"},
-                        "t_end": {"type": "number", "minimum": 0, "description": "End time for subclip"}
-                    },
-                    "required": ["type", "t_start", "t_end"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        "type": {"const": "resize"},
-                        "width": {"type": "number", "minimum": 1, "description": "Target width"},
-                        "height": {"type": "number", "minimum": 1, "description": "Target height"}
-                    },
-                    "required": ["type"],
-                    "additionalProperties": False
+            "discriminator": {
+                "propertyName": "type",
+                "mapping": {
+                    variant["properties"]["type"]["const"]: f"{pointer}/oneOf/{index}"
+                    for index, variant in enumerate(variants)
                 }
-            ]
+            },
+            "oneOf": variants
         }
+    type_names = [variant["properties"]["type"]["const"] for variant in variants]
+    return {
+        "type": "object",
+        "properties": {"type": {"enum": type_names}},
+        "required": ["type"],
+        "allOf": [
+            {"if": {"properties": {"type": {"const": type_name}}}, "then": variant}
+            for type_name, variant in zip(type_names, variants)
+        ]
     }
-    
-    # Clip type definitions
-    clip_definitions = {
-        "clip": {
-            "type": "object",
-            "discriminator": {"propertyName": "type"},
-            "oneOf": [
-                {
-                    "type": "object",
-                    "properties": {
-                        **clip_base_properties,
-                        "type": {"const": "video"},
-                        "source": {"type": "string", "description": "Path to the video file or gs:// URI"}
-                    },
-                    "required": ["type", "source"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        **clip_base_properties,
-                        "type": {"const": "image"},
-                        "source": {"type": "string", "description": "Path to the image file or gs:// URI"},
-                        "duration": {"type": "number", "minimum": 0, "description": "Duration to display the image"}
-                    },
-                    "required": ["type", "source", "duration"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        **clip_base_properties,
-                        "type": {"const": "enhanced_image"},
-                        "source": {"type": "string", "description": "Path to the source image or video frame reference"},
-                        "prompt": {"type": "string", "description": "Text prompt for image enhancement", "default": "Enhance this image."},
-                        "duration": {"type": "number", "minimum": 0, "description": "Duration to display the enhanced image"}
-                    },
-                    "required": ["type", "source", "duration"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        **clip_base_properties,
-                        "type": {"const": "text"},
-                        "text": {"type": "string", "description": "Text content to display"},
-                        "font": {"type": "string", "description": "Font name"},
-                        "font_size": {"type": "number", "minimum": 1, "description": "Font size"},
-                        "color": {"type": "string", "description": "Text color (name or hex)"},
-                        "width": {"type": "number", "minimum": 1, "description": "Text width for wrapping"},
-                        "align": {"type": "string", "enum": ["left", "center", "right"], "description": "Text alignment"},
-                        "duration": {"type": "number", "minimum": 0, "description": "Duration to display the text"}
-                    },
-                    "required": ["type", "text", "duration"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        **clip_base_properties,
-                        "type": {"const": "color"},
-                        "size": {
-                            "type": "array",
-                            "description": "Dimensions [width, height] in pixels",
-                            "items": {"type": "integer", "minimum": 1},
-                            "minItems": 2,
-                            "maxItems": 2
-                        },
-                        "color": {
-                            "type": "array",
-                            "description": "RGB color values [r, g, b]",
-                            "items": {"type": "integer", "minimum": 0, "maximum": 255},
-                            "minItems": 3,
-                            "maxItems": 3
-                        },
-                        "duration": {"type": "number", "minimum": 0, "description": "Duration to display the color"}
-                    },
-                    "required": ["type", "size", "color", "duration"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        **clip_base_properties,
-                        "type": {"const": "composite"},
-                        "size": {
-                            "type": "array",
-                            "description": "Dimensions [width, height] in pixels",
-                            "items": {"type": "integer", "minimum": 1},
-                            "minItems": 2,
-                            "maxItems": 2
-                        },
-                        "clips": {
-                            "type": "array",
-                            "description": "List of child clips to compose together",
-                            "items": {"$ref": "#/$defs/clip"},
-                            "minItems": 1
-                        }
-                    },
-                    "required": ["type", "clips"],
-                    "additionalProperties": False
-                },
-                {
-                    "type": "object",
-                    "properties": {
-                        **clip_base_properties,
-                        "type": {"const": "concatenate"},
-                        "clips": {
-                            "type": "array",
-                            "description": "List of child clips to play in sequence",
-                            "items": {"$ref": "#/$defs/clip"},
-                            "minItems": 1
-                        },
-                        "transition": {
-                            "type": "object",
-                            "description": "Transition between clips",
-                            "properties": {
-                                "type": {"type": "string", "enum": ["crossfade"], "description": "Type of transition"},
-                                "duration": {"type": "number", "minimum": 0, "description": "Duration of transition"}
-                            },
-                            "required": ["type", "duration"],
-                            "additionalProperties": False
-                        }
-                    },
-                    "required": ["type", "clips"],
-                    "additionalProperties": False
+
+def _with_base(variant: Dict[str, Any], base_ref: str, base_properties: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Make a variant inherit the shared base properties by reference.
+
+    The base schemas are applied once through allOf instead of being copied
+    into every variant. The variant still names each base property, as an
+    always-true schema, so that its additionalProperties allows them.
+    """
+    properties = {**{name: True for name in base_properties}, **variant["properties"]}
+    return {**variant, "properties": properties, "allOf": [{"$ref": base_ref}]}
+
+# The schema building blocks are constructed once at import and shared by
+# every generate_json_schema() call. They are plain dicts, since the JSON
+# encoders cannot serialize read-only mapping proxies; treat them as read-only.
+
+# Base clip properties that all clips inherit
+_CLIP_BASE_PROPERTIES = {
+    "type": {"type": "string", "description": "The type of the clip"},
+    "start": {"type": "number", "description": "Time in seconds when the clip starts within a composite", "minimum": 0},
+    "position": {
+        "type": "array",
+        "description": "Position of the clip's top-left corner within a composite",
+        "prefixItems": [
+            {"anyOf": [{"type": "string", "enum": ["left", "center", "right"]}, {"type": "number"}]},
+            {"anyOf": [{"type": "string", "enum": ["top", "center", "bottom"]}, {"type": "number"}]}
+        ],
+        "minItems": 2,
+        "maxItems": 2
+    },
+    "duration": {"type": "number", "description": "Duration of the clip in seconds", "minimum": 0},
+    "effects": {
+        "type": "array",
+        "description": "List of effects to apply to this clip",
+        "items": {"$ref": "#/$defs/effect"}
+    }
+}
+
+# Effect definitions: (type, fields, required fields)
+_EFFECT_VARIANTS = [
+    _variant("fadein", {"duration": _number("Duration of the fade-in effect")}, ["duration"]),
+    _variant("fadeout", {"duration": _number("Duration of the fade-out effect")}, ["duration"]),
+    _variant("speed", {"factor": _number("Speed multiplier")}, ["factor"]),
+    _variant("multiply_speed", {"factor": _number("Speed multiplier")}, ["factor"]),
+    _variant("multiply_volume", {"factor": _number("Volume multiplier")}, ["factor"]),
+    _variant("audio_fadein", {"duration": _number("Duration of the audio fade-in effect")}, ["duration"]),
+    _variant("audio_fadeout", {"duration": _number("Duration of the audio fade-out effect")}, ["duration"]),
+    _variant(
+        "subclip",
+        {"t_start": _number("Start time for subclip"), "t_end": _number("End time for subclip")},
+        ["t_start", "t_end"]
+    ),
+    _variant(
+        "resize",
+        {"width": _number("Target width", minimum=1), "height": _number("Target height", minimum=1)}
+    )
+]
+
+# Clip type definitions
+_CONCURRENT_CHILDREN = {"type": "boolean", "description": "Build child clips in parallel; disable when children share mutable state", "default": True}
+_CLIP_TYPE_VARIANTS = [
+    _variant("video", {"source": {"type": "string", "description": "Path to the video file or gs:// URI"}}, ["source"]),
+    _variant(
+        "image",
+        {
+            "source": {"type": "string", "description": "Path to the image file or gs:// URI"},
+            "duration": _number("Duration to display the image")
+        },
+        ["source", "duration"]
+    ),
+    _variant(
+        "enhanced_image",
+        {
+            "source": {"type": "string", "description": "Path to the source image or video frame reference"},
+            "prompt": {"type": "string", "description": "Text prompt for image enhancement", "default": "Enhance this image."},
+            "snap_to_keyframe": {"type": "boolean", "description": "For video frame references, use the closest preceding keyframe instead of the exact timestamp (faster extraction)", "default": False},
+            "target_size": {
+                "type": "array",
+                "description": "For video frame references, downscale the extracted frame to fit within [width, height] while decoding",
+                "items": {"type": "integer", "minimum": 1},
+                "minItems": 2,
+                "maxItems": 2
+            },
+            "duration": _number("Duration to display the enhanced image")
+        },
+        ["source", "duration"]
+    ),
+    _variant(
+        "text",
+        {
+            "text": {"type": "string", "description": "Text content to display"},
+            "font": {"type": "string", "description": "Font name"},
+            "font_size": _number("Font size", minimum=1),
+            "color": {"type": "string", "description": "Text color (name or hex)"},
+            "width": _number("Text width for wrapping", minimum=1),
+            "align": {"type": "string", "enum": ["left", "center", "right"], "description": "Text alignment"},
+            "duration": _number("Duration to display the text")
+        },
+        ["text", "duration"]
+    ),
+    _variant(
+        "color",
+        {
+            "size": _size("Dimensions [width, height] in pixels"),
+            "color": {
+                "type": "array",
+                "description": "RGB color values [r, g, b]",
+                "items": {"type": "integer", "minimum": 0, "maximum": 255},
+                "minItems": 3,
+                "maxItems": 3
+            },
+            "duration": _number("Duration to display the color")
+        },
+        ["size", "color", "duration"]
+    ),
+    _variant(
+        "composite",
+        {
+            "size": _size("Dimensions [width, height] in pixels"),
+            "clips": _child_clips("List of child clips to compose together"),
+            "concurrent_children": _CONCURRENT_CHILDREN
+        },
+        ["clips"]
+    ),
+    _variant(
+        "concatenate",
+        {
+            "clips": _child_clips("List of child clips to play in sequence"),
+            "concurrent_children": _CONCURRENT_CHILDREN,
+            "transition": {
+                "type": "object",
+                "description": "Transition between clips",
+                "properties": {
+                    "type": {"type": "string", "enum": ["crossfade"], "description": "Type of transition"},
+                    "duration": _number("Duration of transition")
                 },
-                {
-                    "type": "object",
-                    "properties": {
-                        **clip_base_properties,
-                        "type": {"const": "audio"},
-                        "source": {"type": "string", "description": "Path to the audio file or gs:// URI"}
-                    },
-                    "required": ["type", "source"],
-                    "additionalProperties": False
-                }
-            ]
-        }
+                "required": ["type", "duration"],
+                "additionalProperties": False
+            }
+        },
+        ["clips"]
+    ),
+    _variant("audio", {"source": {"type": "string", "description": "Path to the audio file or gs:// URI"}}, ["source"])
+]
+
+# Every clip variant also accepts the base clip properties
+_CLIP_VARIANTS = [_with_base(variant, "#/$defs/clipBase", _CLIP_BASE_PROPERTIES) for variant in _CLIP_TYPE_VARIANTS]
+
+def generate_json_schema(strict: bool = False) -> Dict[str, Any]:
+    """
+    Generate JSON Schema for declarativemoviepy composition format.
+
+    With strict=True, clip and effect variants are combined with oneOf
+    rather than dispatched on their type (see _variants_schema).
+    """
+    effect_definitions = {"effect": _variants_schema(_EFFECT_VARIANTS, "#/$defs/effect", strict)}
+    clip_definitions = {
+        "clipBase": {"type": "object", "properties": _CLIP_BASE_PROPERTIES},
+        "clip": _variants_schema(_CLIP_VARIANTS, "#/$defs/clip", strict)
     }
     
     # Main schema structure
@@ -306,20 +300,206 @@ def generate_json_schema() -> Dict[str, Any]:
     
     return schema
 
+def _find_refs(node: Any) -> List[str]:
+    """List the $defs names referenced anywhere in node, once per occurrence."""
+    refs = []
+    stack = [node]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            ref = obj.get("$ref")
+            if isinstance(ref, str) and ref.startswith(DEFS_PREFIX):
+                refs.append(ref[len(DEFS_PREFIX):])
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return refs
+
+def _is_recursive(name: str, defs: Dict[str, Any]) -> bool:
+    """Whether the definition can reach itself through $refs."""
+    seen: Set[str] = set()
+    stack = _find_refs(defs[name])
+    while stack:
+        ref = stack.pop()
+        if ref == name:
+            return True
+        if ref not in seen and ref in defs:
+            seen.add(ref)
+            stack.extend(_find_refs(defs[ref]))
+    return False
+
+def inline_refs(schema: Dict[str, Any], max_uses: int = MAX_INLINE_USES) -> Dict[str, Any]:
+    """
+    Return a copy of schema with rarely used, non-recursive $defs inlined.
+
+    Each inlined {"$ref": ...} is replaced by a copy of its target, keeping
+    any sibling keywords such as "description", and the definition is dropped
+    from $defs. Recursive definitions (clip) keep their $ref. This saves
+    validators a reference lookup per use without duplicating large parts
+    of the schema.
+    """
+    schema = copy.deepcopy(schema)
+    defs = schema.get("$defs", {})
+    uses: Dict[str, int] = {}
+    for ref in _find_refs(schema):
+        uses[ref] = uses.get(ref, 0) + 1
+    inlined = {
+        name for name, count in uses.items()
+        if name in defs and count <= max_uses and not _is_recursive(name, defs)
+    }
+    if not inlined:
+        return schema
+
+    def _inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith(DEFS_PREFIX) and ref[len(DEFS_PREFIX):] in inlined:
+                siblings = {key: value for key, value in node.items() if key != "$ref"}
+                return {**_inline(copy.deepcopy(defs[ref[len(DEFS_PREFIX):]])), **siblings}
+            return {key: _inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [_inline(item) for item in node]
+        return node
+
+    schema = _inline(schema)
+    schema["$defs"] = {name: definition for name, definition in schema["$defs"].items() if name not in inlined}
+    return schema
+
+def strip_annotations(node: Any, in_subschema_map: bool = False) -> Any:
+    """
+    Return a copy of the schema without annotations and with sorted keys.
+
+    Annotation keywords are removed from schema objects only, so a property
+    that happens to be named "description" or "default" is kept.
+    """
+    if isinstance(node, dict):
+        return {
+            key: strip_annotations(node[key], key in SUBSCHEMA_MAP_KEYWORDS and not in_subschema_map)
+            for key in sorted(node)
+            if in_subschema_map or key not in ANNOTATION_KEYWORDS
+        }
+    if isinstance(node, list):
+        return [strip_annotations(item) for item in node]
+    return node
+
+# Prefix of the hash stamped into saved schema files as their $comment
+HASH_STAMP_PREFIX = "blake2b:"
+
+def canonical_bytes(obj: Any) -> bytes:
+    """
+    Serialize obj to compact JSON with sorted keys, for hashing and comparison.
+
+    Uses orjson's C serializer when available; the stdlib fallback is set up
+    to produce the same bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+
+def schema_hash(schema: Dict[str, Any]) -> str:
+    """Hash of the schema's canonical JSON, ignoring a previously stamped $comment."""
+    content = {key: value for key, value in schema.items() if key != "$comment"}
+    return hashlib.blake2b(canonical_bytes(content), digest_size=32).hexdigest()
+
+def _read_schema_hash(filename: str) -> Optional[str]:
+    """Read the hash stamped into an existing schema file, if any."""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            comment = json.load(f).get("$comment", "")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return comment[len(HASH_STAMP_PREFIX):] if comment.startswith(HASH_STAMP_PREFIX) else None
+
 def save_schema_to_file(schema: Dict[str, Any], filename: str = "composition_schema.json"):
-    """Save the generated schema to a JSON file."""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
+    """
+    Save the generated schema to a JSON file.
+
+    The schema's hash is stamped into it as its $comment, and the file is
+    left untouched when it already carries the same hash. Otherwise the
+    schema is checked against its meta-schema before being written, so
+    consumers of the file can trust it without checking it again.
+    """
+    digest = schema_hash(schema)
+    if _read_schema_hash(filename) == digest:
+        print(f"JSON Schema in {filename} is up to date")
+        return
+    jsonschema.validators.validator_for(schema).check_schema(schema)
+    stamped = {"$comment": f"{HASH_STAMP_PREFIX}{digest}", **schema}
+    if orjson is not None:
+        Path(filename).write_bytes(orjson.dumps(stamped, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(stamped, f, indent=2, ensure_ascii=False)
     print(f"JSON Schema saved to {filename}")
 
+def link_schema_file(source: str, destination: str):
+    """
+    Make destination a copy of an already saved schema file without serializing it again.
+
+    A hard link is used where possible, falling back to a plain file copy
+    (e.g. across filesystems).
+    """
+    try:
+        if os.path.samefile(source, destination):
+            print(f"JSON Schema in {destination} is up to date")
+            return
+        os.unlink(destination)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+    print(f"JSON Schema linked to {destination}")
+
+def save_validator_module(schema: Dict[str, Any], filename: Path = SCHEMA_DIR / "_composition_validator.py"):
+    """
+    Compile the schema ahead of time into an importable validator module.
+
+    The module holds fastjsonschema's generated code plus SCHEMA_HASH and a
+    validate() entry point, so validate_examples.py can import it instead of
+    compiling the schema. It is written next to validate_examples.py, the only
+    place that import looks. Like the schema files, it is only rewritten when
+    the schema hash changes.
+    """
+    digest = schema_hash(schema)
+    header = f'SCHEMA_HASH = "{digest}"\n'
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            if f.readline() == header:
+                print(f"Validator module {filename} is up to date")
+                return
+    except FileNotFoundError:
+        pass
+    entry_point = RefResolver.from_schema(schema, store={}).get_scope_name()
+    code = fastjsonschema.compile_to_code(schema)
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(header)
+        f.write("# Generated by schema_generator.py with fastjsonschema; do not edit.\n")
+        f.write(code)
+        f.write(f"\n\nvalidate = {entry_point}\n")
+    print(f"Validator module saved to {filename}")
+
 def main():
     """Generate and save the JSON schema."""
     schema = generate_json_schema()
-    save_schema_to_file(schema)
-    
-    # Also save to declarativemoviepy directory
-    schema_path = "declarativemoviepy/composition_schema.json"
+    # The copy at the top of the function (video-to-montage/)...
+    schema_path = SCHEMA_DIR.parent / "composition_schema.json"
     save_schema_to_file(schema, schema_path)
+    
+    # ...and the same file in the declarativemoviepy directory, read by lib.py
+    link_schema_file(schema_path, SCHEMA_DIR / "composition_schema.json")
+
+    # The same schema with rarely used $defs inlined
+    save_schema_to_file(inline_refs(schema), SCHEMA_DIR / "composition_schema.inlined.json")
+
+    # Inlined and without annotations, for validators (validate_examples.py)
+    min_schema = strip_annotations(inline_refs(schema))
+    save_schema_to_file(min_schema, SCHEMA_DIR / "composition_schema.min.json")
+    save_validator_module(min_schema)
+
+    # The oneOf form, for conformance checks (validate_examples.py --strict)
+    save_schema_to_file(generate_json_schema(strict=True), SCHEMA_DIR / "composition_schema.strict.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,35 +1,215 @@
 #!/usr/bin/env python3
 
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import json
+import os
+import fastjsonschema
+from fastjsonschema.ref_resolver import RefResolver
 import jsonschema
 from pathlib import Path
 import sys
 
-def load_schema(schema_path: str = "declarativemoviepy/composition_schema.json"):
+from schema_generator import schema_hash
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used without it
+    orjson = None
+
+# schema_generator.py writes the schemas next to this script; paths are resolved
+# from here so validation reads them whatever the current directory
+SCHEMA_DIR = Path(__file__).parent
+
+# The default (annotation-free) schema and its oneOf form, generated alongside it
+SCHEMA_PATH = SCHEMA_DIR / "composition_schema.min.json"
+STRICT_SCHEMA_PATH = SCHEMA_DIR / "composition_schema.strict.json"
+
+# Below this many examples, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Generated validator code, keyed by schema hash
+CACHE_DIR = SCHEMA_DIR / ".cache"
+
+# Examples already found valid, keyed by validator, schema hash and file content hash
+VALIDATION_CACHE_PATH = CACHE_DIR / "validation.json"
+
+def load_schema(schema_path: Path = SCHEMA_PATH):
     """Load the JSON schema from file."""
     with open(schema_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def validate_composition(composition_data, schema):
+def compile_schema(schema):
+    """
+    Compile the schema with fastjsonschema, reusing generated code where possible.
+
+    schema_generator.py compiles the default schema ahead of time into the
+    _composition_validator module, which is simply imported when its hash
+    matches. Otherwise the generated Python source is cached on disk, keyed
+    by the schema hash (compiled validators cannot be pickled), so later runs
+    against the same schema only execute that source.
+    """
+    digest = schema_hash(schema)
+    try:
+        import _composition_validator
+        if _composition_validator.SCHEMA_HASH == digest:
+            return _composition_validator.validate
+    except ImportError:
+        pass
+
+    cache_file = CACHE_DIR / f"validator-{digest}.py"
+    try:
+        code = cache_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        code = fastjsonschema.compile_to_code(schema)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(code, encoding='utf-8')
+    namespace = {}
+    exec(compile(code, str(cache_file), 'exec'), namespace)
+    return namespace[RefResolver.from_schema(schema, store={}).get_scope_name()]
+
+def create_validator(schema, strict: bool = False):
+    """
+    Build a validator for the schema once.
+
+    Returns a function that takes a composition and returns its first error
+    message, or None if it is valid.
+
+    By default the schema is compiled by fastjsonschema into plain Python
+    code. fastjsonschema implements drafts 4 to 7, so keywords added in later
+    drafts (such as prefixItems) are not enforced; strict mode uses
+    jsonschema's full draft 2020-12 implementation instead. Either way the
+    schema is processed once up front rather than on every example.
+
+    The schema is not checked against its meta-schema here: the schema files
+    are written by schema_generator.py, which checks them as it saves them.
+    """
+    if not strict:
+        compiled = compile_schema(schema)
+
+        def first_error(composition_data):
+            try:
+                compiled(composition_data)
+            except fastjsonschema.JsonSchemaException as e:
+                return e.message
+            return None
+
+        return first_error
+
+    validator = jsonschema.validators.validator_for(schema)(schema, format_checker=None)
+
+    def first_error(composition_data):
+        # is_valid stops at the first failure without building error objects;
+        # the full error set is only collected for invalid compositions
+        if validator.is_valid(composition_data):
+            return None
+        return str(jsonschema.exceptions.best_match(validator.iter_errors(composition_data)))
+
+    return first_error
+
+def validate_composition(composition_data, validator):
     """Validate a composition against the schema."""
     try:
-        jsonschema.validate(composition_data, schema)
-        return True, None
-    except jsonschema.ValidationError as e:
-        return False, str(e)
+        error = validator(composition_data)
+        if error is None:
+            return True, None
+        return False, error
     except Exception as e:
         return False, f"Unexpected error: {str(e)}"
 
-def validate_examples():
-    """Validate all example JSON files against the schema."""
-    schema = load_schema()
-    examples_dir = Path("declarativemoviepy/examples")
+def validate_example_file(example_file: Path, validator):
+    """
+    Validate one example file.
+
+    Returns whether it is valid and the report lines to print for it.
+    """
+    lines = [f"\nValidating: {example_file.name}", "-" * 40]
+    try:
+        # orjson parses the raw UTF-8 bytes directly, and its
+        # JSONDecodeError subclasses the stdlib one caught below
+        if orjson is not None:
+            composition_data = orjson.loads(example_file.read_bytes())
+        else:
+            with open(example_file, 'r', encoding='utf-8') as f:
+                composition_data = json.load(f)
+
+        is_valid, error_msg = validate_composition(composition_data, validator)
+
+        if is_valid:
+            lines.append("✅ VALID")
+            return True, lines
+        lines.append("❌ INVALID")
+        lines.append(f"Error: {error_msg}")
+
+    except json.JSONDecodeError as e:
+        lines.append("❌ INVALID JSON")
+        lines.append(f"JSON Error: {e}")
+    except FileNotFoundError:
+        lines.append("❌ FILE NOT FOUND")
+    return False, lines
+
+def _file_digest(example_file: Path):
+    """Hash of the file's content, or None if it cannot be read."""
+    try:
+        return hashlib.blake2b(example_file.read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+def load_validation_cache():
+    """Load the keys of examples found valid by earlier runs."""
+    try:
+        with open(VALIDATION_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return set()
+
+def save_validation_cache(validated):
+    """Persist the keys of examples found valid."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(VALIDATION_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(sorted(validated), f)
+    except OSError as e:
+        print(f"Could not save validation cache: {e}")
+
+# Validator of each worker process, built once by _init_worker
+_worker_validator = None
+
+def _init_worker(schema, strict: bool):
+    """Build the validator in a worker process; compiled validators cannot be pickled."""
+    global _worker_validator
+    _worker_validator = create_validator(schema, strict)
+
+def _validate_in_worker(example_file: Path):
+    """Validate one example file with the worker's validator."""
+    return validate_example_file(example_file, _worker_validator)
+
+def validate_examples(strict: bool = False):
+    """
+    Validate all example JSON files against the schema.
+
+    Examples whose content was already found valid against the same schema
+    are not validated again. Large example sets are split across worker
+    processes. Each worker builds its validator once from the schema, which
+    is cheap after the parent has cached the generated validator code.
+    """
+    schema = load_schema(STRICT_SCHEMA_PATH) if strict else load_schema()
+    validator = create_validator(schema, strict)
+    examples_dir = SCHEMA_DIR / "examples"
     
-    if not examples_dir.exists():
+    # scandir reports file types from the directory listing itself, so the
+    # files are not stat'ed one by one (costly on network filesystems)
+    try:
+        with os.scandir(examples_dir) as entries:
+            example_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+    except FileNotFoundError:
         print(f"Examples directory not found: {examples_dir}")
         return
     
-    example_files = list(examples_dir.glob("*.json"))
     if not example_files:
         print("No JSON example files found")
         return
@@ -39,46 +219,64 @@ def validate_examples():
     
     valid_count = 0
     total_count = len(example_files)
+
+    # Entries of other schemas and validators are kept; those for this one
+    # are rebuilt from the current files so stale hashes drop out
+    key_prefix = f"{'strict' if strict else 'fast'}:{schema_hash(schema)}:"
+    cached_keys = load_validation_cache()
+    validated = {key for key in cached_keys if not key.startswith(key_prefix)}
+    keys = {}
+    for example_file in example_files:
+        digest = _file_digest(example_file)
+        keys[example_file] = key_prefix + digest if digest else None
+
+    results = {
+        example_file: (True, [f"\nValidating: {example_file.name}", "-" * 40, "✅ VALID (cached)"])
+        for example_file in example_files if keys[example_file] in cached_keys
+    }
+    pending = [example_file for example_file in example_files if example_file not in results]
+    if len(pending) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(schema, strict)) as executor:
+            results.update(zip(pending, executor.map(_validate_in_worker, pending, chunksize=8)))
+    else:
+        results.update((example_file, validate_example_file(example_file, validator)) for example_file in pending)
+
+    validated.update(keys[f] for f in example_files if results[f][0] and keys[f])
+    if validated != cached_keys:
+        save_validation_cache(validated)
+
+    # The report is written in one go rather than print() per line
+    output = []
+    for example_file in example_files:
+        is_valid, lines = results[example_file]
+        output.extend(line + "\n" for line in lines)
+        if is_valid:
+            valid_count += 1
     
-    for example_file in sorted(example_files):
-        print(f"\nValidating: {example_file.name}")
-        print("-" * 40)
-        
-        try:
-            with open(example_file, 'r', encoding='utf-8') as f:
-                composition_data = json.load(f)
-            
-            is_valid, error_msg = validate_composition(composition_data, schema)
-            
-            if is_valid:
-                print("✅ VALID")
-                valid_count += 1
-            else:
-                print("❌ INVALID")
-                print(f"Error: {error_msg}")
-                
-        except json.JSONDecodeError as e:
-            print("❌ INVALID JSON")
-            print(f"JSON Error: {e}")
-        except FileNotFoundError:
-            print("❌ FILE NOT FOUND")
-    
-    print("\n" + "=" * 60)
-    print(f"Summary: {valid_count}/{total_count} examples are valid")
+    output.append("\n" + "=" * 60 + "\n")
+    output.append(f"Summary: {valid_count}/{total_count} examples are valid\n")
     
-    if valid_count == total_count:
-        print("🎉 All examples pass schema validation!")
-        return True
+    success = valid_count == total_count
+    if success:
+        output.append("🎉 All examples pass schema validation!\n")
     else:
-        print(f"⚠️  {total_count - valid_count} examples have validation errors")
-        return False
+        output.append(f"⚠️  {total_count - valid_count} examples have validation errors\n")
+    sys.stdout.writelines(output)
+    return success
 
 def main():
     """Main function to run validation."""
+    parser = argparse.ArgumentParser(description="Validate the example compositions against the JSON schema.")
+    parser.add_argument(
+        "--strict", action="store_true",
+        help="Validate the oneOf form of the schema with jsonschema's full draft 2020-12 implementation instead of the compiled fastjsonschema validator",
+    )
+    args = parser.parse_args()
+
     print("JSON Schema Validation for Declarative MoviePy Examples")
     print("=" * 60)
     
-    success = validate_examples()
+    success = validate_examples(args.strict)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
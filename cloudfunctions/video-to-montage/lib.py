@@ -1,17 +1,33 @@
+import functools
+import gzip
+import io
 import logging
 import json
 import time
 import tempfile
 import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core.exceptions import NotFound, PreconditionFailed
 from google.cloud import storage
-import re
+from google.cloud.storage.retry import DEFAULT_RETRY
 from google import genai
 from google.genai import types
 from pathlib import Path
+import requests
 
 from declarativemoviepy.declarativemoviepy.validator import validate_composition_json, SchemaValidationError
 from declarativemoviepy.declarativemoviepy.main import render_from_json
-from declarativemoviepy.declarativemoviepy.gcs_utils import download_gcs_file, get_video_metadata, get_image_metadata
+from declarativemoviepy.declarativemoviepy.gcs_utils import (
+    download_gcs_file,
+    get_gcs_video_metadata,
+    get_image_metadata,
+    get_image_size,
+    get_video_metadata,
+    get_video_metadata_from_bytes,
+    parse_gcs_uri,
+)
 
 # Set up Cloud Run compatible logging
 def setup_logging():
@@ -27,6 +43,91 @@ def setup_logging():
 
 setup_logging()
 
+# Gemini analyses are network-bound, so assets are analyzed concurrently
+ANALYSIS_MAX_WORKERS = 16
+# Metadata extraction downloads and probes assets in parallel
+METADATA_MAX_WORKERS = 8
+# Videos in these containers are probed from their headers with ranged reads
+MP4_EXTENSIONS = ('.mp4', '.m4v', '.mov')
+# Other videos up to this size are probed in memory instead of from a temp file
+METADATA_IN_MEMORY_MAX_BYTES = 32 * 1024 * 1024
+# Image dimensions are read from this many leading bytes
+IMAGE_HEADER_BYTES = 256 * 1024
+
+# Rate limits and server errors are retried by the client with jittered exponential backoff
+GENAI_RETRY_OPTIONS = types.HttpRetryOptions(attempts=4, initial_delay=1.0, max_delay=16.0, exp_base=2, jitter=1)
+
+# Compositions that rendered are cached by their generation inputs, by default
+# in the output bucket
+MONTAGE_CACHE_BUCKET = os.getenv('MONTAGE_CACHE_BUCKET')
+MONTAGE_CACHE_PREFIX = "montage_cache"
+
+# Connections kept open by the storage client, enough for all parallel workers
+STORAGE_HTTP_POOL_SIZE = 16
+
+# Uploads smaller than this are not worth compressing
+GZIP_MIN_BYTES = 4096
+
+# Analyses are cached in GCS, by default next to the analyzed asset
+ANALYSIS_CACHE_BUCKET = os.getenv('ANALYSIS_CACHE_BUCKET')
+ANALYSIS_CACHE_PREFIX = "analyses"
+# The static schema/examples prompt is kept in a Vertex AI context cache
+PROMPT_CACHE_TTL_SECONDS = 3600
+# Failed cache creations (e.g. prompts below the minimum size) are retried after this long
+PROMPT_CACHE_RETRY_SECONDS = 300
+
+VIDEO_ANALYSIS_MODEL = "gemini-2.5-pro"
+VIDEO_ANALYSIS_PROMPT = """
+Analyze the provided video and generate a JSON object with three keys: "video_analysis", "promo_segments", and "photo_opportunities".
+
+1.  "video_analysis": A list of objects, each with a "timestamp" (MM:SS) and a "description" of the visual content at that time. If speech is present, include a "speech" key.
+2.  "promo_segments": A list of objects representing compelling segments for a promotional video. Each object should have "start_timestamp" (MM:SS), "end_timestamp" (MM:SS), and a "description" of why it's a good segment.
+3.  "photo_opportunities": A list of objects identifying timestamps with good potential for still photos. Each object should have a "timestamp" (MM:SS), a "description" of the frame, and a list of "arrangement_options". Each "arrangement_option" should have a "title" and a "prompt" for an AI image generator to enhance or virtually stage the photo.
+
+The output MUST be a valid JSON object. Do not include any text before or after the JSON object.
+"""
+
+PHOTO_ANALYSIS_MODEL = "gemini-2.5-flash"
+PHOTO_ANALYSIS_PROMPT = "Provide a concise, one-sentence description of this image."
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Context cache names keyed by a hash of model and prompt, with their local expiry time
+_prompt_caches = {}
+_prompt_caches_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _get_genai_client(location: str) -> genai.Client:
+    """
+    Returns a process-wide Vertex AI client for the given location.
+    
+    Building a client resolves credentials and opens a connection pool, so it is
+    done once per instance and reused across requests.
+    """
+    return genai.Client(
+        vertexai=True,
+        project="bounti-prod-322900",
+        location=location,
+        http_options=types.HttpOptions(retry_options=GENAI_RETRY_OPTIONS),
+    )
+
+@functools.lru_cache(maxsize=1)
+def _get_storage_client() -> storage.Client:
+    """
+    Returns a process-wide storage client.
+    
+    Its HTTP session keeps enough pooled connections for the parallel probes,
+    cache lookups and uploads of a request to reuse connections instead of
+    opening new ones.
+    """
+    client = storage.Client()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=STORAGE_HTTP_POOL_SIZE, pool_maxsize=STORAGE_HTTP_POOL_SIZE, max_retries=3
+    )
+    client._http.mount("https://", adapter)
+    return client
+
+@functools.lru_cache(maxsize=1)
 def _load_json_schema() -> str:
     """Load the JSON schema from the declarativemoviepy directory."""
     schema_path = Path(__file__).parent / "declarativemoviepy" / "composition_schema.json"
@@ -41,6 +142,7 @@ def _load_json_schema() -> str:
         logging.warning(f"Failed to load schema: {e}, continuing without schema in prompt")
         return ""
 
+@functools.lru_cache(maxsize=1)
 def _load_example_compositions() -> str:
     """Load example compositions from the declarativemoviepy examples directory."""
     examples_dir = Path(__file__).parent / "declarativemoviepy" / "examples"
@@ -63,38 +165,115 @@ def _load_example_compositions() -> str:
     
     return "\n".join(examples)
 
+# The schema and examples are static, so they are loaded once per process
+_JSON_SCHEMA_STR = _load_json_schema()
+_EXAMPLE_COMPOSITIONS_STR = _load_example_compositions()
+
+# The montage system prompt only embeds static content, so it is formatted once
+_MONTAGE_SYSTEM_PROMPT = f"""
+You are a creative video editor responsible for creating a declarative JSON definition for a video montage.
+Based on the provided analysis of video and photo assets, and following the user's creative direction, you will generate a JSON object that conforms to the declarativemoviepy schema.
+
+The output MUST be a valid JSON object. Do not include any text, code block markers, or explanations before or after the JSON object.
+
+IMPORTANT: You must strictly follow the JSON schema provided below. The schema defines all valid clip types, effects, and properties.
+
+## JSON Schema for Declarative MoviePy Compositions:
+
+{_JSON_SCHEMA_STR}
+
+## Key Schema Rules:
+- The root object requires `output_path` and `clip` properties
+- All clip types must have a `type` property matching one of the defined constants
+- Common clip properties: `start`, `position`, `duration`, `effects`
+- Position arrays use format: [x, y] where x/y can be numbers or strings like "center"
+- Effects must match the defined effect types with their specific properties
+- Use subclip effect for video segments: {{"type": "subclip", "t_start": <seconds>, "t_end": <seconds>}}
+
+## Available Music Tracks:
+- gs://real-estate-videos/montages_music/Call me crazy - Patrick Patrikios.mp3
+- gs://real-estate-videos/montages_music/City lights - Patrick Patrikios.mp3
+- gs://real-estate-videos/montages_music/Cruise control - Patrick Patrikios.mp3
+- gs://real-estate-videos/montages_music/Down The Rabbit Hole - The Grey Room _ Density & Time.mp3
+- gs://real-estate-videos/montages_music/Last laugh - Patrick Patrikios.mp3
+- gs://real-estate-videos/montages_music/On The Flip - The Grey Room _ Density & Time.mp3
+- gs://real-estate-videos/montages_music/Twinkle - The Grey Room _ Density & Time.mp3
+
+## Example Compositions:
+
+{_EXAMPLE_COMPOSITIONS_STR}
+
+Your task is to assemble clips that conform to the schema into a coherent and engaging montage based on the user's request.
+"""
+
 def _upload_to_gcs(bucket_name, blob_name, data):
     """Uploads data to a GCS bucket."""
-    client = storage.Client()
+    client = _get_storage_client()
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(blob_name)
-    blob.upload_from_string(data, content_type='application/json')
+    if len(data) >= GZIP_MIN_BYTES:
+        # JSON compresses very well; GCS transparently decompresses it for readers
+        data = gzip.compress(data.encode('utf-8'))
+        blob.content_encoding = 'gzip'
+    # Overwriting with the same content is idempotent, so the upload is always retried
+    blob.upload_from_string(data, content_type='application/json', retry=DEFAULT_RETRY)
     logging.info(f"Uploaded to gs://{bucket_name}/{blob_name}")
     return f"gs://{bucket_name}/{blob_name}"
 
+def _extract_json_object(text: str) -> dict:
+    """
+    Parses the JSON object in a model response, ignoring markdown code fences
+    and any text around the object.
+    """
+    text = text.strip().removeprefix("```json").removeprefix("```").removesuffix("```")
+    start_index = text.find('{')
+    if start_index == -1:
+        raise ValueError("No JSON object found in model response")
+    obj, _ = _JSON_DECODER.raw_decode(text, start_index)
+    return obj
+
+def _generate_json_object(client, model: str, contents, config=None) -> tuple:
+    """
+    Streams a Gemini response and parses the JSON object in it.
+    
+    Parsing is attempted as chunks arrive, so the stream is closed as soon as the
+    root object is complete instead of waiting for any trailing output.
+    Returns the parsed object and the response text received so far.
+    """
+    text = ""
+    stream = client.models.generate_content_stream(model=model, contents=contents, config=config)
+    try:
+        for chunk in stream:
+            chunk_text = chunk.text
+            if not chunk_text:
+                continue
+            text += chunk_text
+            # The root object can only have been completed by a chunk with a closing brace
+            if '}' not in chunk_text:
+                continue
+            try:
+                return _extract_json_object(text), text
+            except ValueError:
+                continue
+    finally:
+        stream.close()
+    return _extract_json_object(text), text
+
 def _timestamp_to_seconds(ts: str) -> float:
     """Converts MM:SS or HH:MM:SS timestamp to seconds."""
-    parts = list(map(int, ts.split(':')))
-    if len(parts) == 2:
-        return float(parts[0] * 60 + parts[1])
-    elif len(parts) == 3:
-        return float(parts[0] * 3600 + parts[1] * 60 + parts[2])
+    separators = ts.count(':')
+    if separators == 1:
+        minutes, seconds = ts.split(':', 1)
+        return float(int(minutes) * 60 + int(seconds))
+    if separators == 2:
+        hours, minutes, seconds = ts.split(':', 2)
+        return float(int(hours) * 3600 + int(minutes) * 60 + int(seconds))
     return 0.0
 
-def _analyze_video(gcs_uri: str) -> dict:
+def _run_video_analysis(gcs_uri: str) -> dict:
     """Analyzes a video using Gemini."""
     logging.info(f"Analyzing video: {gcs_uri}")
-    client = genai.Client(vertexai=True, project="bounti-prod-322900", location='us-central1')
-
-    prompt = """
-Analyze the provided video and generate a JSON object with three keys: "video_analysis", "promo_segments", and "photo_opportunities".
-
-1.  "video_analysis": A list of objects, each with a "timestamp" (MM:SS) and a "description" of the visual content at that time. If speech is present, include a "speech" key.
-2.  "promo_segments": A list of objects representing compelling segments for a promotional video. Each object should have "start_timestamp" (MM:SS), "end_timestamp" (MM:SS), and a "description" of why it's a good segment.
-3.  "photo_opportunities": A list of objects identifying timestamps with good potential for still photos. Each object should have a "timestamp" (MM:SS), a "description" of the frame, and a list of "arrangement_options". Each "arrangement_option" should have a "title" and a "prompt" for an AI image generator to enhance or virtually stage the photo.
-
-The output MUST be a valid JSON object. Do not include any text before or after the JSON object.
-"""
+    client = _get_genai_client('us-central1')
 
     video_part = types.Part(
         file_data=types.FileData(mime_type="video/mp4", file_uri=gcs_uri)
@@ -103,117 +282,239 @@ The output MUST be a valid JSON object. Do not include any text before or after
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            response = client.models.generate_content(
-                model="gemini-2.5-pro",
-                contents=[prompt, video_part],
+            analysis_result, _ = _generate_json_object(
+                client,
+                model=VIDEO_ANALYSIS_MODEL,
+                contents=[VIDEO_ANALYSIS_PROMPT, video_part],
             )
-           
-            text_response = response.text
-            # Robust JSON parsing
-            match = re.search(r'```json\s*([\s\S]*?)\s*```', text_response)
-            if match:
-                json_str = match.group(1)
-            else:
-                start_index = text_response.find('{')
-                end_index = text_response.rfind('}')
-                if start_index != -1 and end_index != -1 and start_index < end_index:
-                    json_str = text_response[start_index:end_index+1]
-                else:
-                    json_str = text_response
-           
-            analysis_result = json.loads(json_str)
             analysis_result['source'] = gcs_uri
             analysis_result['analysis_type'] = 'video'
             return analysis_result
-        except Exception as e:
+        except ValueError as e:
+            # Malformed JSON output; asking again usually fixes it
             logging.warning(f"Attempt {attempt + 1} to analyze video {gcs_uri} failed: {e}")
-            if attempt + 1 == max_retries:
-                logging.error(f"Failed to analyze video {gcs_uri} after {max_retries} attempts.")
-                return {"analysis_type": "video", "source": gcs_uri, "promo_segments": [], "photo_opportunities": [], "error": str(e)}
-            time.sleep(2 ** attempt)
-    return {"analysis_type": "video", "source": gcs_uri, "promo_segments": [], "photo_opportunities": [], "error": "Max retries exceeded"}
+            error = e
+        except Exception as e:
+            # Transient API errors have already been retried by the client
+            logging.error(f"Failed to analyze video {gcs_uri}: {e}")
+            return {"analysis_type": "video", "source": gcs_uri, "promo_segments": [], "photo_opportunities": [], "error": str(e)}
+    logging.error(f"Failed to analyze video {gcs_uri} after {max_retries} attempts.")
+    return {"analysis_type": "video", "source": gcs_uri, "promo_segments": [], "photo_opportunities": [], "error": str(error)}
 
-def _extract_asset_metadata(assets: list) -> dict:
+def _probe_remote_metadata(gcs_uri: str) -> dict:
     """
-    Downloads assets and extracts metadata (duration, resolution) for each asset.
-    Returns a dictionary mapping GCS URIs to their metadata.
+    Reads video metadata from the MP4/MOV headers on GCS, without downloading the video.
+    Returns None when the headers cannot be used and the file must be downloaded instead.
     """
-    asset_metadata = {}
-    temp_dir = tempfile.mkdtemp(prefix="asset_metadata_")
-    
+    if not gcs_uri.lower().endswith(MP4_EXTENSIONS):
+        return None
     try:
-        for asset in assets:
-            gcs_uri = asset.get("gcs_uri")
-            asset_type = asset.get("type")
+        return get_gcs_video_metadata(gcs_uri)
+    except ValueError as e:
+        logging.info(f"Falling back to a download to probe {gcs_uri}: {e}")
+        return None
+
+def _probe_downloaded_video(gcs_uri: str, temp_dir: str) -> dict:
+    """
+    Downloads a video and extracts its metadata. Videos small enough to hold
+    in memory are probed from the downloaded bytes, without touching the disk.
+    """
+    bucket_name, blob_name = parse_gcs_uri(gcs_uri)
+    blob = _get_storage_client().bucket(bucket_name).get_blob(blob_name)
+    if blob is None:
+        raise FileNotFoundError(f"GCS object not found: {gcs_uri}")
+    if blob.size is not None and blob.size <= METADATA_IN_MEMORY_MAX_BYTES:
+        try:
+            return get_video_metadata_from_bytes(blob.download_as_bytes())
+        except Exception as e:
+            logging.warning(f"In-memory probe failed for {gcs_uri}, falling back to a file: {e}")
+    return get_video_metadata(download_gcs_file(gcs_uri, temp_dir))
+
+def _probe_image(gcs_uri: str) -> dict:
+    """
+    Extracts image metadata from the start of the file, which holds the header
+    for virtually all images, and only downloads the whole image if needed.
+    """
+    bucket_name, blob_name = parse_gcs_uri(gcs_uri)
+    blob = _get_storage_client().bucket(bucket_name).blob(blob_name)
+    try:
+        width, height = get_image_size(io.BytesIO(blob.download_as_bytes(start=0, end=IMAGE_HEADER_BYTES - 1)))
+        return {"width": width, "height": height}
+    except NotFound:
+        raise
+    except Exception:
+        return get_image_metadata(io.BytesIO(blob.download_as_bytes()))
+
+def _probe_one(asset: dict, temp_dir: str) -> tuple:
+    """
+    Extracts the metadata of a single asset, downloading it into temp_dir when needed.
+    Returns a (gcs_uri, metadata) tuple.
+    """
+    gcs_uri = asset["gcs_uri"]
+    asset_type = asset["type"]
+    try:
+        if asset_type == "video":
+            metadata = _probe_remote_metadata(gcs_uri)
+            if metadata is None:
+                metadata = _probe_downloaded_video(gcs_uri, temp_dir)
+            asset_metadata = {
+                "type": "video",
+                "duration": metadata.get("duration", 0),
+                "width": metadata.get("width", 0),
+                "height": metadata.get("height", 0),
+                "fps": metadata.get("fps", 24),
+            }
+        elif asset_type == "photo":
+            metadata = _probe_image(gcs_uri)
+            asset_metadata = {
+                "type": "image",
+                "width": metadata.get("width", 0),
+                "height": metadata.get("height", 0),
+            }
+        else:
+            raise ValueError(f"Unsupported asset type '{asset_type}'")
             
-            if not gcs_uri or not asset_type:
-                continue
-                
-            try:
-                local_path = download_gcs_file(gcs_uri, temp_dir)
-                
-                if asset_type == "video":
-                    metadata = get_video_metadata(local_path)
-                    asset_metadata[gcs_uri] = {
-                        "type": "video",
-                        "duration": metadata.get("duration", 0),
-                        "width": metadata.get("width", 0),
-                        "height": metadata.get("height", 0),
-                        "fps": metadata.get("fps", 24),
-                    }
-                elif asset_type == "photo":
-                    metadata = get_image_metadata(local_path)
-                    asset_metadata[gcs_uri] = {
-                        "type": "image",
-                        "width": metadata.get("width", 0),
-                        "height": metadata.get("height", 0),
-                    }
-                    
-                logging.info(f"Extracted metadata for {gcs_uri}: {asset_metadata[gcs_uri]}")
-                
-            except Exception as e:
-                logging.warning(f"Failed to extract metadata for {gcs_uri}: {e}")
-                asset_metadata[gcs_uri] = {"type": asset_type, "error": str(e)}
-                
-    finally:
-        # Clean up temporary directory
-        import shutil
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
-            logging.info(f"Cleaned up metadata extraction temp directory: {temp_dir}")
+        logging.info(f"Extracted metadata for {gcs_uri}: {asset_metadata}")
+        return gcs_uri, asset_metadata
+        
+    except Exception as e:
+        logging.warning(f"Failed to extract metadata for {gcs_uri}: {e}")
+        return gcs_uri, {"type": asset_type, "error": str(e)}
+
+def _extract_asset_metadata(assets: list, temp_dir: str = None) -> dict:
+    """
+    Extracts metadata (duration, resolution) for each asset, only writing large
+    non-MP4 videos to temp_dir, or to a temporary directory of its own.
+    Returns a dictionary mapping GCS URIs to their metadata.
+    """
+    if temp_dir is None:
+        with tempfile.TemporaryDirectory(prefix="asset_metadata_") as temp_dir:
+            return _extract_asset_metadata(assets, temp_dir)
+
+    asset_metadata = {}
+    # Assets listed more than once are only probed once
+    unique_assets = {}
+    for asset in assets:
+        if asset.get("gcs_uri") and asset.get("type"):
+            unique_assets.setdefault(asset["gcs_uri"], asset)
+    valid_assets = list(unique_assets.values())
+    if valid_assets:
+        with ThreadPoolExecutor(max_workers=min(METADATA_MAX_WORKERS, len(valid_assets))) as executor:
+            # Each asset gets its own subdirectory, so assets with the
+            # same file name in different buckets/folders cannot collide
+            futures = [
+                executor.submit(_probe_one, asset, os.path.join(temp_dir, f"asset_metadata_{i}"))
+                for i, asset in enumerate(valid_assets)
+            ]
+            for future in futures:
+                gcs_uri, metadata = future.result()
+                asset_metadata[gcs_uri] = metadata
     
     return asset_metadata
 
 
-def _analyze_photo(gcs_uri: str) -> dict:
+def _run_photo_analysis(gcs_uri: str) -> dict:
     """Analyzes a photo using Gemini."""
     logging.info(f"Analyzing photo: {gcs_uri}")
-    client = genai.Client(vertexai=True, project="bounti-prod-322900", location='global')
-    prompt = "Provide a concise, one-sentence description of this image."
-    
+    client = _get_genai_client('global')
     image_part = types.Part(
         file_data=types.FileData(mime_type="image/png", file_uri=gcs_uri)
     )
     
-    max_retries = 3
-    for attempt in range(max_retries):
+    try:
+        # Transient API errors are retried by the client
+        response = client.models.generate_content(
+            model=PHOTO_ANALYSIS_MODEL,
+            contents=[PHOTO_ANALYSIS_PROMPT, image_part]
+        )
+        return {
+            "analysis_type": "photo", 
+            "source": gcs_uri, 
+            "description": response.text.strip()
+        }
+    except Exception as e:
+        logging.error(f"Failed to analyze photo {gcs_uri}: {e}")
+        return {"analysis_type": "photo", "source": gcs_uri, "description": "Analysis failed.", "error": str(e)}
+
+def _analysis_cache_blob(gcs_uri: str, model: str, prompt: str):
+    """
+    Returns the GCS blob caching the analysis of gcs_uri with this model and prompt.
+    The key includes the object generation, so an overwritten asset is analyzed again.
+    Returns None if the asset cannot be looked up.
+    """
+    bucket_name, blob_name = parse_gcs_uri(gcs_uri)
+    client = _get_storage_client()
+    source_blob = client.bucket(bucket_name).get_blob(blob_name)
+    if source_blob is None:
+        return None
+    key = hashlib.sha1(f"{gcs_uri}#{source_blob.generation}\n{model}\n{prompt}".encode("utf-8")).hexdigest()
+    cache_bucket = client.bucket(ANALYSIS_CACHE_BUCKET or bucket_name)
+    return cache_bucket.blob(f"{ANALYSIS_CACHE_PREFIX}/{key}.json")
+
+def _cached_gemini(gcs_uri: str, model: str, prompt: str, fn) -> dict:
+    """
+    Returns the cached Gemini analysis of gcs_uri, or calls fn() and caches its result.
+    Failed analyses are not cached, and cache errors never fail the analysis.
+    """
+    cache_blob = None
+    try:
+        cache_blob = _analysis_cache_blob(gcs_uri, model, prompt)
+        if cache_blob is not None:
+            analysis = json.loads(cache_blob.download_as_bytes())
+            logging.info(f"Using cached analysis for {gcs_uri}")
+            return analysis
+    except NotFound:
+        pass
+    except Exception as e:
+        logging.warning(f"Failed to read cached analysis for {gcs_uri}: {e}")
+
+    analysis = fn()
+    if cache_blob is not None and "error" not in analysis:
         try:
-            response = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=[prompt, image_part]
+            # Concurrent requests may race to fill the same entry; the first one wins
+            cache_blob.upload_from_string(json.dumps(analysis), content_type='application/json', if_generation_match=0)
+        except PreconditionFailed:
+            pass
+        except Exception as e:
+            logging.warning(f"Failed to cache analysis for {gcs_uri}: {e}")
+    return analysis
+
+def _analyze_video(gcs_uri: str) -> dict:
+    """Analyzes a video using Gemini, reusing a previous analysis of the same object."""
+    return _cached_gemini(gcs_uri, VIDEO_ANALYSIS_MODEL, VIDEO_ANALYSIS_PROMPT, lambda: _run_video_analysis(gcs_uri))
+
+def _analyze_photo(gcs_uri: str) -> dict:
+    """Analyzes a photo using Gemini, reusing a previous analysis of the same object."""
+    return _cached_gemini(gcs_uri, PHOTO_ANALYSIS_MODEL, PHOTO_ANALYSIS_PROMPT, lambda: _run_photo_analysis(gcs_uri))
+
+def _analyze_asset(asset: dict) -> dict:
+    """Analyzes a video or photo asset with the matching Gemini prompt."""
+    if asset["type"] == "video":
+        return _analyze_video(asset["gcs_uri"])
+    return _analyze_photo(asset["gcs_uri"])
+
+def _get_prompt_cache(client, model: str, text: str):
+    """
+    Returns the name of a Vertex AI context cache holding text, creating it when needed.
+    Returns None if caching is unavailable, in which case the text is sent inline.
+    """
+    key = hashlib.sha1(f"{model}\n{text}".encode("utf-8")).hexdigest()
+    with _prompt_caches_lock:
+        entry = _prompt_caches.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        try:
+            cache = client.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(contents=[text], ttl=f"{PROMPT_CACHE_TTL_SECONDS}s"),
             )
-            return {
-                "analysis_type": "photo", 
-                "source": gcs_uri, 
-                "description": response.text.strip()
-            }
+            # Stop using the cache a little before it expires on the server
+            _prompt_caches[key] = (cache.name, time.monotonic() + PROMPT_CACHE_TTL_SECONDS - PROMPT_CACHE_RETRY_SECONDS)
+            logging.info(f"Created context cache {cache.name}")
         except Exception as e:
-            logging.warning(f"Attempt {attempt + 1} to analyze photo {gcs_uri} failed: {e}")
-            if attempt + 1 == max_retries:
-                logging.error(f"Failed to analyze photo {gcs_uri} after {max_retries} attempts.")
-                return {"analysis_type": "photo", "source": gcs_uri, "description": "Analysis failed.", "error": str(e)}
-            time.sleep(2 ** attempt)
-    return {"analysis_type": "photo", "source": gcs_uri, "description": "Analysis failed.", "error": "Max retries exceeded"}
+            logging.warning(f"Failed to create context cache, sending the prompt inline: {e}")
+            _prompt_caches[key] = (None, time.monotonic() + PROMPT_CACHE_RETRY_SECONDS)
+        return _prompt_caches[key][0]
 
 def _fix_montage_json(
    current_json: dict,
@@ -227,11 +528,7 @@ def _fix_montage_json(
    """Fixes a montage JSON based on rendering error feedback using Gemini."""
    logging.info("Fixing montage JSON based on error feedback via LLM")
 
-   client = genai.Client(vertexai=True, project="bounti-prod-322900", location='us-central1')
-
-   # Load the JSON schema and examples
-   json_schema = _load_json_schema()
-   example_compositions = _load_example_compositions()
+   client = _get_genai_client('us-central1')
 
    system_prompt = f"""
 You are a video rendering expert responsible for fixing a broken declarativemoviepy JSON composition.
@@ -251,11 +548,11 @@ IMPORTANT: You must strictly follow the JSON schema provided below. The output M
 
 ## JSON Schema for Declarative MoviePy Compositions:
 
-{json_schema}
+{_JSON_SCHEMA_STR}
 
 ## Example Compositions:
 
-{example_compositions}
+{_EXAMPLE_COMPOSITIONS_STR}
 
 Please analyze the error and return a FIXED version of the JSON composition. Only return the JSON, no explanations.
 """
@@ -274,27 +571,12 @@ Please fix this JSON composition to resolve the rendering error. Return only the
    max_retries = 2
    for attempt in range(max_retries):
        try:
-           response = client.models.generate_content(
+           fixed_json, _ = _generate_json_object(
+               client,
                model="gemini-2.5-pro",
                contents=[system_prompt, user_prompt],
            )
 
-           text_response = response.text
-           # The response should be JSON, but in case it's wrapped in markdown
-           match = re.search(r'```json\s*([\s\S]*?)\s*```', text_response)
-           if match:
-               json_str = match.group(1)
-           else:
-               # Robustly find JSON object
-               start_index = text_response.find('{')
-               end_index = text_response.rfind('}')
-               if start_index != -1 and end_index != -1 and start_index < end_index:
-                   json_str = text_response[start_index:end_index+1]
-               else:
-                   json_str = text_response
-
-           fixed_json = json.loads(json_str)
-
            # Ensure required fields are present
            fixed_json.setdefault("output_path", "montage.mp4")
            fixed_json.setdefault("size", resolution or [1920, 1080])
@@ -302,7 +584,8 @@ Please fix this JSON composition to resolve the rendering error. Return only the
 
            return fixed_json
 
-       except Exception as e:
+       except ValueError as e:
+           # Malformed JSON output; transient API errors were already retried by the client
            logging.warning(f"Attempt {attempt + 1} to fix montage JSON failed: {e}")
            if attempt + 1 == max_retries:
                logging.error(f"Failed to fix montage JSON after {max_retries} attempts.")
@@ -316,66 +599,18 @@ def _generate_montage_json(
    prompt: str = None,
    length: int = None,
    resolution: list = None,
-) -> dict:
-    """Generates a declarative montage JSON from analyses using Gemini."""
+) -> tuple[dict, bool]:
+    """
+    Generates a declarative montage JSON from analyses using Gemini.
+    Returns the JSON and whether Gemini generated it; when it couldn't, the JSON
+    is a fallback clip showing the error, which must not be cached.
+    """
     logging.info("Generating montage JSON from analyses via LLM")
 
     if not analyses:
-        return {
-            "output_path": "montage.mp4",
-            "size": resolution or [1920, 1080],
-            "fps": 24,
-            "clip": {
-                "type": "text",
-                "text": "No assets provided to generate montage.",
-                "font_size": 50,
-                "color": "white",
-                "duration": 5,
-                "size": resolution or [1920, 1080],
-            },
-        }
-
-    client = genai.Client(vertexai=True, project="bounti-prod-322900", location='us-central1')
-
-    # Load the JSON schema and examples
-    json_schema = _load_json_schema()
-    example_compositions = _load_example_compositions()
-
-    system_prompt = f"""
-You are a creative video editor responsible for creating a declarative JSON definition for a video montage.
-Based on the provided analysis of video and photo assets, and following the user's creative direction, you will generate a JSON object that conforms to the declarativemoviepy schema.
-
-The output MUST be a valid JSON object. Do not include any text, code block markers, or explanations before or after the JSON object.
-
-IMPORTANT: You must strictly follow the JSON schema provided below. The schema defines all valid clip types, effects, and properties.
-
-## JSON Schema for Declarative MoviePy Compositions:
+        return _error_montage_json("No assets provided to generate montage.", resolution), False
 
-{json_schema}
-
-## Key Schema Rules:
-- The root object requires `output_path` and `clip` properties
-- All clip types must have a `type` property matching one of the defined constants
-- Common clip properties: `start`, `position`, `duration`, `effects`
-- Position arrays use format: [x, y] where x/y can be numbers or strings like "center"
-- Effects must match the defined effect types with their specific properties
-- Use subclip effect for video segments: {{"type": "subclip", "t_start": <seconds>, "t_end": <seconds>}}
-
-## Available Music Tracks:
-- gs://real-estate-videos/montages_music/Call me crazy - Patrick Patrikios.mp3
-- gs://real-estate-videos/montages_music/City lights - Patrick Patrikios.mp3
-- gs://real-estate-videos/montages_music/Cruise control - Patrick Patrikios.mp3
-- gs://real-estate-videos/montages_music/Down The Rabbit Hole - The Grey Room _ Density & Time.mp3
-- gs://real-estate-videos/montages_music/Last laugh - Patrick Patrikios.mp3
-- gs://real-estate-videos/montages_music/On The Flip - The Grey Room _ Density & Time.mp3
-- gs://real-estate-videos/montages_music/Twinkle - The Grey Room _ Density & Time.mp3
-
-## Example Compositions:
-
-{example_compositions}
-
-Your task is to assemble clips that conform to the schema into a coherent and engaging montage based on the user's request.
-"""
+    client = _get_genai_client('us-central1')
 
     # Extract the list of provided asset URIs
     provided_assets = [asset.get("source") for asset in analyses if asset.get("source")]
@@ -413,38 +648,30 @@ Your task is to assemble clips that conform to the schema into a coherent and en
     else:
         resolution = [1920, 1080]  # default
 
-    validation_error_feedback = None
+    # The system prompt is the same for every request, so it is served from a context cache
+    cache_name = _get_prompt_cache(client, "gemini-2.5-pro", _MONTAGE_SYSTEM_PROMPT)
+
+    # Validation failures are fed back as follow-up turns, so retries add a short
+    # correction instead of resending the whole prompt with the feedback appended
+    user_prompt = "\n\n".join(base_user_prompt_parts)
+    if cache_name:
+        contents = [user_prompt]
+        config = types.GenerateContentConfig(cached_content=cache_name)
+    else:
+        contents = [_MONTAGE_SYSTEM_PROMPT, user_prompt]
+        config = None
+
     last_exception = None
     max_retries = 3
     for attempt in range(max_retries):
-        user_prompt_parts = base_user_prompt_parts.copy()
-        if validation_error_feedback:
-            user_prompt_parts.append(validation_error_feedback)
-        
-        user_prompt = "\n\n".join(user_prompt_parts)
-
         try:
-            response = client.models.generate_content(
+            montage_json, response_text = _generate_json_object(
+                client,
                 model="gemini-2.5-pro",
-                contents=[system_prompt, user_prompt],
+                contents=contents,
+                config=config,
             )
 
-            text_response = response.text
-            # The response should be JSON, but in case it's wrapped in markdown
-            match = re.search(r'```json\s*([\s\S]*?)\s*```', text_response)
-            if match:
-                json_str = match.group(1)
-            else:
-                # Robustly find JSON object
-                start_index = text_response.find('{')
-                end_index = text_response.rfind('}')
-                if start_index != -1 and end_index != -1 and start_index < end_index:
-                    json_str = text_response[start_index:end_index+1]
-                else:
-                    json_str = text_response
-
-            montage_json = json.loads(json_str)
-
             # Validate the generated JSON
             validate_composition_json(montage_json)
 
@@ -453,131 +680,255 @@ Your task is to assemble clips that conform to the schema into a coherent and en
             montage_json.setdefault("size", resolution)
             montage_json.setdefault("fps", 24)
 
-            return montage_json
+            return montage_json, True
 
         except SchemaValidationError as e:
             logging.warning(f"Attempt {attempt + 1} failed validation: {e}")
             last_exception = e
-            validation_error_feedback = (
-                "The previous JSON you generated failed schema validation. "
-                f"Please correct it. The error was: {e}"
-            )
+            contents = contents + [
+                types.Content(role="model", parts=[types.Part.from_text(text=response_text)]),
+                types.Content(role="user", parts=[types.Part.from_text(text=(
+                    "The previous JSON you generated failed schema validation. "
+                    f"Please correct it and return only the corrected JSON. The error was: {e}"
+                ))]),
+            ]
+        except ValueError as e:
+            # Malformed JSON output; asking again usually fixes it
+            logging.warning(f"Attempt {attempt + 1} to generate montage JSON failed: {e}")
+            last_exception = e
         except Exception as e:
+            # Transient API errors have already been retried by the client
             logging.warning(f"Attempt {attempt + 1} to generate montage JSON failed: {e}")
             last_exception = e
+            break
         
-        if attempt + 1 < max_retries:
-            time.sleep(2 ** attempt)
-        
-    logging.error(f"Failed to generate montage JSON after {max_retries} attempts.")
+    logging.error(f"Failed to generate montage JSON after {attempt + 1} attempts.")
     # Fallback to a simple error clip
+    return _error_montage_json(f"Failed to generate montage: {last_exception}", resolution), False
+
+def _error_montage_json(text: str, resolution: list = None) -> dict:
+    """Returns a montage JSON that just shows text, rendered when generation fails."""
     return {
         "output_path": "montage.mp4",
-        "size": resolution,
+        "size": resolution or [1920, 1080],
         "fps": 24,
         "clip": {
             "type": "text",
-            "text": f"Failed to generate montage: {last_exception}",
+            "text": text,
             "font_size": 50,
             "color": "white",
             "duration": 5,
-            "size": resolution,
+            "size": resolution or [1920, 1080],
         },
     }
 
-def process_assets_and_create_montage(
+def _montage_cache_blob(bucket_name: str, analyses: list, asset_metadata: dict, prompt: str, length: int, resolution: list):
+    """
+    Returns the GCS blob caching the composition rendered for these generation inputs.
+    The key also covers the system prompt, so schema or prompt changes start a fresh cache.
+    """
+    key_data = json.dumps(
+        [_MONTAGE_SYSTEM_PROMPT, analyses, asset_metadata, prompt, length, resolution],
+        sort_keys=True, separators=(',', ':'),
+    )
+    key = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+    return _get_storage_client().bucket(MONTAGE_CACHE_BUCKET or bucket_name).blob(f"{MONTAGE_CACHE_PREFIX}/{key}.json")
+
+def _load_cached_montage(cache_blob) -> dict:
+    """Returns the cached composition, or None on a miss or any cache error."""
+    try:
+        montage_json = json.loads(cache_blob.download_as_bytes())
+        logging.info(f"Using cached composition gs://{cache_blob.bucket.name}/{cache_blob.name}")
+        return montage_json
+    except NotFound:
+        return None
+    except Exception as e:
+        logging.warning(f"Failed to read cached composition: {e}")
+        return None
+
+def _store_cached_montage(cache_uri: str, montage_json_str: str):
+    """Caches a composition that rendered successfully; cache errors are only logged."""
+    try:
+        _upload_to_gcs(*parse_gcs_uri(cache_uri), montage_json_str)
+    except Exception as e:
+        logging.warning(f"Failed to cache composition: {e}")
+
+def _analyze_assets(assets: list, temp_dir: str = None) -> tuple:
+    """
+    Analyzes the content of each distinct asset and extracts its metadata.
+    Returns an (analyses, asset_metadata) tuple.
+    """
+    # Steps 1 and 2 are independent and network-bound, so the metadata is
+    # extracted in the background while the assets are analyzed
+    with ThreadPoolExecutor(max_workers=1) as metadata_executor:
+        # Step 1: Extract asset metadata (duration, resolution, etc.)
+        logging.info("Extracting asset metadata...")
+        metadata_future = metadata_executor.submit(_extract_asset_metadata, assets, temp_dir)
+        
+        # Step 2: Analyze assets for content, all at once since each analysis
+        # is a slow model request
+        analyzable = []
+        seen_uris = set()
+        for asset in assets:
+            asset_type = asset.get("type")
+            gcs_uri = asset.get("gcs_uri")
+            
+            if not asset_type or not gcs_uri:
+                logging.warning(f"Skipping invalid asset: {asset}")
+            elif asset_type not in ("video", "photo"):
+                logging.warning(f"Unsupported asset type '{asset_type}' for {gcs_uri}")
+            elif gcs_uri in seen_uris:
+                logging.info(f"Skipping duplicate asset: {gcs_uri}")
+            else:
+                seen_uris.add(gcs_uri)
+                analyzable.append(asset)
+
+        analyses = []
+        if analyzable:
+            with ThreadPoolExecutor(max_workers=min(ANALYSIS_MAX_WORKERS, len(analyzable))) as executor:
+                # map keeps the analyses in the order of the input assets
+                analyses = list(executor.map(_analyze_asset, analyzable))
+
+        return analyses, metadata_future.result()
+
+def _video_output_uri(output_gcs_uri: str) -> str:
+    """Validates the output GCS URI and makes sure it points to a video file, not JSON."""
+    if not output_gcs_uri.startswith("gs://"):
+        raise ValueError("output_gcs_uri must be a GCS path (gs://...).")
+    
+    # Make sure the output path has a video extension
+    if not any(output_gcs_uri.lower().endswith(ext) for ext in ['.mp4', '.avi', '.mov', '.mkv']):
+        if output_gcs_uri.endswith('.json'):
+            output_gcs_uri = output_gcs_uri.replace('.json', '.mp4')
+        else:
+            output_gcs_uri = f"{output_gcs_uri.rstrip('/')}/montage.mp4"
+    return output_gcs_uri
+
+class RenderFailedError(Exception):
+    """Raised by render_montage once every render attempt, including the LLM fixes, has failed."""
+
+def _composition_uri(output_gcs_uri: str) -> str:
+    """Returns the GCS URI of the JSON composition saved alongside the video."""
+    return output_gcs_uri.rsplit('.', 1)[0] + '.json'
+
+def _upload_composition(output_gcs_uri: str, montage_json_str: str) -> str:
+    """Uploads a serialized composition next to its output video and returns its GCS URI."""
+    json_bucket_name, json_blob_name = parse_gcs_uri(_composition_uri(output_gcs_uri))
+    json_result_path = _upload_to_gcs(json_bucket_name, json_blob_name, montage_json_str)
+    logging.info(f"Saved composition JSON to: {json_result_path}")
+    return json_result_path
+
+def save_render_failure(output_gcs_uri: str, error: str) -> str:
+    """Records why a video could not be rendered next to where it would have been; returns the record's GCS URI."""
+    bucket_name, blob_name = parse_gcs_uri(output_gcs_uri.rsplit('.', 1)[0] + '.error.json')
+    return _upload_to_gcs(bucket_name, blob_name, json.dumps({"output_path": output_gcs_uri, "error": error}))
+
+def save_composition(montage_json: dict) -> str:
+    """Saves a composition alongside its output video and returns its GCS URI."""
+    return _upload_composition(montage_json["output_path"], json.dumps(montage_json, indent=2))
+
+def load_composition(composition_uri: str) -> dict:
+    """Loads a composition saved with save_composition."""
+    bucket_name, blob_name = parse_gcs_uri(composition_uri)
+    return json.loads(_get_storage_client().bucket(bucket_name).blob(blob_name).download_as_bytes())
+
+def create_montage_composition(
    assets: list,
    output_gcs_uri: str,
    prompt: str = None,
    length: int = None,
    resolution: list = None,
-) -> str:
+   temp_dir: str = None,
+) -> dict:
    """
-   Analyzes assets, creates a montage JSON, renders the video, and uploads it to GCS.
-   Returns the GCS path to the rendered video file.
+   Analyzes assets and creates a montage JSON, without rendering it.
+   Returns the composition, with its output_path pointing to the video to render,
+   and the GCS URI of its montage cache entry under the "cache_uri" key. That is
+   None for fallback error compositions, so they are never cached.
+   Temporary files are created under temp_dir when given.
    """
-   try:
-       # Step 1: Extract asset metadata (duration, resolution, etc.)
-       logging.info("Extracting asset metadata...")
-       asset_metadata = _extract_asset_metadata(assets)
-       
-       # Step 2: Analyze assets for content
-       analyses = []
-       for asset in assets:
-           asset_type = asset.get("type")
-           gcs_uri = asset.get("gcs_uri")
+   output_gcs_uri = _video_output_uri(output_gcs_uri)
+   analyses, asset_metadata = _analyze_assets(assets, temp_dir)
+   
+   # Reuse a composition that rendered for the same inputs, or generate new JSON
+   montage_cache_blob = _montage_cache_blob(
+       parse_gcs_uri(output_gcs_uri)[0], analyses, asset_metadata, prompt, length, resolution
+   )
+   montage_json = _load_cached_montage(montage_cache_blob)
+   cacheable = True
+   if montage_json is None:
+       montage_json, cacheable = _generate_montage_json(analyses, asset_metadata, prompt, length, resolution)
+   
+   # Update the JSON with the correct output path
+   montage_json["output_path"] = output_gcs_uri
+   return {
+       "composition": montage_json,
+       "cache_uri": f"gs://{montage_cache_blob.bucket.name}/{montage_cache_blob.name}" if cacheable else None,
+   }
+
+def render_montage(montage_json: dict, resolution: list = None, cache_uri: str = None, temp_dir: str = None) -> str:
+   """
+   Renders a montage JSON to its output_path, asking the LLM to fix the JSON
+   when rendering fails. The final composition is saved alongside the video.
+   Temporary files are created under temp_dir when given.
+   Returns the GCS path to the rendered video file; raises RenderFailedError when
+   every attempt failed.
+   """
+   output_gcs_uri = montage_json["output_path"]
+   max_retries = 3
+   last_error = None
+   
+   for attempt in range(max_retries):
+       try:
+           logging.info(f"Render attempt {attempt + 1}/{max_retries}")
            
-           if not asset_type or not gcs_uri:
-               logging.warning(f"Skipping invalid asset: {asset}")
-               continue
-               
-           if asset_type == "video":
-               analysis = _analyze_video(gcs_uri)
-               analyses.append(analysis)
-           elif asset_type == "photo":
-               analysis = _analyze_photo(gcs_uri)
-               analyses.append(analysis)
-           else:
-               logging.warning(f"Unsupported asset type '{asset_type}' for {gcs_uri}")
-
-       # Step 3: Generate and render with retry loop
-       max_retries = 3
-       last_error = None
-       montage_json = None
-       
-       for attempt in range(max_retries):
-           try:
-               logging.info(f"Generation attempt {attempt + 1}/{max_retries}")
-               
-               if attempt == 0:
-                   # First attempt: Generate new JSON
-                   montage_json = _generate_montage_json(analyses, asset_metadata, prompt, length, resolution)
-               else:
-                   # Subsequent attempts: Fix the existing JSON based on error
-                   montage_json = _fix_montage_json(montage_json, last_error, analyses, asset_metadata, prompt, length, resolution)
-               
-               # Step 4: Ensure output path points to video file, not JSON
-               if not output_gcs_uri.startswith("gs://"):
-                   raise ValueError("output_gcs_uri must be a GCS path (gs://...).")
-               
-               # Make sure the output path has a video extension
-               if not any(output_gcs_uri.lower().endswith(ext) for ext in ['.mp4', '.avi', '.mov', '.mkv']):
-                   if output_gcs_uri.endswith('.json'):
-                       output_gcs_uri = output_gcs_uri.replace('.json', '.mp4')
-                   else:
-                       output_gcs_uri = f"{output_gcs_uri.rstrip('/')}/montage.mp4"
-               
-               # Update the JSON with the correct output path
+           if attempt > 0:
+               # Subsequent attempts: Fix the existing JSON based on error
+               montage_json = _fix_montage_json(montage_json, last_error, [], resolution=resolution)
                montage_json["output_path"] = output_gcs_uri
+           montage_json_str = json.dumps(montage_json, indent=2)
+           
+           # Render the video using declarativemoviepy. Rendering works on the
+           # in-memory dict, so the composition is uploaded in the background
+           with ThreadPoolExecutor(max_workers=1) as executor:
+               upload_future = executor.submit(_upload_composition, output_gcs_uri, montage_json_str)
                
-               # Step 5: Save the JSON composition file alongside the video
-               json_gcs_uri = output_gcs_uri.rsplit('.', 1)[0] + '.json'
-               montage_json_str = json.dumps(montage_json, indent=2)
-               
-               # Parse JSON GCS URI to upload the composition
-               json_parts = json_gcs_uri[5:].split("/", 1)  # Remove 'gs://'
-               json_bucket_name = json_parts[0]
-               json_blob_name = json_parts[1]
-               
-               json_result_path = _upload_to_gcs(json_bucket_name, json_blob_name, montage_json_str)
-               logging.info(f"Saved composition JSON to: {json_result_path}")
-               
-               # Step 6: Render the video using declarativemoviepy
                logging.info("Starting video rendering...")
-               render_from_json(montage_json)
+               render_from_json(montage_json, temp_dir)
                logging.info(f"Video rendering complete. Output: {output_gcs_uri}")
                
-               return output_gcs_uri
-               
-           except Exception as e:
-               last_error = str(e)
-               logging.error(f"Attempt {attempt + 1} failed: {last_error}")
-               if attempt + 1 == max_retries:
-                   logging.error(f"Failed after {max_retries} attempts. Final error: {last_error}")
-                   raise e
-       
-       raise Exception("Max retries exceeded")
-       
+               upload_future.result()
+           
+           if cache_uri:
+               _store_cached_montage(cache_uri, montage_json_str)
+           
+           return output_gcs_uri
+           
+       except Exception as e:
+           last_error = str(e)
+           logging.error(f"Attempt {attempt + 1} failed: {last_error}")
+           if attempt + 1 == max_retries:
+               logging.error(f"Failed after {max_retries} attempts. Final error: {last_error}")
+               raise RenderFailedError(f"Rendering failed after {max_retries} attempts: {last_error}") from e
+   
+   raise Exception("Max retries exceeded")
+
+def process_assets_and_create_montage(
+   assets: list,
+   output_gcs_uri: str,
+   prompt: str = None,
+   length: int = None,
+   resolution: list = None,
+) -> str:
+   """
+   Analyzes assets, creates a montage JSON, renders the video, and uploads it to GCS.
+   Returns the GCS path to the rendered video file.
+   """
+   try:
+       # All temporary files of the request live under one directory, removed once at the end
+       with tempfile.TemporaryDirectory(prefix="montage_") as temp_dir:
+           result = create_montage_composition(assets, output_gcs_uri, prompt, length, resolution, temp_dir)
+           return render_montage(result["composition"], resolution, result["cache_uri"], temp_dir)
    except Exception as e:
        logging.error(f"Failed to process assets and create montage: {e}")
        raise
@@ -1,7 +1,100 @@
+import datetime
+import functools
+import json
 import logging
+import os
+import uuid
 from flask import Request, jsonify
 import lib
 
+try:
+   from google.cloud import tasks_v2
+except ImportError:  # Cloud Tasks is optional; montages are rendered within the request without it
+   tasks_v2 = None
+
+# When set (projects/<project>/locations/<location>/queues/<queue>), rendering is
+# handed off to a Cloud Task and the request returns as soon as the JSON is saved
+RENDER_TASKS_QUEUE = os.getenv("RENDER_TASKS_QUEUE")
+# The URL render tasks are sent to, the /render path of this function; required with
+# RENDER_TASKS_QUEUE, since the URL a request arrived on may not be reachable by Cloud Tasks
+RENDER_TASKS_URL = os.getenv("RENDER_TASKS_URL")
+# Service account used to sign the OIDC token of render tasks, for authenticated functions
+RENDER_TASKS_SERVICE_ACCOUNT = os.getenv("RENDER_TASKS_SERVICE_ACCOUNT")
+# Cloud Tasks allows HTTP targets at most 30 minutes per attempt
+RENDER_TASKS_DISPATCH_DEADLINE_SECONDS = 30 * 60
+
+if RENDER_TASKS_QUEUE and tasks_v2 is None:
+   logging.warning("RENDER_TASKS_QUEUE is set but google-cloud-tasks is not installed; rendering within requests")
+elif RENDER_TASKS_QUEUE and not RENDER_TASKS_URL:
+   logging.error("RENDER_TASKS_QUEUE is set but RENDER_TASKS_URL is not; rendering within requests")
+# Whether rendering is handed off to Cloud Tasks
+RENDER_IN_TASKS = bool(RENDER_TASKS_QUEUE and RENDER_TASKS_URL and tasks_v2 is not None)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tasks_client():
+   """Returns a process-wide Cloud Tasks client."""
+   return tasks_v2.CloudTasksClient()
+
+
+def _enqueue_render_task(job_id: str, body: dict):
+   """Enqueues a Cloud Task, named after the job, that POSTs body to RENDER_TASKS_URL."""
+   http_request = tasks_v2.HttpRequest(
+       http_method=tasks_v2.HttpMethod.POST,
+       url=RENDER_TASKS_URL,
+       headers={"Content-Type": "application/json"},
+       body=json.dumps(body).encode("utf-8"),
+   )
+   if RENDER_TASKS_SERVICE_ACCOUNT:
+       http_request.oidc_token = tasks_v2.OidcToken(service_account_email=RENDER_TASKS_SERVICE_ACCOUNT)
+   task = tasks_v2.Task(
+       name=f"{RENDER_TASKS_QUEUE}/tasks/{job_id}",
+       http_request=http_request,
+       dispatch_deadline=datetime.timedelta(seconds=RENDER_TASKS_DISPATCH_DEADLINE_SECONDS),
+   )
+   _get_tasks_client().create_task(parent=RENDER_TASKS_QUEUE, task=task)
+   logging.info(f"Enqueued render task {job_id} to {RENDER_TASKS_URL}")
+
+
+def _render_montage(request: Request):
+   """
+   HTTP POST JSON, sent by render tasks:
+   {
+     "composition_uri": "gs://my-bucket/outputs/montage.json",
+     "resolution": [1920, 1080],
+     "cache_uri": "gs://my-bucket/montage_cache/<key>.json"
+   }
+   """
+   try:
+       payload = request.get_json(force=True, silent=False)
+       composition_uri = payload["composition_uri"]
+   except Exception as e:
+       logging.error(f"Invalid render request: {e}")
+       return jsonify(error=f"Invalid render request: {e}"), 400
+
+   try:
+       montage_json = lib.load_composition(composition_uri)
+       result_gcs_path = lib.render_montage(
+           montage_json,
+           resolution=payload.get("resolution"),
+           cache_uri=payload.get("cache_uri"),
+       )
+       return jsonify({"output_path": result_gcs_path}), 200
+   except lib.RenderFailedError as e:
+       # render_montage already retried with LLM fixes; a task retry would repeat all of
+       # those renders and Gemini calls, so the task is acknowledged and the failure recorded
+       logging.error(f"Rendering {composition_uri} failed permanently: {str(e)}", exc_info=True)
+       try:
+           error_uri = lib.save_render_failure(montage_json["output_path"], str(e))
+       except Exception as record_error:
+           logging.error(f"Failed to record render failure for {composition_uri}: {record_error}")
+           error_uri = None
+       return jsonify(error=str(e), error_uri=error_uri), 200
+   except Exception as e:
+       # A non-2xx response makes Cloud Tasks retry the task (e.g. the composition couldn't be loaded)
+       logging.error(f"Rendering {composition_uri} failed: {str(e)}", exc_info=True)
+       return jsonify(error=str(e)), 500
+
 
 def generate_montage_json(request: Request):
    """
@@ -16,6 +109,9 @@ def generate_montage_json(request: Request):
      "length": 30,
      "resolution": [1920, 1080]
    }
+
+   With RENDER_TASKS_QUEUE and RENDER_TASKS_URL set, responds 202 with the job_id, composition_uri and
+   output_path once the JSON is saved, and renders the video in a Cloud Task.
    """
    logging.info("Cloud function generate_montage_json called")
    
@@ -23,6 +119,9 @@ def generate_montage_json(request: Request):
        logging.warning(f"Invalid method {request.method}, expected POST")
        return jsonify(error="Use POST with JSON."), 405
 
+   if request.path.rstrip("/").endswith("/render"):
+       return _render_montage(request)
+
    try:
        payload = request.get_json(force=True, silent=False)
        logging.info(f"Received payload with keys: {list(payload.keys()) if payload else 'None'}")
@@ -41,6 +140,30 @@ def generate_montage_json(request: Request):
        logging.error(f"Missing required field: {e}")
        return jsonify(error="Missing required fields: assets, output_gcs_uri"), 400
 
+   if RENDER_IN_TASKS:
+       try:
+           result = lib.create_montage_composition(
+               assets,
+               output_gcs_uri,
+               prompt=prompt,
+               length=length,
+               resolution=resolution,
+           )
+           composition_uri = lib.save_composition(result["composition"])
+           job_id = uuid.uuid4().hex
+           _enqueue_render_task(
+               job_id,
+               {"composition_uri": composition_uri, "resolution": resolution, "cache_uri": result["cache_uri"]},
+           )
+           return jsonify({
+               "job_id": job_id,
+               "composition_uri": composition_uri,
+               "output_path": result["composition"]["output_path"],
+           }), 202
+       except Exception as e:
+           logging.error(f"Processing failed: {str(e)}", exc_info=True)
+           return jsonify(error=str(e)), 500
+
    try:
        result_gcs_path = lib.process_assets_and_create_montage(
            assets,
@@ -1,11 +1,24 @@
+import functools
 import os
+import queue
+import shutil
+import subprocess
 import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple
 import logging
 
 import cv2
 import numpy as np
+import requests
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
+
+try:
+    import PyNvVideoCodec as nvc
+except ImportError:  # PyNvVideoCodec is optional; sampling decodes on the CPU without it
+    nvc = None
 
 # Set up Cloud Run compatible logging
 def setup_logging():
@@ -21,6 +34,34 @@ def setup_logging():
 
 setup_logging()
 
+# Frames buffered between the decode, feature and upload stages of the pipeline
+PIPELINE_PREFETCH = 8
+
+# Concurrent frame uploads; twice as many encoded-or-waiting frames may be held in memory
+UPLOAD_MAX_WORKERS = 16
+
+# Pooled HTTPS connections on the shared storage client, one per upload worker
+STORAGE_HTTP_POOL_SIZE = UPLOAD_MAX_WORKERS
+
+# cv2.flann index algorithm ids (not exported by the Python bindings)
+FLANN_INDEX_KDTREE = 1
+FLANN_INDEX_LSH = 6
+
+# Homography robust estimator: MAGSAC++ (OpenCV >= 4.5) rejects degenerate samples before
+# scoring them; older builds fall back to RHO. Both get an explicit iteration cap.
+HOMOGRAPHY_METHOD = getattr(cv2, "USAC_MAGSAC", cv2.RHO)
+HOMOGRAPHY_MAX_ITERS = 2000
+
+# NVDEC (PyNvVideoCodec) decodes sampled frames on this GPU, this many per batch
+NVDEC_GPU_ID = int(os.getenv("NVDEC_GPU_ID", "0"))
+NVDEC_BATCH_SIZE = 16
+# NVDEC luma is limited range (16-235); this table expands it to the full range
+# (0-255) that cv2 and ffmpeg's gray output use
+NVDEC_LUMA_TO_FULL_RANGE = np.clip((np.arange(256) - 16) * 255 / 219 + 0.5, 0, 255).astype(np.uint8)
+
+# ffmpeg decodes only the sampled frames, straight to grayscale; cv2 is used when it is missing
+FFMPEG_BIN = os.getenv("FFMPEG_BIN", "ffmpeg")
+
 # ----------------------
 # Utility: GCS handling
 # ----------------------
@@ -33,11 +74,24 @@ def parse_gcs_uri(uri: str) -> Tuple[str, str]:
     blob_path = path[0] if path else ""
     return bucket, blob_path
 
+@functools.lru_cache(maxsize=1)
+def _get_storage_client() -> storage.Client:
+    """Process-wide storage client; credentials are resolved and connections pooled once."""
+    client = storage.Client()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=STORAGE_HTTP_POOL_SIZE, pool_maxsize=STORAGE_HTTP_POOL_SIZE, max_retries=3
+    )
+    client._http.mount("https://", adapter)
+    return client
+
+@functools.lru_cache(maxsize=64)
+def _get_bucket(bucket_name: str) -> storage.Bucket:
+    return _get_storage_client().bucket(bucket_name)
+
 def download_gcs_to_temp(uri: str) -> str:
     bucket_name, blob_path = parse_gcs_uri(uri)
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    blob = bucket.blob(blob_path)
+    client = _get_storage_client()
+    blob = _get_bucket(bucket_name).blob(blob_path)
     if not blob.exists(client):
         raise FileNotFoundError(f"GCS object not found: {uri}")
     fd, local_path = tempfile.mkstemp(suffix=os.path.splitext(blob_path)[1])
@@ -48,10 +102,8 @@ def download_gcs_to_temp(uri: str) -> str:
 def upload_local_file_to_gcs(local_path: str, dst_uri: str) -> str:
     if dst_uri.startswith("gs://"):
         bucket_name, blob_path = parse_gcs_uri(dst_uri)
-        client = storage.Client()
-        bucket = client.bucket(bucket_name)
-        blob = bucket.blob(blob_path)
-        blob.upload_from_filename(local_path)
+        blob = _get_bucket(bucket_name).blob(blob_path)
+        blob.upload_from_filename(local_path, retry=DEFAULT_RETRY)
         return f"gs://{bucket_name}/{blob_path}"
     else:
         # Local file handling - create directory if needed and copy file
@@ -60,6 +112,19 @@ def upload_local_file_to_gcs(local_path: str, dst_uri: str) -> str:
         shutil.copy2(local_path, dst_uri)
         return dst_uri
 
+def upload_bytes_to_gcs(data: bytes, dst_uri: str, content_type: str) -> str:
+    if dst_uri.startswith("gs://"):
+        bucket_name, blob_path = parse_gcs_uri(dst_uri)
+        blob = _get_bucket(bucket_name).blob(blob_path)
+        blob.upload_from_string(data, content_type=content_type, retry=DEFAULT_RETRY)
+        return f"gs://{bucket_name}/{blob_path}"
+    else:
+        # Local file handling - create directory if needed and write the bytes
+        os.makedirs(os.path.dirname(dst_uri), exist_ok=True)
+        with open(dst_uri, "wb") as f:
+            f.write(data)
+        return dst_uri
+
 def gcs_join(prefix: str, *parts: str) -> str:
     # prefix: gs://bucket/folder or local path
     if prefix.startswith("gs://"):
@@ -78,35 +143,108 @@ def frame_is_sharp(gray: np.ndarray, thr: float) -> bool:
     # Laplacian variance
     return float(cv2.Laplacian(gray, cv2.CV_64F).var()) > thr
 
-def pair_motion_metrics(img1: np.ndarray, img2: np.ndarray, feat: str = "ORB") -> Dict[str, Any] | None:
-    gray1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
-    gray2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
+def cuda_available() -> bool:
+    """True when this OpenCV build has CUDA ORB and can see a CUDA device."""
+    try:
+        return hasattr(cv2, "cuda_ORB") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except cv2.error:
+        return False
 
+class _CudaORB:
+    """cv2.cuda_ORB behind the CPU detector's detectAndCompute(gray, mask) interface."""
+
+    def __init__(self, **orb_params):
+        self._orb = cv2.cuda_ORB.create(**orb_params)
+        self._gpu_gray = cv2.cuda_GpuMat()  # reused upload buffer
+
+    def detectAndCompute(self, gray: np.ndarray, mask=None):
+        self._gpu_gray.upload(gray)
+        kp_gpu, des_gpu = self._orb.detectAndComputeAsync(self._gpu_gray, None)
+        kps = self._orb.convert(kp_gpu)
+        des = None if des_gpu.empty() else des_gpu.download()
+        return kps, des
+
+def feature_detector(
+    feat: str = "ORB",
+    nfeatures: int = 1000,
+    orb_scale_factor: float = 1.2,
+    orb_nlevels: int = 4,
+    orb_fast_threshold: int = 20,
+    use_cuda: bool = False,
+) -> Tuple[Any, int]:
+    """Return (detector, descriptor norm) for "ORB" or "SIFT"; ORB runs on CUDA if asked and available."""
+    # A dominant pan only needs a few hundred well-spread corners; fewer, stronger
+    # FAST corners over a shallow pyramid keep detection cheap
     if feat.upper() == "SIFT":
-        sift = cv2.SIFT_create(nfeatures=4000)
-        k1, d1 = sift.detectAndCompute(gray1, None)
-        k2, d2 = sift.detectAndCompute(gray2, None)
-        norm = cv2.NORM_L2
-    else:
-        orb = cv2.ORB_create(4000)
-        k1, d1 = orb.detectAndCompute(gray1, None)
-        k2, d2 = orb.detectAndCompute(gray2, None)
-        norm = cv2.NORM_HAMMING
+        return cv2.SIFT_create(nfeatures=nfeatures), cv2.NORM_L2
+    if use_cuda and cuda_available():
+        try:
+            orb = _CudaORB(
+                nfeatures=nfeatures,
+                scaleFactor=orb_scale_factor,
+                nlevels=orb_nlevels,
+                fastThreshold=orb_fast_threshold,
+            )
+            return orb, cv2.NORM_HAMMING
+        except cv2.error as e:
+            logging.warning(f"CUDA ORB unavailable, using CPU ORB: {e}")
+    orb = cv2.ORB_create(
+        nfeatures=nfeatures,
+        scaleFactor=orb_scale_factor,
+        nlevels=orb_nlevels,
+        fastThreshold=orb_fast_threshold,
+    )
+    return orb, cv2.NORM_HAMMING
 
-    if d1 is None or d2 is None or len(k1) == 0 or len(k2) == 0:
+def feature_matcher(norm: int) -> cv2.FlannBasedMatcher:
+    """Approximate kNN matcher: LSH for binary (Hamming) descriptors, KD-tree for float ones."""
+    if norm == cv2.NORM_HAMMING:
+        index_params = dict(algorithm=FLANN_INDEX_LSH, table_number=12, key_size=20, multi_probe_level=2)
+    else:
+        index_params = dict(algorithm=FLANN_INDEX_KDTREE, trees=5)
+    return cv2.FlannBasedMatcher(index_params, dict(checks=50))
+
+def compute_feats(gray: np.ndarray, detector: Any, scale: float = 1.0) -> Tuple[np.ndarray, np.ndarray | None]:
+    """Detect on a grayscale frame resized by `scale`; returns (keypoint xy in full-res pixels, descriptors)."""
+    if scale != 1.0:
+        gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    kps, des = detector.detectAndCompute(gray, None)
+    pts = np.float32([kp.pt for kp in kps]).reshape(-1, 2)
+    if scale != 1.0:
+        pts /= scale
+    return pts, des
+
+def pair_motion_metrics(img1: np.ndarray, img2: np.ndarray, feat: str = "ORB", motion_scale: float = 1.0) -> Dict[str, Any] | None:
+    # Accepts BGR or already-grayscale frames
+    gray1 = img1 if img1.ndim == 2 else cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
+    gray2 = img2 if img2.ndim == 2 else cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
+    detector, norm = feature_detector(feat)
+    k1, d1 = compute_feats(gray1, detector, motion_scale)
+    k2, d2 = compute_feats(gray2, detector, motion_scale)
+    return pair_motion_metrics_feats(k1, d1, k2, d2, feature_matcher(norm))
+
+def pair_motion_metrics_feats(k1: np.ndarray, d1, k2: np.ndarray, d2, matcher: cv2.DescriptorMatcher) -> Dict[str, Any] | None:
+    """Motion metrics between two frames from their precomputed keypoint xy and descriptors."""
+    if d1 is None or d2 is None or len(k1) == 0 or len(k2) < 2:
         return None
 
-    bf = cv2.BFMatcher(norm, crossCheck=False)
-    raw = bf.knnMatch(d1, d2, k=2)
+    raw = matcher.knnMatch(d1, d2, k=2)
 
-    good = [m for m, n in raw if n is not None and m.distance < 0.75 * n.distance]
+    # LSH may return fewer than two neighbours for a query; those can't pass the ratio test
+    good = [p[0] for p in raw if len(p) == 2 and p[0].distance < 0.75 * p[1].distance]
     if len(good) < 30:
         return None
 
-    pts1 = np.float32([k1[m.queryIdx].pt for m in good])
-    pts2 = np.float32([k2[m.trainIdx].pt for m in good])
+    pts1 = k1[[m.queryIdx for m in good]]
+    pts2 = k2[[m.trainIdx for m in good]]
 
-    H, inliers = cv2.findHomography(pts1, pts2, cv2.RANSAC, 3.0)
+    H, inliers = cv2.findHomography(
+        pts1, pts2,
+        method=HOMOGRAPHY_METHOD,
+        ransacReprojThreshold=3.0,
+        maxIters=HOMOGRAPHY_MAX_ITERS,
+        confidence=0.99,
+    )
     if H is None or inliers is None:
         return None
 
@@ -153,15 +291,11 @@ def is_horizontal_pan(m: Dict[str, Any], cfg: Dict[str, Any]) -> Tuple[bool, flo
     return ok, float(score)
 
 def save_frame_to_gcs(img: np.ndarray, dst_uri: str, quality: int = 92) -> str:
-    # encode JPEG -> /tmp -> upload or save locally
-    fd, tmp_path = tempfile.mkstemp(suffix=".jpg")
-    os.close(fd)
-    try:
-        cv2.imencode(".jpg", img, [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)])[1].tofile(tmp_path)
-        return upload_local_file_to_gcs(tmp_path, dst_uri)
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+    # encode JPEG in memory -> upload or save locally
+    ok, buf = cv2.imencode(".jpg", img, [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)])
+    if not ok:
+        raise RuntimeError(f"Failed to encode JPEG for {dst_uri}")
+    return upload_bytes_to_gcs(buf.tobytes(), dst_uri, "image/jpeg")
 
 def validate_panorama_quality(pano: np.ndarray, min_width_height_ratio: float = 1.2, max_black_border_percent: float = 15.0) -> bool:
     """Validate panorama quality based on aspect ratio and black borders."""
@@ -174,8 +308,9 @@ def validate_panorama_quality(pano: np.ndarray, min_width_height_ratio: float =
     # Check for black borders (stitching artifacts)
     gray = cv2.cvtColor(pano, cv2.COLOR_BGR2GRAY) if len(pano.shape) == 3 else pano
     
-    # Count black/very dark pixels (threshold < 10)
-    black_pixels = np.sum(gray < 10)
+    # Count black/very dark pixels (threshold < 10) with OpenCV's vectorized
+    # compare+countNonZero, about twice as fast as np.sum(gray < 10)
+    black_pixels = cv2.countNonZero(cv2.compare(gray, 10, cv2.CMP_LT))
     total_pixels = gray.size
     black_percentage = (black_pixels / total_pixels) * 100
     
@@ -196,6 +331,162 @@ def stitch_group(frames: List[np.ndarray], warper: str = "cylindrical", warper_s
     status, pano = stitcher.stitch(frames)
     return status, pano
 
+# ----------------------
+# Pipeline stages
+# ----------------------
+class _Stage(threading.Thread):
+    """Daemon thread that keeps the target's return value or exception for the caller."""
+
+    def __init__(self, target, *args):
+        super().__init__(daemon=True)
+        self._target_fn = target
+        self._target_args = args
+        self.result = None
+        self.error: BaseException | None = None
+
+    def run(self):
+        try:
+            self.result = self._target_fn(*self._target_args)
+        except BaseException as e:
+            self.error = e
+
+def _start_stage(target, *args) -> _Stage:
+    stage = _Stage(target, *args)
+    stage.start()
+    return stage
+
+def _read_sampled_frames(local_video_path: str, cap: cv2.VideoCapture, sample_every: int, out_q: "queue.Queue", stop: threading.Event, hw_decode: bool = True) -> int:
+    """Push (frame_idx, gray) for every sample_every-th frame, then None. Returns frames sampled."""
+    try:
+        ok, first = cap.read()
+        if not ok:
+            return 0
+        first_gray = cv2.cvtColor(first, cv2.COLOR_BGR2GRAY)
+        out_q.put((0, first_gray))
+        height, width = first.shape[:2]
+        if hw_decode and nvc is not None:
+            count = _read_gray_nvdec(local_video_path, first_gray, sample_every, out_q, stop)
+            if count is not None:
+                return 1 + count
+        if shutil.which(FFMPEG_BIN):
+            return 1 + _read_gray_ffmpeg(local_video_path, width, height, sample_every, out_q, stop)
+        return 1 + _read_gray_cv2(cap, sample_every, out_q, stop)
+    finally:
+        out_q.put(None)
+
+def _read_gray_nvdec(local_video_path: str, first_gray: np.ndarray, sample_every: int, out_q: "queue.Queue", stop: threading.Event) -> int | None:
+    # Returns None, before queueing anything, when NVDEC can't serve this video
+    # so the caller can fall back to CPU decoding.
+    height, width = first_gray.shape
+    try:
+        decoder = nvc.SimpleDecoder(
+            local_video_path,
+            gpu_id=NVDEC_GPU_ID,
+            use_device_memory=False,
+            output_color_type=nvc.OutputColorType.NATIVE,
+        )
+        # Frame 0 is decoded again only to check NVDEC sees it the way cv2 does
+        indices = [0] + list(range(sample_every, len(decoder), sample_every))
+    except Exception as e:
+        logging.warning(f"NVDEC decode unavailable, falling back to CPU: {e}")
+        return None
+
+    count = 0
+    for start in range(0, len(indices), NVDEC_BATCH_SIZE):
+        if stop.is_set():
+            break
+        batch = indices[start:start + NVDEC_BATCH_SIZE]
+        for fidx, frame in zip(batch, decoder.get_batch_frames_by_index(batch)):
+            # NATIVE output is NV12/YUV: the first `height` rows are the luma plane,
+            # i.e. the grayscale frame, needing only a range expansion
+            planes = np.from_dlpack(frame)
+            if planes.shape[0] < height or planes.shape[1] < width:
+                if fidx == 0:
+                    logging.warning(f"NVDEC frame shape {planes.shape} doesn't match {height}x{width}, falling back to CPU")
+                    return None
+                raise RuntimeError(f"NVDEC frame {fidx} has shape {planes.shape}, expected {height}x{width}")
+            gray = cv2.LUT(np.ascontiguousarray(planes[:height, :width]), NVDEC_LUMA_TO_FULL_RANGE)
+            if fidx == 0:
+                # Rotated videos are shown upright by cv2/ffmpeg but not by NVDEC
+                if np.abs(gray.astype(np.int16) - first_gray).mean() > 16:
+                    logging.warning("NVDEC frames don't match the displayed orientation, falling back to CPU")
+                    return None
+                continue
+            out_q.put((fidx, gray))
+            count += 1
+    return count
+
+def _read_gray_ffmpeg(local_video_path: str, width: int, height: int, sample_every: int, out_q: "queue.Queue", stop: threading.Event) -> int:
+    # Frame 0 was already read through cv2. Scaling to its size keeps every raw frame
+    # exactly width*height bytes, whatever rotation handling ffmpeg applies.
+    cmd = [
+        FFMPEG_BIN, "-nostdin", "-v", "error", "-i", local_video_path, "-an",
+        "-vf", f"select=not(mod(n\\,{sample_every}))*gt(n\\,0),scale={width}:{height},format=gray",
+        "-vsync", "0", "-f", "rawvideo", "-",
+    ]
+    frame_bytes = width * height
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    count = 0
+    try:
+        while not stop.is_set():
+            buf = proc.stdout.read(frame_bytes)
+            if len(buf) < frame_bytes:
+                break
+            count += 1
+            out_q.put((count * sample_every, np.frombuffer(buf, dtype=np.uint8).reshape(height, width)))
+    finally:
+        if stop.is_set():
+            proc.kill()
+        proc.stdout.close()
+        stderr = proc.stderr.read().decode(errors="replace")
+        proc.stderr.close()
+        proc.wait()
+    if proc.returncode != 0 and not stop.is_set():
+        raise RuntimeError(f"ffmpeg failed to decode video: {stderr.strip()}")
+    return count
+
+def _read_gray_cv2(cap: cv2.VideoCapture, sample_every: int, out_q: "queue.Queue", stop: threading.Event) -> int:
+    fidx = 1
+    count = 0
+    while not stop.is_set():
+        if fidx % sample_every == 0:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            out_q.put((fidx, cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)))
+            count += 1
+        elif not cap.grab():  # skipped frames are demuxed/decoded but never converted
+            break
+        fidx += 1
+    return count
+
+class _ColorFrames:
+    """Forward-only access to full-color frames by index, converting only the ones asked for."""
+
+    def __init__(self, local_video_path: str):
+        self._cap = cv2.VideoCapture(local_video_path)
+        self._next = 0
+        self._last: Tuple[int, np.ndarray] | None = None
+
+    def get(self, frame_idx: int) -> np.ndarray:
+        if self._last is not None and self._last[0] == frame_idx:
+            return self._last[1]
+        if frame_idx < self._next:
+            raise ValueError(f"Frame {frame_idx} requested after frame {self._next - 1}")
+        while self._next < frame_idx:
+            if not self._cap.grab():
+                raise RuntimeError(f"Video ended before frame {frame_idx}")
+            self._next += 1
+        ok, frame = self._cap.read()
+        if not ok:
+            raise RuntimeError(f"Failed to decode frame {frame_idx}")
+        self._next += 1
+        self._last = (frame_idx, frame)
+        return frame
+
+    def release(self) -> None:
+        self._cap.release()
+
 # ----------------------
 # Core: process video
 # ----------------------
@@ -210,6 +501,14 @@ def detect_pan_groups_from_video(
         "min_group_len": 3,           # at least N frames in a group
         "sharp_thr": 20.0,            # Laplacian variance threshold
         "feature": "ORB",             # ORB or SIFT
+        "hw_decode": True,            # sample with NVDEC when PyNvVideoCodec and a GPU are available
+        "gpu_features": True,         # ORB on CUDA when OpenCV is built with it
+        "motion_scale": 0.5,          # detect features on frames resized by this factor
+        "orb_nfeatures": 1000,        # ORB keypoints per frame
+        "orb_scale_factor": 1.2,
+        "orb_nlevels": 4,
+        "orb_fast_threshold": 20,
+        "sift_nfeatures": 1000,       # SIFT keypoints per frame
         "tau_inliers": 0.30,
         "tau_v": 1.5,
         "tau_u_min": 15.0,
@@ -236,34 +535,63 @@ def detect_pan_groups_from_video(
     height       = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     logging.info(f"Video metadata: total_frames={total_frames}, fps={fps}, width={width}, height={height}")
 
-    sampled = []  # list of (frame_idx, image)
-    fidx = 0
-    ok, frame = cap.read()
-    while ok:
-        if fidx % cfg["sample_every"] == 0:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            is_frame_sharp = frame_is_sharp(gray, cfg["sharp_thr"])
-            if is_frame_sharp:
-                sampled.append((fidx, frame.copy()))
-        ok, frame = cap.read()
-        fidx += 1
-    cap.release()
-    logging.info(f"Frame sampling complete. Total frames processed: {fidx-1}. Found {len(sampled)} sharp frames to analyze.")
+    # Decode on a reader thread so the next frames are ready while features of
+    # the current one are computed; pair metrics are computed as frames arrive.
+    # Frames arrive as grayscale; color is decoded again for exported frames only.
+    read_q: "queue.Queue" = queue.Queue(maxsize=PIPELINE_PREFETCH)
+    stop_reading = threading.Event()
+    reader = _start_stage(_read_sampled_frames, local_video_path, cap, cfg["sample_every"], read_q, stop_reading, bool(cfg["hw_decode"]))
 
-    # Compute motion between consecutive sampled frames
+    sampled = []  # frame_idx of each sharp sampled frame
     pair_metrics = []  # between i and i+1 (sampled list indices)
     pan_pairs_count = 0
-    for i in range(len(sampled) - 1):
-        img1 = sampled[i][1]
-        img2 = sampled[i + 1][1]
-        m = pair_motion_metrics(img1, img2, cfg["feature"])
-        if m is None:
-            pair_metrics.append((False, 0.0, None))
-            continue
-        is_pan, score = is_horizontal_pan(m, cfg)
-        if is_pan:
-            pan_pairs_count += 1
-        pair_metrics.append((is_pan, score, m))
+    # Features are computed once per frame and reused as the next pair's first half;
+    # only the previous frame's features are kept, not its pixels
+    detector, norm = feature_detector(
+        cfg["feature"],
+        int(cfg["sift_nfeatures"] if cfg["feature"].upper() == "SIFT" else cfg["orb_nfeatures"]),
+        float(cfg["orb_scale_factor"]),
+        int(cfg["orb_nlevels"]),
+        int(cfg["orb_fast_threshold"]),
+        bool(cfg["gpu_features"]),
+    )
+    matcher = feature_matcher(norm)
+    prev_feats = None
+    try:
+        while True:
+            item = read_q.get()
+            if item is None:
+                break
+            fidx, gray = item
+            if not frame_is_sharp(gray, cfg["sharp_thr"]):
+                continue
+            sampled.append(fidx)
+            feats = compute_feats(gray, detector, float(cfg["motion_scale"]))
+            if prev_feats is None:
+                prev_feats = feats
+                continue
+            m = pair_motion_metrics_feats(*prev_feats, *feats, matcher)
+            prev_feats = feats
+            if m is None:
+                pair_metrics.append((False, 0.0, None))
+                continue
+            is_pan, score = is_horizontal_pan(m, cfg)
+            if is_pan:
+                pan_pairs_count += 1
+            pair_metrics.append((is_pan, score, m))
+    finally:
+        # On early exit, unblock a reader waiting on a full queue so it can stop
+        stop_reading.set()
+        while reader.is_alive():
+            try:
+                read_q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        reader.join()
+        cap.release()
+    if reader.error is not None:
+        raise reader.error
+    logging.info(f"Frame sampling complete. Sampled {reader.result} frames. Found {len(sampled)} sharp frames to analyze.")
     logging.info(f"Motion analysis complete. Analyzed {len(pair_metrics)} pairs. Found {pan_pairs_count} horizontal pan pairs.")
 
     # Build groups
@@ -321,65 +649,81 @@ def detect_pan_groups_from_video(
             out.append(indices[-1])
         return out
 
+    # Frames are JPEG-encoded and uploaded on a thread pool while the main thread
+    # moves on to the next group and its (optional) stitch. The semaphore bounds
+    # how many decoded frames can be waiting on an upload at once.
+    uploader = ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS)
+    upload_slots = threading.BoundedSemaphore(2 * UPLOAD_MAX_WORKERS)
+
+    def submit_upload(img: np.ndarray, dst_uri: str, quality: int) -> Future:
+        upload_slots.acquire()
+        fut = uploader.submit(save_frame_to_gcs, img, dst_uri, quality)
+        fut.add_done_callback(lambda _: upload_slots.release())
+        return fut
+
+    color_frames = _ColorFrames(local_video_path)
+    pending = []  # (group result, frame upload futures, pano upload future)
+
     # Estimate a reasonable step in sampled units from tau_u bounds
     # Conservative default: keep every frame; caller can toggle export_all_in_group
-    for gid, (direction, sampled_idxs) in enumerate(groups, start=1):
-        frames_info = []
-        # Decide which exact sampled frames to export
-        if cfg["export_all_in_group"]:
-            export_idxs = sampled_idxs
-        else:
-            # heuristic: keep ~every 2nd-3rd sampled frame
-            step = max(1, int(round(2)))
-            export_idxs = pick_subset(sampled_idxs, step)
-
-        # Upload selected frames
-        exported_frame_uris = []
-        exported_frame_indices = []
-        for sidx in export_idxs:
-            frame_idx, img = sampled[sidx]
-            out_uri = gcs_join(
-                gcs_output_prefix,
-                "groups",
-                f"group{gid:03d}",
-                f"frame_{frame_idx:07d}.jpg",
-            )
-            uploaded = save_frame_to_gcs(img, out_uri, cfg["jpeg_quality"])
-            exported_frame_uris.append(uploaded)
-            exported_frame_indices.append(frame_idx)
-
-        pano_uri = None
-        if cfg["stitch"]:
-            # gather actual images again (ensure consistent order)
-            frames_for_stitch = [sampled[s][1] for s in export_idxs]
-            if len(frames_for_stitch) >= 2:
-                status, pano = stitch_group(
-                    frames_for_stitch,
-                    cfg["stitch_warper"],
-                    float(cfg["stitch_warper_scale"]),
+    try:
+        for gid, (direction, sampled_idxs) in enumerate(groups, start=1):
+            # Decide which exact sampled frames to export
+            if cfg["export_all_in_group"]:
+                export_idxs = sampled_idxs
+            else:
+                # heuristic: keep ~every 2nd-3rd sampled frame
+                step = max(1, int(round(2)))
+                export_idxs = pick_subset(sampled_idxs, step)
+
+            # Upload selected frames
+            frame_uploads = []
+            exported_frame_indices = []
+            group_frames = []
+            for sidx in export_idxs:
+                frame_idx = sampled[sidx]
+                img = color_frames.get(frame_idx)
+                group_frames.append(img)
+                out_uri = gcs_join(
+                    gcs_output_prefix,
+                    "groups",
+                    f"group{gid:03d}",
+                    f"frame_{frame_idx:07d}.jpg",
                 )
-                if status == cv2.Stitcher_OK and validate_panorama_quality(pano, cfg.get("min_pano_aspect_ratio", 1.2), cfg.get("max_black_border_percent", 15.0)):
-                    fd, tmp_pano = tempfile.mkstemp(suffix=".jpg")
-                    os.close(fd)
-                    try:
-                        cv2.imwrite(tmp_pano, pano)
+                frame_uploads.append(submit_upload(img, out_uri, cfg["jpeg_quality"]))
+                exported_frame_indices.append(frame_idx)
+
+            pano_upload = None
+            if cfg["stitch"]:
+                frames_for_stitch = group_frames
+                if len(frames_for_stitch) >= 2:
+                    status, pano = stitch_group(
+                        frames_for_stitch,
+                        cfg["stitch_warper"],
+                        float(cfg["stitch_warper_scale"]),
+                    )
+                    if status == cv2.Stitcher_OK and validate_panorama_quality(pano, cfg.get("min_pano_aspect_ratio", 1.2), cfg.get("max_black_border_percent", 15.0)):
                         pano_uri = gcs_join(gcs_output_prefix, "panos", f"group{gid:03d}.jpg")
-                        pano_uri = upload_local_file_to_gcs(tmp_pano, pano_uri)
-                    finally:
-                        if os.path.exists(tmp_pano):
-                            os.remove(tmp_pano)
-                else:
-                    pano_uri = None  # stitching failed or quality validation failed
-
-        results["groups"].append(
-            {
+                        # 95 is the quality cv2.imwrite used for panoramas before
+                        pano_upload = submit_upload(pano, pano_uri, 95)
+                    # else: stitching failed or quality validation failed
+
+            group = {
                 "id": gid,
                 "direction": "right" if direction == 1 else "left",
                 "frame_indices": exported_frame_indices,
-                "frame_uris": exported_frame_uris,
-                **({"pano_uri": pano_uri} if pano_uri else {}),
             }
-        )
+            results["groups"].append(group)
+            pending.append((group, frame_uploads, pano_upload))
+
+        # Collect URIs in submission order; re-raises the first failed upload
+        for group, frame_uploads, pano_upload in pending:
+            group["frame_uris"] = [f.result() for f in frame_uploads]
+            if pano_upload is not None:
+                group["pano_uri"] = pano_upload.result()
+    finally:
+        color_frames.release()
+        uploader.shutdown(wait=True, cancel_futures=True)
 
     logging.info(f"Finished processing. Returning {len(results['groups'])} groups in final result.")
     return results
\ No newline at end of file
@@ -20,6 +20,14 @@ def extract_pans(request: Request):
         "sample_every": 3,
         "sharp_thr": 20.0,
         "feature": "ORB",            // or "SIFT"
+        "hw_decode": true,           // NVDEC sampling if PyNvVideoCodec + GPU
+        "gpu_features": true,        // CUDA ORB if OpenCV has CUDA + GPU
+        "motion_scale": 0.5,         // feature detection resolution (1.0 = full)
+        "orb_nfeatures": 1000,
+        "orb_scale_factor": 1.2,
+        "orb_nlevels": 4,
+        "orb_fast_threshold": 20,
+        "sift_nfeatures": 1000,
         "min_group_len": 3,
         "tau_inliers": 0.30,
         "tau_v": 1.5,
@@ -26,6 +26,8 @@ def main():
         "sample_every": 1,
         "sharp_thr": 25.0,            # Very low sharpness threshold
         "feature": "ORB",
+        "orb_nfeatures": 1000,        # Fewer keypoints = faster detection
+        "orb_fast_threshold": 20,     # Lower to find corners in flat footage
         "min_group_len": 3,           # Back to 3 frames minimum
         "tau_inliers": 0.25,          # Even lower inlier requirement
         "tau_v": 10.0,                 # Stricter vertical movement (reject vertical pans)